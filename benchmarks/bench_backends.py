@@ -0,0 +1,70 @@
+"""比较串行、多线程和多进程三种遍历后端的速度
+
+用法：
+    python -m benchmarks.bench_backends                # 在临时目录生成测试树
+    python -m benchmarks.bench_backends --root D:\\WeChat Files
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from core.procwalk import ProcessWalkPool
+from core.walker import TreeWalk, WalkPool
+
+
+def build_tree(base, dirs, files_per_dir, depth):
+    """生成 dirs 个叶子目录（嵌套 depth 层），每个目录 files_per_dir 个空文件"""
+    for i in range(dirs):
+        parts = [f"d{(i // (10 ** level)) % 10}" for level in range(depth - 1, 0, -1)]
+        leaf = os.path.join(base, *parts, f"leaf{i}")
+        os.makedirs(leaf, exist_ok=True)
+        for j in range(files_per_dir):
+            open(os.path.join(leaf, f"f{j}.tmp"), 'wb').close()
+
+
+def time_backend(root, pool=None, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        walk = TreeWalk(root, {os.path.normcase(root): ('root',)})
+        started = time.perf_counter()
+        result = walk.run() if pool is None else pool.submit(walk).result()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result['root']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--root', help='扫描已有目录而不是生成测试树')
+    parser.add_argument('--dirs', type=int, default=400)
+    parser.add_argument('--files', type=int, default=250, help='每个目录的文件数')
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    base = args.root
+    if base is None:
+        base = tempfile.mkdtemp(prefix='walk-bench-')
+        build_tree(base, args.dirs, args.files, args.depth)
+    try:
+        rows = [('serial', None)]
+        with WalkPool(args.workers) as threads, ProcessWalkPool(args.workers) as processes:
+            rows += [(f'thread x{args.workers}', threads), (f'process x{args.workers}', processes)]
+            baseline = None
+            for name, pool in rows:
+                elapsed, stats = time_backend(base, pool, args.repeat)
+                baseline = baseline or elapsed
+                rate = stats.files / elapsed if elapsed else 0
+                print(f"{name:<14} {elapsed:8.3f}s  {rate:12,.0f} files/s  "
+                      f"x{baseline / elapsed:5.2f}  ({stats.files} files, {stats.dirs} dirs)")
+    finally:
+        if args.root is None:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""在合成目录树上测量扫描和清理的速度、系统调用数和峰值内存
+
+用法：
+    python -m benchmarks.bench_suite                         # 所有目录树，scale=0.05
+    python -m benchmarks.bench_suite --scale 1 --fixture tiny
+    python -m benchmarks.bench_suite --output new.json --compare old.json
+
+每次测量都在单独的子进程中进行，峰值内存只包含该次扫描或清理本身，
+不包含生成目录树的开销。清理会破坏目录树，因此每次清理前都重新生成。
+系统调用数在有 strace 时额外跑一次 strace -f -c 统计（会拖慢该次运行，不计入耗时）；
+否则记录 Python 层调用的 os 函数次数（os_calls），DirEntry 内部的 stat 不在其中。
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import FIXTURES, build_fixture
+
+
+OPERATIONS = ('scan', 'clean')
+
+# 统计调用次数的 os 函数
+COUNTED_CALLS = ('scandir', 'stat', 'lstat', 'open', 'close', 'unlink', 'remove', 'rmdir',
+                 'rename', 'replace')
+
+
+def count_os_calls():
+    """替换 os 模块中的函数以统计调用次数，返回计数字典"""
+    counts = dict.fromkeys(COUNTED_CALLS, 0)
+
+    def wrap(name, func):
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+        return counted
+
+    for name in COUNTED_CALLS:
+        setattr(os, name, wrap(name, getattr(os, name)))
+    return counts
+
+
+def peak_rss():
+    """返回当前进程的峰值常驻内存（字节）"""
+    try:
+        import resource
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_worker(operation, path, workers):
+    """子进程入口：执行一次操作，把测量结果以 JSON 输出到标准输出"""
+    from core.cleaner import DeletePool, clean_folder
+    from core.walker import WalkPool, scan_folder, scan_tree
+
+    counts = count_os_calls()
+    started = time.perf_counter()
+    result = {}
+    if operation == 'scan':
+        if workers > 1:
+            with WalkPool(workers) as pool:
+                stats = scan_tree(path, {os.path.normcase(path): ('',)}, pool=pool)['']
+        else:
+            stats = scan_folder(path)
+        result.update(files=stats.files, size=stats.size)
+    else:
+        if workers > 1:
+            with DeletePool(workers) as pool:
+                cleaned = pool.submit(path).result()
+        else:
+            cleaned = clean_folder(path)
+        result.update(files=cleaned.files, size=cleaned.freed, failed=cleaned.failed)
+    result['elapsed'] = time.perf_counter() - started
+    result['peak_rss'] = peak_rss()
+    result['os_calls'] = sum(counts.values())
+    print(json.dumps(result))
+
+
+def worker_command(operation, path, workers):
+    return [sys.executable, '-m', 'benchmarks.bench_suite', '--worker', operation, path,
+            '--workers', str(workers)]
+
+
+def project_env():
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+    return env
+
+
+def measure(operation, path, workers):
+    output = subprocess.run(worker_command(operation, path, workers), env=project_env(),
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def count_syscalls(operation, path, workers):
+    """用 strace 统计一次操作的系统调用总数，没有 strace 时返回 None"""
+    strace = shutil.which('strace')
+    if strace is None:
+        return None
+    with tempfile.NamedTemporaryFile('r', suffix='.strace') as report:
+        subprocess.run([strace, '-f', '-c', '-o', report.name]
+                       + worker_command(operation, path, workers),
+                       env=project_env(), check=True, capture_output=True)
+        for line in report:
+            # 汇总行形如 "100.00    0.012345    1    123456    789 total"，第 4 列为调用次数
+            fields = line.split()
+            if fields and fields[-1] == 'total':
+                return int(fields[3])
+    return None
+
+
+def run_case(name, operation, base, args):
+    """生成目录树并测量 args.repeat 次，取耗时最短的一次"""
+    path = os.path.join(base, name)
+    info = None
+    best = None
+    for _ in range(args.repeat):
+        if info is None or operation == 'clean':
+            shutil.rmtree(path, ignore_errors=True)
+            info = build_fixture(name, path, args.scale, args.seed)
+        sample = measure(operation, path, args.workers)
+        if best is None or sample['elapsed'] < best['elapsed']:
+            best = sample
+    syscalls = None
+    if args.syscalls:
+        if operation == 'clean':
+            shutil.rmtree(path, ignore_errors=True)
+            build_fixture(name, path, args.scale, args.seed)
+        syscalls = count_syscalls(operation, path, args.workers)
+    shutil.rmtree(path, ignore_errors=True)
+
+    elapsed = best['elapsed']
+    return {
+        'fixture': info.to_dict(),
+        'operation': operation,
+        'workers': args.workers,
+        'elapsed': round(elapsed, 6),
+        'files_per_sec': round(info.files / elapsed) if elapsed else None,
+        'peak_rss': best['peak_rss'],
+        'os_calls': best['os_calls'],
+        'syscalls': syscalls,
+        # 扫描或删除的文件数应与生成的目录树一致（硬链接按每个链接计数）
+        'files_seen': best.get('files'),
+    }
+
+
+def compare(old_path, cases):
+    with open(old_path, encoding='utf-8') as f:
+        old = {(case['fixture']['name'], case['operation'], case.get('workers', 1)): case
+               for case in json.load(f)['cases']}
+    print(f"\n与 {old_path} 比较（files/s，>1 表示变快）：")
+    for case in cases:
+        before = old.get((case['fixture']['name'], case['operation'], case['workers']))
+        if before and before['files_per_sec'] and case['files_per_sec']:
+            ratio = case['files_per_sec'] / before['files_per_sec']
+            print(f"  {case['fixture']['name']:<10} {case['operation']:<6} x{ratio:5.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fixture', action='append', choices=FIXTURES,
+                        help='只运行指定的目录树，可重复指定')
+    parser.add_argument('--operation', action='append', choices=OPERATIONS)
+    parser.add_argument('--scale', type=float, default=0.05, help='目录树规模，1 为完整规模')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=1, help='扫描 / 删除线程数，1 为串行遍历和 clean_folder 的串行删除')
+    parser.add_argument('--syscalls', action='store_true', help='用 strace 统计系统调用数')
+    parser.add_argument('--base', help='生成目录树的位置，默认为临时目录')
+    parser.add_argument('--output', help='结果 JSON 文件，默认为 bench-<时间>.json')
+    parser.add_argument('--compare', help='与之前的结果 JSON 比较')
+    parser.add_argument('--worker', nargs=2, metavar=('OPERATION', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker[0], args.worker[1], args.workers)
+        return
+
+    base = args.base or tempfile.mkdtemp(prefix='bench-suite-')
+    cases = []
+    try:
+        for name in args.fixture or FIXTURES:
+            for operation in args.operation or OPERATIONS:
+                case = run_case(name, operation, base, args)
+                cases.append(case)
+                syscalls = case['syscalls'] if case['syscalls'] is not None else '-'
+                print(f"{name:<10} {operation:<6} {case['elapsed']:9.3f}s "
+                      f"{case['files_per_sec'] or 0:>12,} files/s  "
+                      f"peak {case['peak_rss'] / 2**20:7.1f} MB  "
+                      f"os calls {case['os_calls']:>9,}  syscalls {syscalls}")
+    finally:
+        if args.base is None:
+            shutil.rmtree(base, ignore_errors=True)
+
+    output = args.output or time.strftime('bench-%Y%m%d-%H%M%S.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'host': platform.node(),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'scale': args.scale,
+            'seed': args.seed,
+            'cases': cases,
+        }, f, ensure_ascii=False, indent=4)
+    print(f"结果已保存到 {output}")
+    if args.compare:
+        compare(args.compare, cases)
+
+
+if __name__ == '__main__':
+    main()
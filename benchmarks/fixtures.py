@@ -0,0 +1,131 @@
+"""生成可复现的合成目录树，供扫描和清理的基准测试使用
+
+同一 (名称, scale, seed) 总是生成相同的目录结构、文件大小和修改时间。
+scale=1 时各树的规模：
+    wide       单个目录下 100,000 个文件
+    deep       10 条深度为 200 的目录链，每层 5 个文件
+    tiny       1,000,000 个 1~64 字节的文件，每个目录 1,000 个
+    sparse     4 个 1 GiB 的稀疏文件（几乎不占磁盘空间）
+    hardlinks  20,000 个文件，每个另有 3 个硬链接分布在其他目录
+"""
+import os
+import random
+import time
+
+
+FIXTURES = ('wide', 'deep', 'tiny', 'sparse', 'hardlinks')
+
+# 修改时间分布在最近两年内，使按年龄统计的各个区间都有数据
+MAX_AGE_SECONDS = 730 * 86400
+
+
+class FixtureInfo:
+    """生成结果：目录树位置以及其中的文件数（按链接计）、目录数和逻辑大小"""
+
+    __slots__ = ('name', 'path', 'files', 'dirs', 'size')
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.files = 0
+        self.dirs = 0
+        self.size = 0
+
+    def to_dict(self):
+        return {'name': self.name, 'files': self.files, 'dirs': self.dirs, 'size': self.size}
+
+
+def _count(scale, full, minimum=1):
+    return max(minimum, int(full * scale))
+
+
+class _Builder:
+    def __init__(self, info, seed):
+        self.info = info
+        self.rng = random.Random(seed)
+        self.now = time.time()
+
+    def mkdir(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.info.dirs += 1
+        return path
+
+    def file(self, path, size):
+        with open(path, 'wb') as f:
+            if size:
+                f.write(b'\0' * size)
+        mtime = self.now - self.rng.uniform(0, MAX_AGE_SECONDS)
+        os.utime(path, (mtime, mtime))
+        self.info.files += 1
+        self.info.size += size
+
+    def tiny_size(self):
+        return self.rng.randint(1, 64)
+
+
+def build_wide(builder, base, scale):
+    for i in range(_count(scale, 100000, 100)):
+        builder.file(os.path.join(base, f"f{i:06d}.tmp"), builder.tiny_size() * 16)
+
+
+def build_deep(builder, base, scale):
+    depth = _count(scale, 200, 20)
+    if os.name == 'nt':
+        # 不依赖长路径支持，路径长度保持在 MAX_PATH 以内
+        depth = min(depth, 100)
+    for chain in range(10):
+        current = builder.mkdir(os.path.join(base, f"c{chain}"))
+        for level in range(depth):
+            for i in range(5):
+                builder.file(os.path.join(current, f"f{i}"), builder.tiny_size())
+            current = builder.mkdir(os.path.join(current, 'd'))
+
+
+def build_tiny(builder, base, scale):
+    total = _count(scale, 1000000, 1000)
+    per_dir = 1000
+    for start in range(0, total, per_dir):
+        group = builder.mkdir(os.path.join(base, f"g{start // per_dir:04d}"))
+        for i in range(min(per_dir, total - start)):
+            builder.file(os.path.join(group, f"t{i:04d}"), builder.tiny_size())
+
+
+def build_sparse(builder, base, scale):
+    size = _count(scale, 1 << 30, 1 << 20)
+    for i in range(4):
+        path = os.path.join(base, f"sparse{i}.img")
+        with open(path, 'wb') as f:
+            f.truncate(size)
+        builder.info.files += 1
+        builder.info.size += size
+
+
+def build_hardlinks(builder, base, scale):
+    count = _count(scale, 20000, 100)
+    originals = builder.mkdir(os.path.join(base, 'originals'))
+    link_dirs = [builder.mkdir(os.path.join(base, f"links{i}")) for i in range(3)]
+    for i in range(count):
+        size = builder.tiny_size() * 64
+        path = os.path.join(originals, f"f{i:05d}")
+        builder.file(path, size)
+        for link_dir in link_dirs:
+            os.link(path, os.path.join(link_dir, f"f{i:05d}"))
+            builder.info.files += 1
+            builder.info.size += size
+
+
+BUILDERS = {
+    'wide': build_wide,
+    'deep': build_deep,
+    'tiny': build_tiny,
+    'sparse': build_sparse,
+    'hardlinks': build_hardlinks,
+}
+
+
+def build_fixture(name, base, scale=1.0, seed=0):
+    """在 base 下生成名为 name 的目录树，返回 FixtureInfo；base 必须不存在或为空"""
+    info = FixtureInfo(name, base)
+    os.makedirs(base, exist_ok=True)
+    BUILDERS[name](_Builder(info, f"{name}:{seed}"), base, scale)
+    return info
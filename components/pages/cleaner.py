@@ -1,159 +1,333 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QProgressBar,
-                            QHBoxLayout, QSpacerItem, QSizePolicy, QScrollArea, QMessageBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+                            QHBoxLayout, QSpacerItem, QSizePolicy, QScrollArea, QMessageBox,
+                            QComboBox)
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 import os
-import shutil
-import tempfile
-from pathlib import Path
-
-from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from core.cleaner import CleanResult, DeletePool, clean_category
+from core.devjunk import category_artifacts, forget_artifacts
+from core.estimate import estimate_plan
+from core.index import ScanIndex
+from core.manifest import DeletionManifest
+from core.planner import ScanPlan
+from core.platforms import current_platform
+from core.procwalk import ProcessWalkPool
+from core.quarantine import (PURGE_DELAY, can_quarantine, lower_thread_priority, pending_batches,
+                             quarantine_category)
+from core.rules import CategoryRegistry
+from core.settings import load_settings
+from core.snapshot import SnapshotWriter, default_snapshot_path
+from core.watcher import FolderWatcher, default_backend
+from core.walker import FolderStats, ScanControl, ScanProgress, WalkPool, format_size, get_folder_size
 
 class ScanThread(QThread):
     progress_updated = pyqtSignal(int, str)
+    category_estimated = pyqtSignal(str, object)
+    category_scanned = pyqtSignal(str, object)
     scan_completed = pyqtSignal(dict)
+    scan_cancelled = pyqtSignal()
     
-    def __init__(self):
+    # 进度刷新间隔（秒），避免遍历大目录时刷屏
+    progress_interval = 0.1
+    # 单个遍历根的时间预算（秒），超出后该类别只报告估算的下限
+    time_budget = 60
+    # 抽样估计的时间预算（秒），用于在完整遍历结束前先显示大致结果
+    estimate_budget = 0.2
+    
+    def __init__(self, registry=None):
         super().__init__()
-        self.system_files_whitelist = [
-            'hiberfil.sys',
-            'pagefile.sys',
-            'swapfile.sys',
-            'bootmgr',
-            'NTUSER.DAT',
-            'ntuser.dat.LOG1',
-            'ntuser.dat.LOG2'
-        ]
-        self.chat_files_whitelist = [
-            'All Users',
-            'Applet',
-            'Avatar',
-            'BackupFiles',
-            'CommonFiles'
-        ]
+        self.control = ScanControl(time_budget=self.time_budget)
+        settings = load_settings()
+        self.backend = settings.get('scan_backend', 'thread')
+        self.save_snapshots = settings.get('save_snapshots', False)
+        self.link_aware = settings.get('detect_hard_links', os.name != 'nt')
+        # 顺带记录待删除清单，清理时不再重新遍历；多进程后端无法共享清单
+        self.manifest = None
+        if settings.get('clean_manifest', False) and self.backend != 'process':
+            self.manifest = DeletionManifest()
+        self.registry = registry or CategoryRegistry.load()
     
     def run(self):
-        results = {}
-        total_steps = 14  # 增加了微信和QQ两个步骤
-        current_step = 0
+        # 合并重复和嵌套的扫描根，每个物理目录只遍历一次
+        self.progress_updated.emit(0, "正在规划扫描...")
+        # 多进程后端无法共享扫描索引，始终完整遍历
+        index = self.open_index() if self.backend != 'process' else None
+        plan = ScanPlan.from_registry(self.registry, index=index, link_aware=self.link_aware)
+        if index is not None:
+            index.retain(plan.roots)
+        # 先用抽样估计给出大致结果，完整遍历的结果随后逐个替换
+        for name, estimate in estimate_plan(plan, time_budget=self.estimate_budget,
+                                             control=self.control).items():
+            self.category_estimated.emit(name, estimate)
+        stats = plan.empty_results()
+        pending = plan.category_roots()
+        progress = ScanProgress()
+        last_percent = 0
+        # 需要时把每个目录的子树大小写入快照，便于比较两次扫描之间的变化
+        snapshot = SnapshotWriter(default_snapshot_path()) if self.save_snapshots else None
         
-        # 使用线程池加速扫描
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # 扫描系统临时文件
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描系统临时文件...")
-            temp_future = executor.submit(self.get_folder_size, tempfile.gettempdir())
-            
-            # 扫描微信聊天记录
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描微信聊天记录...")
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            wechat_future = executor.submit(self.get_folder_size, wechat_path)
-            
-            # 扫描QQ聊天记录
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描QQ聊天记录...")
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            qq_future = executor.submit(self.get_folder_size, qq_path)
-            
-            # 扫描浏览器缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描浏览器缓存...")
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            firefox_cache = os.path.expanduser('~\\AppData\\Local\\Mozilla\\Firefox\\Profiles')
-            browser_future = executor.submit(lambda: (
-                self.get_folder_size(chrome_cache) +
-                self.get_folder_size(edge_cache) +
-                self.get_folder_size(firefox_cache)
-            ))
-            
-            # 扫描Windows更新缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描Windows更新缓存...")
-            windows_update = os.path.expandvars('%SystemRoot%\\SoftwareDistribution\\Download')
-            update_future = executor.submit(self.get_folder_size, windows_update)
-            
-            # 扫描系统日志文件
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描系统日志...")
-            log_files = os.path.expandvars('%SystemRoot%\\Logs')
-            log_future = executor.submit(self.get_folder_size, log_files)
-            
-            # 扫描应用程序缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描应用程序缓存...")
-            app_data = os.path.expanduser('~\\AppData\\Local\\Temp')
-            app_cache_future = executor.submit(self.get_folder_size, app_data)
-            
-            # 扫描Windows错误报告
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描Windows错误报告...")
-            error_reports = os.path.expanduser('~\\AppData\\Local\\Microsoft\\Windows\\WER')
-            error_future = executor.submit(self.get_folder_size, error_reports)
-            
-            # 扫描缩略图缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描缩略图缓存...")
-            thumbs_db = os.path.expanduser('~\\AppData\\Local\\Microsoft\\Windows\\Explorer')
-            thumbs_future = executor.submit(self.get_folder_size, thumbs_db)
-            
-            # 扫描回收站
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描回收站...")
-            recycle_bin = os.path.expanduser('~\\$Recycle.Bin')
-            recycle_future = executor.submit(self.get_folder_size, recycle_bin)
-            
-            # 扫描Windows Prefetch文件
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描预读取文件...")
-            prefetch = os.path.expandvars('%SystemRoot%\\Prefetch')
-            prefetch_future = executor.submit(self.get_folder_size, prefetch)
-            
-            # 扫描Windows字体缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描字体缓存...")
-            font_cache = os.path.expandvars('%SystemRoot%\\ServiceProfiles\\LocalService\\AppData\\Local\\FontCache')
-            font_future = executor.submit(self.get_folder_size, font_cache)
-            
-            # 扫描Windows安装缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描安装缓存...")
-            installer_cache = os.path.expandvars('%SystemRoot%\\Installer')
-            installer_future = executor.submit(self.get_folder_size, installer_cache)
-            
-            # 扫描Windows补丁缓存
-            current_step += 1
-            self.progress_updated.emit(int((current_step/total_steps)*100), "正在扫描系统补丁缓存...")
-            patch_cache = os.path.expandvars('%SystemRoot%\\SoftwareDistribution\\Download')
-            patch_future = executor.submit(self.get_folder_size, patch_cache)
-            
-            # 获取所有结果
-            results['temp_files'] = temp_future.result()
-            results['wechat_files'] = wechat_future.result()
-            results['qq_files'] = qq_future.result()
-            results['browser_cache'] = browser_future.result()
-            results['windows_update'] = update_future.result()
-            results['log_files'] = log_future.result()
-            results['app_cache'] = app_cache_future.result()
-            results['error_reports'] = error_future.result()
-            results['thumbs_cache'] = thumbs_future.result()
-            results['recycle_bin'] = recycle_future.result()
-            results['prefetch'] = prefetch_future.result()
-            results['font_cache'] = font_future.result()
-            results['installer_cache'] = installer_future.result()
-            results['patch_cache'] = patch_future.result()
+        # 使用工作窃取线程池加速扫描，单个巨大目录也能由所有线程分担；
+        # 每个类别的所有遍历根完成后立即发出其结果
+        with self.create_pool(plan) as pool:
+            futures = {pool.submit(plan.walk(root, progress, self.control, snapshot,
+                                             self.manifest)): root
+                       for root in plan.roots}
+            for name in [name for name, roots in pending.items() if not roots]:
+                self.category_scanned.emit(name, plan.settle(name, stats[name]))
+            not_done = set(futures)
+            while not_done and not self.control.is_cancelled():
+                done, not_done = wait(not_done, timeout=self.progress_interval)
+                for future in done:
+                    root = futures[future]
+                    plan.merge_results(stats, future.result())
+                    for name, roots in pending.items():
+                        if root in roots:
+                            roots.discard(root)
+                            if not roots:
+                                self.category_scanned.emit(name, plan.settle(name, stats[name]))
+                # 按已访问的目录数估算进度，只增不减，未完成前不显示 100%
+                last_percent = max(last_percent, min(progress.percent(), 99))
+                dirs, files, size = progress.snapshot()
+                self.progress_updated.emit(last_percent, f"已扫描 {dirs} 个文件夹，{files} 个文件，{format_size(size)}")
+        
+        if index is not None:
+            index.close()
+        
+        if self.control.is_cancelled():
+            if snapshot is not None:
+                snapshot.discard()
+            self.progress_updated.emit(last_percent, "扫描已取消")
+            self.scan_cancelled.emit()
+            return
+        
+        if snapshot is not None:
+            self.progress_updated.emit(99, "正在保存扫描快照...")
+            try:
+                snapshot.close(stats, {'complete': not any(item.estimated for item in stats.values())})
+            except OSError as e:
+                print(f"保存扫描快照时出错：{str(e)}")
+                snapshot.discard()
         
-        self.progress_updated.emit(100, "扫描完成")
+        if self.manifest is not None:
+            # 只有完整遍历的类别可以按清单清理，估算的类别清理时仍重新遍历
+            for name, item in stats.items():
+                if not item.estimated:
+                    self.manifest.mark_complete(name)
+        
+        results = {name: item.size for name, item in stats.items()}
+        status = "扫描完成"
+        # 链接、联接点和挂载点不计入任何类别，提示用户结果不包含它们
+        skipped = progress.skipped
+        if any(skipped.values()):
+            status += (f"，已跳过 {skipped['links']} 个链接、{skipped['mounts']} 个挂载点、"
+                       f"{skipped['cycles']} 个重复目录")
+        self.progress_updated.emit(100, status)
         self.scan_completed.emit(results)
     
+    def create_pool(self, plan):
+        if self.backend == 'process':
+            return ProcessWalkPool(os.cpu_count() or 4)
+        return WalkPool(plan.suggest_workers())
+    
+    def cancel(self):
+        self.control.cancel()
+    
+    @staticmethod
+    def open_index():
+        # 索引不可用（如配置目录只读）时退回完整扫描
+        try:
+            return ScanIndex()
+        except (OSError, sqlite3.Error) as e:
+            print(f"打开扫描索引时出错：{str(e)}")
+            return None
+    
     def get_folder_size(self, folder):
-        total_size = 0
+        return get_folder_size(folder)
+
+class CleanThread(QThread):
+    """在后台依次清理若干类别，进度和取消方式与 ScanThread 相同"""
+    progress_updated = pyqtSignal(int, str)
+    category_cleaned = pyqtSignal(str, object)
+    clean_completed = pyqtSignal(object)
+    clean_cancelled = pyqtSignal(object)
+    
+    progress_interval = 0.1
+    
+    def __init__(self, categories, min_age_days=0, expected=None, manifest=None, registry=None):
+        super().__init__()
+        self.categories = list(categories)
+        # 清理结束后在本线程中找出与清理的类别共享目录的其他类别（related），
+        # 它们的大小也变了，需要重新扫描
+        self.registry = registry
+        self.related = set()
+        self.min_age_days = min_age_days
+        # {类别: 扫描得到的大小}，用于估算进度；没有扫描结果时只显示已释放的大小
+        self.expected = expected or {}
+        # 上次扫描的待删除清单，覆盖的类别直接按清单删除
+        self.manifest = manifest
+        # {类别: CleanResult}，清理结束后用于更新扫描结果
+        self.results = {}
+        # 隔离模式下把类别内容移入隔离区而不是立即删除，见 core.quarantine
+        self.quarantine = load_settings().get('quarantine_clean', False)
+        self.batches = []
+        self.quarantined = set()
+        self.control = ScanControl()
+    
+    def run(self):
+        total = CleanResult()
+        expected = sum(self.expected.get(category.key, 0) for category in self.categories)
+        last_percent = 0
+        # 删除在单独的工作线程中进行，本线程定期读取 CleanResult 的计数发出进度；
+        # 各类别共用一个按设备限制并发的删除线程池
+        with ThreadPoolExecutor(max_workers=1) as executor, DeletePool() as pool:
+            for category in self.categories:
+                if self.control.is_cancelled():
+                    break
+                result = self.results[category.key] = CleanResult()
+                future = executor.submit(self.clean_one, category, result, pool)
+                while True:
+                    done, _ = wait([future], timeout=self.progress_interval)
+                    freed = total.freed + result.freed
+                    if expected:
+                        last_percent = max(last_percent, min(freed * 100 // expected, 99))
+                    self.progress_updated.emit(
+                        last_percent,
+                        f"正在清理{category.label}，已删除 {total.files + result.files} 个文件，"
+                        f"释放 {format_size(freed)}")
+                    self.category_cleaned.emit(category.key, result)
+                    if done:
+                        break
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"清理{category.label}时出错：{str(e)}")
+                    result.failed += 1
+                total.merge(result)
+                self.category_cleaned.emit(category.key, result)
+                if category.resolver == 'dev_artifacts':
+                    # 产物目录已删除，下次扫描重新发现
+                    forget_artifacts()
+        
+        if self.registry is not None and self.results:
+            try:
+                self.related = ScanPlan.from_registry(self.registry).related(self.results)
+            except Exception as e:
+                print(f"查找受影响的类别时出错：{str(e)}")
+        
+        if self.control.is_cancelled():
+            self.progress_updated.emit(last_percent, f"清理已取消，已释放 {format_size(total.freed)}")
+            self.clean_cancelled.emit(total)
+            return
+        status = "清理完成"
+        if total.freed or not self.quarantined:
+            status += f"，释放 {format_size(total.freed)}"
+        if self.quarantined:
+            status += "，已移入隔离区的内容稍后在后台删除"
+        if total.failed:
+            status += f"，{total.failed} 个文件或文件夹未能删除"
+        self.progress_updated.emit(100, status)
+        self.clean_completed.emit(total)
+    
+    def clean_one(self, category, result, pool):
+        rule = category.with_min_age(self.min_age_days) if self.min_age_days else category
+        if not self.quarantine or not can_quarantine(rule):
+            return clean_category(category, self.min_age_days, result, self.control, pool,
+                                  self.manifest)
+        # 只是重命名到同一卷上的隔离目录，瞬间完成；清单对该类别不再有效
+        if self.manifest is not None:
+            self.manifest.discard(category.key)
+        batches, moved = quarantine_category(category, self.control)
+        result.merge(moved)
+        self.batches.extend(batches)
+        self.quarantined.add(category.key)
+        return result
+    
+    def cancel(self):
+        self.control.cancel()
+
+class PurgeThread(QThread):
+    """以低优先级在后台删除隔离区中的批次"""
+    purge_completed = pyqtSignal(object)
+    
+    def __init__(self, batches):
+        super().__init__()
+        self.batches = list(batches)
+        # 已经完整删除的批次，其余的仍留在隔离区
+        self.finished = []
+        self.control = ScanControl()
+    
+    def run(self):
+        lower_thread_priority()
+        total = CleanResult()
+        for batch in self.batches:
+            if self.control.is_cancelled():
+                break
+            try:
+                result = batch.purge(self.control)
+                total.merge(result)
+                if not result.failed and not self.control.is_cancelled():
+                    self.finished.append(batch)
+            except Exception as e:
+                print(f"删除隔离区内容时出错：{str(e)}")
+        self.purge_completed.emit(total)
+    
+    def cancel(self):
+        self.control.cancel()
+
+class WatchThread(QThread):
+    sizes_changed = pyqtSignal(str, object)
+    
+    def __init__(self, registry):
+        super().__init__()
+        self.registry = registry
+        self.backend = default_backend()
+        # 规划扫描根可能需要发现开发产物，在 run() 中进行
+        self.watcher = None
+        self.stopped = threading.Event()
+    
+    @property
+    def available(self):
+        return self.backend is not None
+    
+    # 建立监视的时间预算（秒），超出后其余目录不再监视
+    time_budget = 60
+    
+    def run(self):
         try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
+            self.watcher = FolderWatcher(ScanPlan.from_registry(self.registry), self.backend)
+            if self.stopped.is_set():
+                return
+            # 按刚扫描写入的索引建立每个目录的监视，未变化的目录不再列出内容；
+            # 之后只处理变化的目录，报告相对扫描结果的增量
+            index = ScanThread.open_index()
+            try:
+                self.watcher.subscribe(index, ScanControl(time_budget=self.time_budget))
+            finally:
+                if index is not None:
+                    index.close()
+            self.watcher.run(self.emit_updates)
+        except Exception as e:
+            print(f"监视文件夹变化时出错：{str(e)}")
+        finally:
+            self.backend.close()
+    
+    def emit_updates(self, updates):
+        if self.stopped.is_set():
+            return
+        for name, stats in updates.items():
+            self.sizes_changed.emit(name, stats)
+    
+    def stop(self):
+        self.stopped.set()
+        watcher = self.watcher
+        if watcher is not None:
+            watcher.stop()
+
 
 class CleanerPage(QWidget):
     def __init__(self):
@@ -167,6 +341,16 @@ class CleanerPage(QWidget):
         
         # 存储标签引用的字典
         self.info_labels = {}
+        self.detail_labels = {}
+        self.scanned_categories = set()
+        self.category_stats = {}
+        # 开始实时更新时的扫描结果，见 update_live_size
+        self.watch_base = {}
+        # 已取消、尚未结束的扫描线程
+        self.retired_threads = set()
+        
+        # 垃圾类别定义在 junk_categories.json 中
+        self.registry = CategoryRegistry.load()
         
         # 创建标题
         title = QLabel("垃圾清理")
@@ -196,6 +380,42 @@ class CleanerPage(QWidget):
         scan_button.clicked.connect(self.scan_junk)
         layout.addWidget(scan_button)
         
+        # 创建取消扫描按钮
+        self.cancel_button = QPushButton("取消扫描")
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background: rgba(255, 255, 255, 0.1);
+                border: none;
+                border-radius: 5px;
+                color: white;
+                padding: 10px 20px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background: rgba(255, 255, 255, 0.15);
+            }
+        """)
+        self.cancel_button.clicked.connect(self.cancel_running)
+        self.cancel_button.hide()
+        layout.addWidget(self.cancel_button)
+        
+        # 创建撤销清理按钮，隔离区中还有未删除的内容时显示
+        self.undo_button = QPushButton("撤销清理")
+        self.undo_button.setStyleSheet(self.cancel_button.styleSheet())
+        self.undo_button.clicked.connect(self.undo_clean)
+        self.undo_button.hide()
+        layout.addWidget(self.undo_button)
+        
+        # 隔离区中等待删除的批次（包括上次运行留下的），到期后在后台删除
+        self.pending_batches = pending_batches()
+        self.purge_thread = None
+        # 删除失败后下次重试的时间
+        self.purge_retry_at = 0
+        self.purge_timer = QTimer(self)
+        self.purge_timer.setSingleShot(True)
+        self.purge_timer.timeout.connect(self.start_purge)
+        self.schedule_purge()
+        
         # 创建进度条
         self.progress_bar = QProgressBar()
         self.progress_bar.setStyleSheet("""
@@ -251,36 +471,39 @@ class CleanerPage(QWidget):
         results_layout.setSpacing(8)
         self.results_container.setLayout(results_layout)
         
-        # 创建各类垃圾文件显示区域
-        self.temp_files_label = self.create_info_label("系统临时文件：")
-        self.wechat_files_label = self.create_info_label("微信聊天记录：")
-        self.qq_files_label = self.create_info_label("QQ聊天记录：")
-        self.browser_cache_label = self.create_info_label("浏览器缓存：")
-        self.windows_update_label = self.create_info_label("Windows更新缓存：")
-        self.log_files_label = self.create_info_label("系统日志文件：")
-        self.app_cache_label = self.create_info_label("应用程序缓存：")
-        self.error_reports_label = self.create_info_label("Windows错误报告：")
-        self.thumbs_cache_label = self.create_info_label("缩略图缓存：")
-        self.recycle_bin_label = self.create_info_label("回收站：")
-        self.prefetch_label = self.create_info_label("预读取文件：")
-        self.font_cache_label = self.create_info_label("字体缓存：")
-        self.installer_cache_label = self.create_info_label("安装缓存：")
-        self.patch_cache_label = self.create_info_label("系统补丁缓存：")
+        # 按文件年龄筛选：数据来自扫描时记录的直方图，切换时无需重新扫描
+        age_layout = QHBoxLayout()
+        age_label = QLabel("只统计：")
+        age_label.setStyleSheet("color: white; font-size: 14px;")
+        self.age_combo = QComboBox()
+        self.age_combo.addItem("全部文件", None)
+        for days in (7, 30, 90, 180, 365):
+            self.age_combo.addItem(f"超过 {days} 天未修改的文件（按整天计）", days)
+        self.age_combo.setStyleSheet("""
+            QComboBox {
+                background: rgba(255, 255, 255, 0.1);
+                border: none;
+                border-radius: 5px;
+                color: white;
+                padding: 8px;
+                min-width: 100px;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                image: none;
+            }
+        """)
+        self.age_combo.currentIndexChanged.connect(self.refresh_category_texts)
+        age_layout.addWidget(age_label)
+        age_layout.addWidget(self.age_combo)
+        age_layout.addStretch()
+        results_layout.addLayout(age_layout)
         
-        results_layout.addWidget(self.temp_files_label)
-        results_layout.addWidget(self.wechat_files_label)
-        results_layout.addWidget(self.qq_files_label)
-        results_layout.addWidget(self.browser_cache_label)
-        results_layout.addWidget(self.windows_update_label)
-        results_layout.addWidget(self.log_files_label)
-        results_layout.addWidget(self.app_cache_label)
-        results_layout.addWidget(self.error_reports_label)
-        results_layout.addWidget(self.thumbs_cache_label)
-        results_layout.addWidget(self.recycle_bin_label)
-        results_layout.addWidget(self.prefetch_label)
-        results_layout.addWidget(self.font_cache_label)
-        results_layout.addWidget(self.installer_cache_label)
-        results_layout.addWidget(self.patch_cache_label)
+        # 创建各类垃圾文件显示区域
+        for category in self.registry.enabled():
+            results_layout.addWidget(self.create_info_label(category))
         
         # 设置滚动区域的内容和最大高度
         scroll_area.setWidget(self.results_container)
@@ -320,8 +543,8 @@ class CleanerPage(QWidget):
         # 添加底部弹簧
         layout.addStretch()
     
-    def create_info_label(self, text):
-        label = QLabel(text)
+    def create_info_label(self, category):
+        label = QLabel(f"{category.label}：")
         label.setStyleSheet("""
             color: white;
             font-size: 14px;
@@ -347,122 +570,416 @@ class CleanerPage(QWidget):
         """)
         delete_button.setFixedWidth(60)
         
+        # 展开后显示该类别中最大的文件和文件夹，数据来自扫描过程，无需再次读盘
+        detail_button = QPushButton("详情")
+        detail_button.setCheckable(True)
+        detail_button.setEnabled(False)
+        detail_button.setStyleSheet("""
+            QPushButton {
+                background: rgba(255, 255, 255, 0.1);
+                border: none;
+                border-radius: 5px;
+                color: white;
+                padding: 6px 12px;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background: rgba(255, 255, 255, 0.2);
+            }
+            QPushButton:disabled {
+                color: rgba(255, 255, 255, 0.3);
+            }
+        """)
+        detail_button.setFixedWidth(60)
+        
+        detail_label = QLabel()
+        detail_label.setWordWrap(True)
+        detail_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        detail_label.setStyleSheet("""
+            color: rgba(255, 255, 255, 0.7);
+            font-size: 12px;
+            padding: 4px 16px;
+        """)
+        detail_label.hide()
+        detail_button.toggled.connect(detail_label.setVisible)
+        
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(8)
+        row_layout.addWidget(label, 1)
+        row_layout.addWidget(detail_button)
+        row_layout.addWidget(delete_button)
+        
         container = QWidget()
-        layout = QHBoxLayout(container)
+        layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-        layout.addWidget(label, 1)
-        layout.addWidget(delete_button)
+        layout.setSpacing(0)
+        layout.addWidget(row)
+        layout.addWidget(detail_label)
         
         # 存储标签和按钮的引用
-        self.info_labels[text.split('：')[0]] = label
-        delete_button.clicked.connect(lambda checked, path=self._get_path_for_label(text): self.clean_specific_folder(path))
+        self.info_labels[category.key] = label
+        self.detail_labels[category.key] = (detail_button, detail_label)
+        delete_button.clicked.connect(lambda checked, category=category: self.clean_category(category))
         
         return container
     
     def format_size(self, size):
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.2f} {unit}"
-            size /= 1024
-        return f"{size:.2f} TB"
+        return format_size(size)
     
     def scan_junk(self):
+        # 上一次扫描或清理仍在进行时先停止它，避免两个线程同时读盘
+        self.retire_scan()
+        self.stop_watching()
+        self.cancel_clean()
+        self.progress_bar.show()
+        self.progress_bar.setValue(0)
+        for key, label in self.info_labels.items():
+            label.setText(f"{self.registry.get(key).label}：扫描中...")
+        self.scanned_categories = set()
+        self.category_stats = {}
+        self.manifest = None
+        for detail_button, detail_label in self.detail_labels.values():
+            detail_button.setChecked(False)
+            detail_button.setEnabled(False)
+            detail_label.clear()
+        self.results_container.show()
+        self.start_scan_thread(self.registry)
+    
+    def rescan_categories(self, names):
+        """只重新扫描 names 中的类别，其余类别的结果保持不变"""
         self.progress_bar.show()
         self.progress_bar.setValue(0)
-        self.scan_thread = ScanThread()
+        for name in names:
+            self.scanned_categories.discard(name)
+            if name in self.info_labels:
+                self.info_labels[name].setText(f"{self.registry.get(name).label}：扫描中...")
+        self.start_scan_thread(CategoryRegistry([self.registry.get(name) for name in names]))
+    
+    def start_scan_thread(self, registry):
+        self.scan_thread = ScanThread(registry)
         self.scan_thread.progress_updated.connect(self.update_progress)
+        self.scan_thread.category_estimated.connect(self.update_category_estimate)
+        self.scan_thread.category_scanned.connect(self.update_category_result)
         self.scan_thread.scan_completed.connect(self.update_scan_results)
+        self.scan_thread.scan_cancelled.connect(self.cancel_button.hide)
         self.scan_thread.start()
+        self.cancel_button.setText("取消扫描")
+        self.cancel_button.show()
+    
+    def cancel_scan(self):
+        # 不在界面线程中等待扫描线程结束，它收到取消后会尽快自行退出
+        scan_thread = getattr(self, 'scan_thread', None)
+        if scan_thread is not None and scan_thread.isRunning():
+            scan_thread.cancel()
+        self.cancel_button.hide()
+        self.stop_watching()
+    
+    def retire_scan(self):
+        """取消上一次扫描并断开其信号，使它结束前发出的结果不再影响界面"""
+        scan_thread = getattr(self, 'scan_thread', None)
+        if scan_thread is None or not scan_thread.isRunning():
+            return
+        scan_thread.cancel()
+        for signal in (scan_thread.progress_updated, scan_thread.category_estimated,
+                       scan_thread.category_scanned, scan_thread.scan_completed,
+                       scan_thread.scan_cancelled):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        # 线程结束前必须保留引用
+        self.retired_threads.add(scan_thread)
+        scan_thread.finished.connect(lambda: self.retired_threads.discard(scan_thread))
+    
+    def cancel_clean(self):
+        clean_thread = getattr(self, 'clean_thread', None)
+        if clean_thread is not None and clean_thread.isRunning():
+            clean_thread.cancel()
+            clean_thread.wait()
+        self.cancel_button.hide()
+    
+    def cancel_running(self):
+        clean_thread = getattr(self, 'clean_thread', None)
+        if clean_thread is not None and clean_thread.isRunning():
+            # 已删除的文件无法恢复；取消后由 finish_cleaning 从扫描结果中减去已删除的部分
+            clean_thread.cancel()
+        else:
+            self.cancel_scan()
+    
+    def is_cleaning(self):
+        clean_thread = getattr(self, 'clean_thread', None)
+        return clean_thread is not None and clean_thread.isRunning()
+    
+    def start_watching(self):
+        self.stop_watching()
+        if not load_settings().get('live_update', True):
+            return
+        watch_thread = WatchThread(self.registry)
+        if not watch_thread.available:
+            # 当前平台没有可用的监视后端，保持扫描结果不变
+            return
+        self.watch_thread = watch_thread
+        # 增量叠加在开始监视时的结果上
+        self.watch_base = dict(self.category_stats)
+        self.watch_thread.sizes_changed.connect(self.update_live_size)
+        self.watch_thread.start()
+    
+    def stop_watching(self):
+        watch_thread = getattr(self, 'watch_thread', None)
+        if watch_thread is not None:
+            watch_thread.stop()
+            watch_thread.wait()
+            self.watch_thread = None
     
     def update_progress(self, value, status):
         self.progress_bar.setValue(value)
         self.progress_bar.setFormat(f"%p% - {status}")
     
+    def update_category_estimate(self, name, estimate):
+        # 完整遍历的结果已经到达时不再用估计值覆盖
+        if name not in self.info_labels or name in self.scanned_categories:
+            return
+        label_type = self.registry.get(name).label
+        if estimate.exact:
+            text = f"{label_type}：{self.format_size(estimate.size)}，扫描中..."
+        elif estimate.high is None:
+            text = f"{label_type}：≥ {self.format_size(estimate.low)}（估算中）"
+        else:
+            text = (f"{label_type}：约 {self.format_size(estimate.size)}"
+                    f"（{self.format_size(estimate.low)} ~ {self.format_size(estimate.high)}），扫描中...")
+        self.info_labels[name].setText(text)
+    
+    def update_category_result(self, name, stats):
+        self.scanned_categories.add(name)
+        self.category_stats[name] = stats
+        if name in self.info_labels:
+            self.info_labels[name].setText(self.category_text(name, stats))
+            self.update_category_details(name, stats)
+    
+    def update_live_size(self, name, change):
+        # 监视线程报告相对开始监视时的增量，叠加到当时的扫描结果上；
+        # 硬链接去重、估算标记和最大文件列表保留扫描时的结果
+        base = self.watch_base.get(name)
+        if base is None or name not in self.info_labels:
+            return
+        stats = FolderStats(size=max(0, base.size + change.size),
+                            files=max(0, base.files + change.files),
+                            dirs=max(0, base.dirs + change.dirs),
+                            estimated=base.estimated,
+                            allocated=max(0, base.allocated + change.allocated),
+                            reclaimable=max(0, base.reclaimable + change.reclaimable),
+                            top_files=base.top_files, top_dirs=base.top_dirs)
+        if not (change.size or change.files):
+            # 年龄和大小分布无法增量维护，文件有变化后不再显示
+            stats.age_histogram = base.age_histogram
+            stats.size_histogram = base.size_histogram
+        self.category_stats[name] = stats
+        self.info_labels[name].setText(self.category_text(name, stats))
+        self.update_category_details(name, stats)
+    
+    def refresh_category_texts(self):
+        for name, stats in self.category_stats.items():
+            if name in self.info_labels:
+                self.info_labels[name].setText(self.category_text(name, stats))
+    
+    def min_age_days(self):
+        return self.age_combo.currentData()
+    
+    def category_text(self, name, stats):
+        label_type = self.registry.get(name).label
+        if stats.estimated:
+            # 预算耗尽时只有下限
+            text = f"{label_type}：≥ {self.format_size(stats.size)}（估算）"
+        else:
+            text = f"{label_type}：{self.format_size(stats.size)}"
+        # 只有在类别之外还有链接的硬链接文件才会让可释放空间小于占用空间；
+        # 占用空间与文件大小因按簇分配几乎总是不同，不单独显示
+        if stats.reclaimable != stats.allocated:
+            text += f"，可释放 {self.format_size(stats.reclaimable)}"
+        days = self.min_age_days()
+        if days and stats.age_histogram:
+            files, size, allocated = stats.older_than(days)
+            text += (f"；超过 {days} 天（按整天计）：{files} 个文件，{self.format_size(size)}"
+                     f"，可释放 {self.format_size(allocated)}")
+        return text
+    
+    def update_category_details(self, name, stats):
+        detail_button, detail_label = self.detail_labels[name]
+        lines = []
+        if stats.top_dirs:
+            lines.append("最大的文件夹：")
+            lines.extend(f"    {self.format_size(size)}  {path}" for size, path in stats.top_dirs)
+        if stats.top_files:
+            lines.append("最大的文件：")
+            lines.extend(f"    {self.format_size(size)}  {path}" for size, path in stats.top_files)
+        if stats.age_histogram:
+            ages = "，".join(f"超过 {days} 天 {self.format_size(stats.older_than(days)[1])}"
+                            for days in (7, 30, 90))
+            lines.append(f"按修改时间：{ages}")
+        category = self.registry.get(name)
+        if category is not None and category.resolver == 'dev_artifacts':
+            # 开发产物按最后使用时间排列，最久未用的排在前面；只显示扫描时发现的结果，
+            # 不在界面线程中重新发现
+            artifacts = sorted(category_artifacts(category, cached=True) or (),
+                               key=lambda artifact: artifact.last_used)
+            if artifacts:
+                lines.append("最久未使用的产物：")
+                lines.extend(f"    {time.strftime('%Y-%m-%d', time.localtime(artifact.last_used))}"
+                             f"  {artifact.kind}  {artifact.path}" for artifact in artifacts[:10])
+        detail_label.setText("\n".join(lines))
+        detail_button.setEnabled(bool(lines))
+    
     def update_scan_results(self, results):
-        self.info_labels['系统临时文件'].setText(f"系统临时文件：{self.format_size(results['temp_files'])}")
-        self.info_labels['微信聊天记录'].setText(f"微信聊天记录：{self.format_size(results['wechat_files'])}")
-        self.info_labels['QQ聊天记录'].setText(f"QQ聊天记录：{self.format_size(results['qq_files'])}")
-        self.info_labels['浏览器缓存'].setText(f"浏览器缓存：{self.format_size(results['browser_cache'])}")
-        self.info_labels['Windows更新缓存'].setText(f"Windows更新缓存：{self.format_size(results['windows_update'])}")
-        self.info_labels['系统日志文件'].setText(f"系统日志文件：{self.format_size(results['log_files'])}")
-        self.info_labels['应用程序缓存'].setText(f"应用程序缓存：{self.format_size(results['app_cache'])}")
-        self.info_labels['Windows错误报告'].setText(f"Windows错误报告：{self.format_size(results['error_reports'])}")
-        self.info_labels['缩略图缓存'].setText(f"缩略图缓存：{self.format_size(results['thumbs_cache'])}")
-        self.info_labels['回收站'].setText(f"回收站：{self.format_size(results['recycle_bin'])}")
-        self.info_labels['预读取文件'].setText(f"预读取文件：{self.format_size(results['prefetch'])}")
-        self.info_labels['字体缓存'].setText(f"字体缓存：{self.format_size(results['font_cache'])}")
-        self.info_labels['安装缓存'].setText(f"安装缓存：{self.format_size(results['installer_cache'])}")
-        self.info_labels['系统补丁缓存'].setText(f"系统补丁缓存：{self.format_size(results['patch_cache'])}")
+        self.manifest = self.scan_thread.manifest
+        self.cancel_button.hide()
         self.results_container.show()
         self.clean_button.show()
+        self.start_watching()
     
     def clean_junk(self):
         try:
-            # 请求管理员权限
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            firefox_cache = os.path.expanduser('~\\AppData\\Local\\Mozilla\\Firefox\\Profiles')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            self.clean_folder(firefox_cache)
-            
-            # 清理Windows更新缓存
-            windows_update = os.path.expandvars('%SystemRoot%\\SoftwareDistribution\\Download')
-            self.clean_folder(windows_update)
-            
-            # 清理系统日志
-            log_files = os.path.expandvars('%SystemRoot%\\Logs')
-            self.clean_folder(log_files)
-            
-            # 清理Windows错误报告
-            error_reports = os.path.expanduser('~\\AppData\\Local\\Microsoft\\Windows\\WER')
-            self.clean_folder(error_reports)
-            
-            # 清理缩略图缓存
-            thumbs_db = os.path.expanduser('~\\AppData\\Local\\Microsoft\\Windows\\Explorer')
-            self.clean_folder(thumbs_db)
-            
-            # 清理预读取文件
-            prefetch = os.path.expandvars('%SystemRoot%\\Prefetch')
-            self.clean_folder(prefetch)
-            
-            # 清理字体缓存
-            font_cache = os.path.expandvars('%SystemRoot%\\ServiceProfiles\\LocalService\\AppData\\Local\\FontCache')
-            self.clean_folder(font_cache)
-            
-            # 清理安装缓存
-            installer_cache = os.path.expandvars('%SystemRoot%\\Installer')
-            self.clean_folder(installer_cache)
-            
-            # 清理系统补丁缓存
-            patch_cache = os.path.expandvars('%SystemRoot%\\SoftwareDistribution\\Download')
-            self.clean_folder(patch_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
+            # 一键清理只处理标记了 one_click 的类别
+            self.start_cleaning([category for category in self.registry.enabled()
+                                 if category.one_click])
         except Exception as e:
             print(f"清理时出错：{str(e)}")
     
+    def start_cleaning(self, categories, notify=False):
+        """在后台线程中清理 categories，界面保持可操作；notify 为真时完成后弹出提示"""
+        if self.is_cleaning():
+            return
+        # 清理期间停止扫描和实时更新，避免它们报告正在被删除的文件
+        self.retire_scan()
+        self.stop_watching()
+        self.progress_bar.show()
+        self.progress_bar.setValue(0)
+        self.clean_button.setEnabled(False)
+        expected = {name: stats.size for name, stats in self.category_stats.items()}
+        self.clean_thread = CleanThread(categories, self.min_age_days(), expected,
+                                        getattr(self, 'manifest', None), self.registry)
+        self.clean_thread.progress_updated.connect(self.update_progress)
+        self.clean_thread.category_cleaned.connect(self.update_category_cleaned)
+        self.clean_thread.clean_completed.connect(
+            lambda result: self.finish_cleaning(result, notify))
+        self.clean_thread.clean_cancelled.connect(
+            lambda result: self.finish_cleaning(result, False))
+        self.clean_thread.start()
+        self.cancel_button.setText("取消清理")
+        self.cancel_button.show()
+    
+    def update_category_cleaned(self, name, result):
+        if name in self.info_labels:
+            if result.files and not result.freed:
+                # 移入隔离区时还没有真正释放空间
+                text = f"{self.registry.get(name).label}：已清理 {result.files} 项"
+            else:
+                text = f"{self.registry.get(name).label}：已释放 {self.format_size(result.freed)}"
+            if result.failed:
+                text += f"，{result.failed} 个未能删除"
+            self.info_labels[name].setText(text)
+    
+    def finish_cleaning(self, result, notify):
+        self.cancel_button.hide()
+        self.clean_button.setEnabled(True)
+        if notify:
+            # 显示清理完成提示
+            if self.clean_thread.quarantined:
+                message = "所选垃圾文件已移入隔离区，几分钟后在后台删除，在此之前可以撤销！"
+            else:
+                message = f"所选垃圾文件已清理完成，释放 {self.format_size(result.freed)}！"
+            if result.failed:
+                message += f"\n{result.failed} 个文件或文件夹未能删除（可能正在使用）。"
+            if result.changed:
+                message += f"\n{result.changed} 个文件在扫描后被修改，已保留。"
+            QMessageBox.information(self, "清理完成", message)
+        
+        # 从扫描结果中减去实际释放的大小；与之共享目录的其他类别无法这样推算，只重新扫描它们，
+        # 完成后（update_scan_results）再开始实时更新，使其以新的结果为基准
+        self.subtract_cleaned(self.clean_thread.results, self.clean_thread.quarantined)
+        related = [name for name in self.clean_thread.related if name in self.category_stats]
+        if related:
+            self.rescan_categories(related)
+        elif self.category_stats:
+            self.start_watching()
+        if self.clean_thread.batches:
+            self.pending_batches.extend(self.clean_thread.batches)
+            self.schedule_purge()
+    
+    def schedule_purge(self):
+        """到最早的批次满 PURGE_DELAY 秒时开始删除"""
+        self.undo_button.setVisible(bool(self.pending_batches))
+        if not self.pending_batches or (self.purge_thread is not None
+                                        and self.purge_thread.isRunning()):
+            return
+        earliest = min(batch.created for batch in self.pending_batches)
+        delay = max(0, earliest + PURGE_DELAY - time.time(), self.purge_retry_at - time.time())
+        self.purge_timer.start(int(delay * 1000))
+    
+    def start_purge(self):
+        if self.purge_thread is not None and self.purge_thread.isRunning():
+            return
+        now = time.time()
+        due = [batch for batch in self.pending_batches if now - batch.created >= PURGE_DELAY]
+        if not due or now < self.purge_retry_at:
+            self.schedule_purge()
+            return
+        self.purge_thread = PurgeThread(due)
+        self.purge_thread.purge_completed.connect(self.finish_purge)
+        self.purge_thread.start()
+    
+    def finish_purge(self, result):
+        # 只移除完整删除的批次；被撤销打断或有条目未能删除的批次仍在隔离区中，
+        # 由撤销负责移回，否则稍后重试
+        finished = self.purge_thread.finished
+        self.pending_batches = [batch for batch in self.pending_batches
+                                if batch not in finished]
+        if result.failed:
+            self.update_progress(self.progress_bar.value(),
+                                 f"隔离区中 {result.failed} 个文件未能删除，稍后重试")
+            self.purge_retry_at = time.time() + PURGE_DELAY
+        self.schedule_purge()
+    
+    def undo_clean(self):
+        try:
+            self.purge_timer.stop()
+            if self.purge_thread is not None and self.purge_thread.isRunning():
+                # 已经删除的部分无法恢复，剩余的全部移回
+                self.purge_thread.cancel()
+                self.purge_thread.wait()
+            conflicts = 0
+            for batch in reversed(self.pending_batches):
+                conflicts += batch.restore()[1]
+            self.pending_batches = []
+            self.undo_button.hide()
+            if conflicts:
+                QMessageBox.information(self, "撤销清理",
+                                        f"{conflicts} 个文件在原位置已有新版本，旧版本仍保留在隔离区。")
+            self.scan_junk()
+        except Exception as e:
+            print(f"撤销清理时出错：{str(e)}")
+    
+    def subtract_cleaned(self, results, emptied=()):
+        for name, result in results.items():
+            stats = self.category_stats.get(name)
+            if stats is None or name not in self.info_labels:
+                continue
+            if name in emptied or self.registry.get(name).action is not None:
+                # 移入隔离区和特殊动作（如清空回收站）不报告释放的大小，整个类别已清空
+                updated = FolderStats()
+            else:
+                # 最大文件、年龄分布等明细已不准确，只保留总量
+                updated = FolderStats(size=max(0, stats.size - result.freed),
+                                      files=max(0, stats.files - result.files),
+                                      dirs=max(0, stats.dirs - result.dirs),
+                                      estimated=stats.estimated,
+                                      allocated=max(0, stats.allocated - result.allocated),
+                                      reclaimable=max(0, stats.reclaimable - result.allocated))
+            self.category_stats[name] = updated
+            self.info_labels[name].setText(self.category_text(name, updated))
+            self.update_category_details(name, updated)
+    
     def is_admin(self):
         try:
             return os.getuid() == 0
@@ -479,4563 +996,17 @@ class CleanerPage(QWidget):
         except Exception as e:
             print(f"请求管理员权限时出错：{str(e)}")
     
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
     def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
+        return get_folder_size(folder)
     
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
+    def clean_category(self, category):
         try:
-            if not self.is_admin():
+            # 只有需要提权的平台（Windows）才请求管理员权限，其他平台清理有权限的部分
+            if current_platform().requires_admin and not self.is_admin():
                 self.request_admin_privileges()
                 return
             
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
+            self.start_cleaning([category], notify=True)
         except Exception as e:
             QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
             print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
-    
-    def get_folder_size(self, folder):
-        total_size = 0
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    total_size += path.stat().st_size
-        except:
-            pass
-        return total_size
-    
-    def _get_path_for_label(self, text):
-        label_type = text.split('：')[0]
-        paths = {
-            '系统临时文件': tempfile.gettempdir(),
-            '微信聊天记录': os.path.expanduser('~/Documents/WeChat Files'),
-            'QQ聊天记录': os.path.expanduser('~/Documents/Tencent Files'),
-            '浏览器缓存': [
-                os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
-                os.path.expanduser('~/AppData/Local/Mozilla/Firefox/Profiles')
-            ],
-            'Windows更新缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download'),
-            '系统日志文件': os.path.expandvars('%SystemRoot%/Logs'),
-            '应用程序缓存': os.path.expanduser('~/AppData/Local/Temp'),
-            'Windows错误报告': os.path.expanduser('~/AppData/Local/Microsoft/Windows/WER'),
-            '缩略图缓存': os.path.expanduser('~/AppData/Local/Microsoft/Windows/Explorer'),
-            '回收站': os.path.expanduser('~/$Recycle.Bin'),
-            '预读取文件': os.path.expandvars('%SystemRoot%/Prefetch'),
-            '字体缓存': os.path.expandvars('%SystemRoot%/ServiceProfiles/LocalService/AppData/Local/FontCache'),
-            '安装缓存': os.path.expandvars('%SystemRoot%/Installer'),
-            '系统补丁缓存': os.path.expandvars('%SystemRoot%/SoftwareDistribution/Download')
-        }
-        return paths.get(label_type)
-
-    def clean_specific_folder(self, path):
-        try:
-            if not self.is_admin():
-                self.request_admin_privileges()
-                return
-            
-            if isinstance(path, list):
-                for p in path:
-                    self.clean_folder(p)
-            elif path:
-                if path.endswith('$Recycle.Bin'):
-                    os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-                else:
-                    self.clean_folder(path)
-            
-            # 显示清理完成提示
-            QMessageBox.information(self, "清理完成", "所选垃圾文件已清理完成！")
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            QMessageBox.warning(self, "清理失败", f"清理时出错：{str(e)}")
-            print(f"清理时出错：{str(e)}")
-
-    def clean_junk(self):
-        try:
-            # 清理系统临时文件
-            self.clean_folder(tempfile.gettempdir())
-            
-            # 清理微信聊天记录
-            wechat_path = os.path.expanduser('~/Documents/WeChat Files')
-            self.clean_folder(wechat_path)
-            
-            # 清理QQ聊天记录
-            qq_path = os.path.expanduser('~/Documents/Tencent Files')
-            self.clean_folder(qq_path)
-            
-            # 清理浏览器缓存
-            chrome_cache = os.path.expanduser('~/AppData/Local/Google/Chrome/User Data/Default/Cache')
-            edge_cache = os.path.expanduser('~/AppData/Local/Microsoft/Edge/User Data/Default/Cache')
-            self.clean_folder(chrome_cache)
-            self.clean_folder(edge_cache)
-            
-            # 清空回收站
-            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
-            
-            # 更新显示
-            self.scan_junk()
-        except Exception as e:
-            print(f"清理时出错：{str(e)}")
-    
-    def clean_folder(self, folder):
-        try:
-            for path in Path(folder).rglob('*'):
-                if path.is_file():
-                    try:
-                        path.unlink()
-                    except:
-                        pass
-                elif path.is_dir():
-                    try:
-                        shutil.rmtree(path)
-                    except:
-                        pass
-        except:
-            pass
\ No newline at end of file
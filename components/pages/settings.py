@@ -1,5 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QCheckBox, QComboBox, QHBoxLayout, QPushButton
 from PyQt6.QtCore import Qt
+import os
+
+from core.settings import load_settings, save_settings
 
 class SettingsPage(QWidget):
     def __init__(self):
@@ -79,6 +82,45 @@ class SettingsPage(QWidget):
         theme_layout.addWidget(theme_combo)
         theme_layout.addStretch()
         
+        # 扫描方式设置
+        backend_layout = QHBoxLayout()
+        backend_label = QLabel("扫描方式：")
+        backend_label.setStyleSheet("color: white; font-size: 14px;")
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItem("多线程", 'thread')
+        self.backend_combo.addItem("多进程（适合海量小文件）", 'process')
+        self.backend_combo.setStyleSheet(theme_combo.styleSheet())
+        backend_index = self.backend_combo.findData(load_settings().get('scan_backend'))
+        self.backend_combo.setCurrentIndex(max(backend_index, 0))
+        backend_layout.addWidget(backend_label)
+        backend_layout.addWidget(self.backend_combo)
+        backend_layout.addStretch()
+        
+        # 扫描完成后监视文件夹变化，实时更新各类别大小
+        self.live_update = QCheckBox("扫描后实时更新大小")
+        self.live_update.setStyleSheet(auto_start.styleSheet())
+        self.live_update.setChecked(load_settings().get('live_update', True))
+        
+        # 保存每次扫描的目录大小快照，可用 python -m core.snapshot 比较两次扫描
+        self.save_snapshots = QCheckBox("保存扫描快照")
+        self.save_snapshots.setStyleSheet(auto_start.styleSheet())
+        self.save_snapshots.setChecked(load_settings().get('save_snapshots', False))
+        
+        # 扫描时记录待删除的文件，清理时不再重新遍历；多进程扫描不支持
+        self.clean_manifest = QCheckBox("按扫描结果清理（不重新遍历）")
+        self.clean_manifest.setStyleSheet(auto_start.styleSheet())
+        self.clean_manifest.setChecked(load_settings().get('clean_manifest', False))
+        
+        # 识别硬链接，同一文件的多个链接只计一次；Windows 上每个文件要多 stat 一次，默认关闭
+        self.detect_hard_links = QCheckBox("识别硬链接（Windows 上扫描较慢）")
+        self.detect_hard_links.setStyleSheet(auto_start.styleSheet())
+        self.detect_hard_links.setChecked(load_settings().get('detect_hard_links', os.name != 'nt'))
+        
+        # 清理时先移入隔离区，几分钟后再在后台删除，期间可以撤销
+        self.quarantine_clean = QCheckBox("清理时先移入隔离区（可撤销）")
+        self.quarantine_clean.setStyleSheet(auto_start.styleSheet())
+        self.quarantine_clean.setChecked(load_settings().get('quarantine_clean', False))
+        
         # 更新设置
         update_layout = QHBoxLayout()
         update_label = QLabel("检查更新：")
@@ -103,6 +145,12 @@ class SettingsPage(QWidget):
         # 添加设置项到容器
         settings_layout.addWidget(auto_start)
         settings_layout.addLayout(theme_layout)
+        settings_layout.addLayout(backend_layout)
+        settings_layout.addWidget(self.live_update)
+        settings_layout.addWidget(self.save_snapshots)
+        settings_layout.addWidget(self.clean_manifest)
+        settings_layout.addWidget(self.detect_hard_links)
+        settings_layout.addWidget(self.quarantine_clean)
         settings_layout.addLayout(update_layout)
         
         # 添加设置容器到主布局
@@ -124,7 +172,21 @@ class SettingsPage(QWidget):
                 background: #45a049;
             }
         """)
+        save_button.clicked.connect(self.save_settings)
         layout.addWidget(save_button)
         
         # 添加底部弹簧
-        layout.addStretch()
\ No newline at end of file
+        layout.addStretch()
+    
+    def save_settings(self):
+        settings = load_settings()
+        settings['scan_backend'] = self.backend_combo.currentData()
+        settings['live_update'] = self.live_update.isChecked()
+        settings['save_snapshots'] = self.save_snapshots.isChecked()
+        settings['clean_manifest'] = self.clean_manifest.isChecked()
+        settings['quarantine_clean'] = self.quarantine_clean.isChecked()
+        settings['detect_hard_links'] = self.detect_hard_links.isChecked()
+        try:
+            save_settings(settings)
+        except OSError as e:
+            print(f"保存设置时出错：{str(e)}")
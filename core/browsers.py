@@ -0,0 +1,157 @@
+import configparser
+import json
+import os
+import threading
+
+
+# Chromium 系浏览器：(名称, Windows 用户数据目录, Linux 配置目录, Linux 磁盘缓存目录)
+# {local}/{roaming} 为 Windows 的 %LOCALAPPDATA%/%APPDATA%，{config}/{cache} 为 XDG 目录
+CHROMIUM_BROWSERS = (
+    ('chrome', '{local}/Google/Chrome/User Data', '{config}/google-chrome', '{cache}/google-chrome'),
+    ('edge', '{local}/Microsoft/Edge/User Data', '{config}/microsoft-edge', '{cache}/microsoft-edge'),
+    ('brave', '{local}/BraveSoftware/Brave-Browser/User Data', '{config}/BraveSoftware/Brave-Browser',
+     '{cache}/BraveSoftware/Brave-Browser'),
+    ('chromium', '{local}/Chromium/User Data', '{config}/chromium', '{cache}/chromium'),
+)
+
+# Chromium 每个配置文件下真正属于缓存的目录；新版的磁盘缓存位于 Cache/Cache_Data
+CHROMIUM_CACHE_DIRS = ('Cache/Cache_Data', 'Code Cache', 'GPUCache')
+
+# Firefox：(profiles.ini 所在目录, 缓存根目录)。相对路径的配置文件，
+# 其 cache2 位于缓存根目录下的同名目录中，而不是配置文件目录本身
+FIREFOX_WINDOWS = ('{roaming}/Mozilla/Firefox', '{local}/Mozilla/Firefox')
+FIREFOX_LINUX = ('{home}/.mozilla/firefox', '{cache}/mozilla/firefox')
+
+
+def _base_dirs():
+    home = os.path.expanduser('~')
+    return {
+        'home': home,
+        'local': os.environ.get('LOCALAPPDATA') or os.path.join(home, 'AppData', 'Local'),
+        'roaming': os.environ.get('APPDATA') or os.path.join(home, 'AppData', 'Roaming'),
+        'config': os.environ.get('XDG_CONFIG_HOME') or os.path.join(home, '.config'),
+        'cache': os.environ.get('XDG_CACHE_HOME') or os.path.join(home, '.cache'),
+    }
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ProfileResolver:
+    """解析各浏览器的配置文件列表，返回每个配置文件中真正的缓存目录
+
+    Chromium 系读取 Local State 中的 profile.info_cache，Firefox 读取 profiles.ini。
+    解析结果按描述文件（Local State / profiles.ini）的 mtime 和大小缓存，
+    描述文件不变时不再重新解析和探测目录；新建或删除配置文件都会改写描述文件。
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cache = {}
+
+    def cached(self, descriptor, resolve):
+        key = _stat_key(descriptor)
+        if key is None:
+            return []
+        with self.lock:
+            entry = self.cache.get(descriptor)
+            if entry is not None and entry[0] == key:
+                return list(entry[1])
+        paths = resolve()
+        with self.lock:
+            self.cache[descriptor] = (key, tuple(paths))
+        return paths
+
+    def cache_roots(self):
+        """返回本机所有浏览器、所有配置文件的缓存目录（只包含存在的目录）"""
+        bases = _base_dirs()
+        roots = []
+        for _, windows_dir, config_dir, cache_dir in CHROMIUM_BROWSERS:
+            if os.name == 'nt':
+                user_data = windows_dir.format(**bases)
+                cache_base = user_data
+            else:
+                user_data = config_dir.format(**bases)
+                cache_base = cache_dir.format(**bases)
+            user_data, cache_base = os.path.normpath(user_data), os.path.normpath(cache_base)
+            roots.extend(self.cached(os.path.join(user_data, 'Local State'),
+                                     lambda: self.chromium_caches(user_data, cache_base)))
+        profiles_dir, cache_base = FIREFOX_WINDOWS if os.name == 'nt' else FIREFOX_LINUX
+        profiles_dir = os.path.normpath(profiles_dir.format(**bases))
+        cache_base = os.path.normpath(cache_base.format(**bases))
+        roots.extend(self.cached(os.path.join(profiles_dir, 'profiles.ini'),
+                                 lambda: self.firefox_caches(profiles_dir, cache_base)))
+        return roots
+
+    @staticmethod
+    def chromium_profiles(user_data):
+        """返回配置文件目录名列表，Local State 损坏时退回扫描 Default / Profile N"""
+        try:
+            with open(os.path.join(user_data, 'Local State'), encoding='utf-8') as f:
+                names = list(json.load(f)['profile']['info_cache'])
+            if names:
+                return names
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        try:
+            return [name for name in os.listdir(user_data)
+                    if name == 'Default' or name.startswith('Profile ')]
+        except OSError:
+            return []
+
+    def chromium_caches(self, user_data, cache_base):
+        paths = []
+        for profile in self.chromium_profiles(user_data):
+            # Linux 上磁盘缓存在 ~/.cache 下，Code Cache / GPUCache 仍在配置目录下
+            for base in dict.fromkeys((cache_base, user_data)):
+                for name in CHROMIUM_CACHE_DIRS:
+                    path = os.path.join(base, profile, *name.split('/'))
+                    if name.startswith('Cache/') and not os.path.isdir(path):
+                        # 旧版没有 Cache_Data 子目录
+                        path = os.path.dirname(path)
+                    if os.path.isdir(path):
+                        paths.append(path)
+        return list(dict.fromkeys(paths))
+
+    @staticmethod
+    def firefox_profiles(profiles_dir):
+        """返回 [(配置文件目录, 是否相对路径), ...]"""
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(os.path.join(profiles_dir, 'profiles.ini'), encoding='utf-8')
+        except (configparser.Error, UnicodeDecodeError):
+            return []
+        profiles = []
+        for section in parser.sections():
+            if not section.startswith('Profile') or not parser.has_option(section, 'Path'):
+                continue
+            path = parser.get(section, 'Path')
+            relative = parser.get(section, 'IsRelative', fallback='1') == '1'
+            profiles.append((path, relative))
+        return profiles
+
+    def firefox_caches(self, profiles_dir, cache_base):
+        paths = []
+        for path, relative in self.firefox_profiles(profiles_dir):
+            candidates = []
+            if relative:
+                parts = path.replace('\\', '/').split('/')
+                candidates.append(os.path.join(cache_base, *parts, 'cache2'))
+                candidates.append(os.path.join(profiles_dir, *parts, 'cache2'))
+            else:
+                candidates.append(os.path.join(path, 'cache2'))
+            paths.extend(os.path.normpath(candidate) for candidate in candidates
+                         if os.path.isdir(candidate))
+        return list(dict.fromkeys(paths))
+
+
+_resolver = ProfileResolver()
+
+
+def browser_cache_roots(category=None):
+    return _resolver.cache_roots()
@@ -0,0 +1,560 @@
+import os
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from .platforms import current_platform
+from .storage import suggest_delete_workers
+from .walker import FILE_ATTRIBUTE_REPARSE_POINT, normalize_path
+
+
+class CleanResult:
+    """一次清理的结果
+
+    freed 为已删除文件的逻辑大小，allocated 为实际释放的磁盘空间
+    （POSIX 下按 st_blocks 计算；硬链接文件在最后一个链接被删除时才计入）；
+    files / dirs 为删除的文件（含链接）和目录数，failed 为删除失败的条目数，
+    skipped 为没有进入的其他文件系统挂载点数，changed 为按清单清理时
+    因扫描后被修改（大小或 mtime 不同）而保留的文件数。
+    各字段在清理过程中持续累加，其他线程可以随时读取作为进度。
+    """
+
+    __slots__ = ('freed', 'allocated', 'files', 'dirs', 'failed', 'skipped', 'changed')
+
+    def __init__(self, freed=0, allocated=0, files=0, dirs=0, failed=0, skipped=0, changed=0):
+        self.freed = freed
+        self.allocated = allocated
+        self.files = files
+        self.dirs = dirs
+        self.failed = failed
+        self.skipped = skipped
+        self.changed = changed
+
+    def merge(self, other):
+        self.freed += other.freed
+        self.allocated += other.allocated
+        self.files += other.files
+        self.dirs += other.dirs
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.changed += other.changed
+        return self
+
+    def to_dict(self):
+        return {'freed': self.freed, 'allocated': self.allocated, 'files': self.files,
+                'dirs': self.dirs, 'failed': self.failed, 'skipped': self.skipped,
+                'changed': self.changed}
+
+    def __repr__(self):
+        return (f"CleanResult(freed={self.freed}, files={self.files}, dirs={self.dirs}, "
+                f"failed={self.failed})")
+
+
+# POSIX 下用相对于目录句柄的 unlinkat / fstatat，省去每个条目的完整路径解析，
+# 并且不会因目录在删除过程中被替换为链接而删到别处
+_USE_DIR_FD = ({os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+               and os.scandir in os.supports_fd)
+# O_NOFOLLOW 只针对根以下的目录：根目录在打开前已用 realpath 解析
+_DIR_FLAGS = (os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+              | getattr(os, 'O_CLOEXEC', 0))
+
+
+def _list_dir(target, result):
+    # 先把条目全部读出并关闭目录迭代器，深层目录不会同时占用大量句柄
+    try:
+        with os.scandir(target) as it:
+            return iter(list(it))
+    except OSError:
+        result.failed += 1
+        return None
+
+
+def _open_dir(name, dir_fd, result):
+    """打开目录并列出条目，返回 (句柄, 条目)；失败时返回 (None, None)"""
+    try:
+        fd = os.open(name, _DIR_FLAGS, dir_fd=dir_fd)
+    except OSError:
+        result.failed += 1
+        return None, None
+    entries = _list_dir(fd, result)
+    if entries is None:
+        os.close(fd)
+        return None, None
+    return fd, entries
+
+
+def _unlink(path, dir_fd=None):
+    try:
+        os.unlink(path, dir_fd=dir_fd)
+    except PermissionError:
+        if os.name != 'nt':
+            raise
+        # Windows 下只读文件不能直接删除，先去掉只读属性
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
+
+
+# _Deleter.entry 的返回值
+_DONE, _KEPT, _DESCEND = 0, 1, 2
+
+
+class _Deleter:
+    """一次清理中逐条目的删除规则，串行和并行删除共用
+
+    entry() 处理目录中的一个条目：文件和链接直接删除并计入结果，返回 _DONE；
+    未能删除或需要保留（导致其所在目录不能删除）时返回 _KEPT；
+    需要进入的子目录返回 _DESCEND，由调用者负责遍历并在其内容删除后删除它。
+    """
+
+    def __init__(self, rule, control, root_dev):
+        self.rule = rule
+        self.filtered = rule is not None and (rule.filters_files or rule.filters_dirs)
+        self.control = control
+        self.root_dev = root_dev
+        # 硬链接只有最后一个链接被删除时才真正释放空间；并行删除时
+        # 读取链接数和删除必须一起完成，否则两个线程可能都以为自己删的不是最后一个
+        self.links_lock = threading.Lock()
+
+    def cancelled(self):
+        return self.control is not None and self.control.is_cancelled()
+
+    def entry(self, entry, current, dir_fd, result):
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            result.failed += 1
+            return _KEPT
+        # 使用目录句柄时 entry.path 只是名称
+        path = os.path.join(current, entry.name) if dir_fd is not None else entry.path
+        mode = st.st_mode
+        if stat.S_ISDIR(mode):
+            if os.name == 'nt' and st.st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                # 联接点只删除其本身，不进入目标目录
+                if self.filtered:
+                    return _DONE
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    result.failed += 1
+                    return _KEPT
+                result.dirs += 1
+                return _DONE
+            if self.root_dev is not None and st.st_dev != self.root_dev:
+                # 挂载在此处的其他文件系统不动，其所在目录因此也保留
+                result.skipped += 1
+                return _KEPT
+            if self.filtered and self.rule.prunes_dir(entry.name, path):
+                return _DONE
+            return _DESCEND
+        is_link = stat.S_ISLNK(mode)
+        if not is_link and not stat.S_ISREG(mode):
+            # 套接字、管道和设备文件不计入扫描结果，也不删除（/tmp 中常有服务正在使用的套接字）
+            return _KEPT
+        if self.filtered and (is_link or not self.rule.match_file(entry.name, path, st.st_size,
+                                                                  st.st_mtime)):
+            return _DONE
+        if dir_fd is not None:
+            return self.remove(entry.name, dir_fd, st, is_link, result)
+        return self.remove(path, None, st, is_link, result)
+
+    def listed(self, name, directory, dir_fd, size, mtime_ns, result):
+        """删除清单中的一个文件：只有它仍是扫描时的那个文件（大小和 mtime 未变）才删除
+
+        size 为 None 时为清单中的链接，仍是链接才删除其本身。
+        """
+        path = os.path.join(directory, name)
+        target = (name, dir_fd) if dir_fd is not None else (path, None)
+        try:
+            st = os.stat(target[0], dir_fd=target[1], follow_symlinks=False)
+        except FileNotFoundError:
+            # 已经不在了，例如嵌套的类别先清理了它
+            return _DONE
+        except OSError:
+            result.failed += 1
+            return _KEPT
+        if size is None:
+            if stat.S_ISLNK(st.st_mode):
+                return self.remove(target[0], target[1], st, True, result)
+            if (os.name == 'nt' and stat.S_ISDIR(st.st_mode)
+                    and st.st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    result.failed += 1
+                    return _KEPT
+                result.dirs += 1
+                return _DONE
+            result.changed += 1
+            return _KEPT
+        if not stat.S_ISREG(st.st_mode) or st.st_size != size or st.st_mtime_ns != mtime_ns:
+            result.changed += 1
+            return _KEPT
+        # 清单按类别规则生成，这里只需再按清理时选择的年龄筛选
+        if self.filtered and not self.rule.match_file(name, path, st.st_size, st.st_mtime):
+            return _KEPT
+        return self.remove(target[0], target[1], st, False, result)
+
+    def remove(self, name, target, st, is_link, result):
+        """删除文件或链接并计入结果；target 为目录句柄，None 时 name 为完整路径"""
+        try:
+            if is_link or st.st_nlink == 1:
+                _unlink(name, target)
+            else:
+                with self.links_lock:
+                    st = os.stat(name, dir_fd=target, follow_symlinks=False)
+                    _unlink(name, target)
+        except OSError:
+            result.failed += 1
+            return _KEPT
+        result.files += 1
+        if is_link or st.st_nlink > 1:
+            return _DONE
+        result.freed += st.st_size
+        blocks = getattr(st, 'st_blocks', None)
+        result.allocated += blocks * 512 if blocks is not None else st.st_size
+        return _DONE
+
+
+def _root_dev(folder):
+    # 只在 POSIX 上按 st_dev 判断挂载点；Windows 的卷挂载点本身是联接点
+    st = os.stat(folder)
+    return st.st_dev if os.name != 'nt' else None
+
+
+def clean_folder(folder, rule=None, result=None, control=None, lock=None):
+    """清空 folder 的内容并保留 folder 本身，返回 CleanResult
+
+    一次后序 scandir 遍历：文件在列出时立即删除，目录在其所有条目处理完后删除，
+    每个条目只访问一次。rule 带过滤条件时只删除匹配的文件并保留目录结构，
+    exclude_dirs 命中的目录整棵跳过。符号链接和联接点只删除其本身（过滤模式下不动），
+    挂载在此处的其他文件系统不进入。control.is_cancelled() 为真时尽快停止。
+    传入 lock 时 result 与其他线程共享：计数先在本地累计，每删完一个目录在 lock 下合并。
+    """
+    result = result if result is not None else CleanResult()
+    # 与 ScanPlan 一样先解析根目录本身的链接，之后只有根以下的条目不跟随链接
+    folder = os.path.realpath(os.fspath(folder))
+    try:
+        deleter = _Deleter(rule, control, _root_dev(folder))
+    except OSError:
+        return result
+    target = result
+    if lock is not None:
+        result = CleanResult()
+    if _USE_DIR_FD:
+        fd, entries = _open_dir(folder, None, result)
+    else:
+        fd, entries = None, _list_dir(folder, result)
+    if entries is None:
+        # 根目录本身无法列出：失败计数同样要合并到共享的结果中
+        if lock is not None:
+            with lock:
+                target.merge(result)
+        return target
+    # 每一帧为 [目录, 剩余条目, 是否有条目未能删除, 目录句柄]；未删空的目录不再尝试 rmdir
+    stack = [[folder, entries, False, fd]]
+    try:
+        while stack:
+            frame = stack[-1]
+            current, dir_fd = frame[0], frame[3]
+            entry = next(frame[1], None)
+            if entry is None:
+                stack.pop()
+                if dir_fd is not None:
+                    os.close(dir_fd)
+                if lock is not None:
+                    with lock:
+                        target.merge(result)
+                    result = CleanResult()
+                if not stack:
+                    break
+                parent = stack[-1]
+                if frame[2] or deleter.filtered:
+                    parent[2] = parent[2] or frame[2]
+                    continue
+                try:
+                    if parent[3] is not None:
+                        os.rmdir(os.path.basename(current), dir_fd=parent[3])
+                    else:
+                        os.rmdir(current)
+                    result.dirs += 1
+                except OSError:
+                    result.failed += 1
+                    parent[2] = True
+                continue
+            if deleter.cancelled():
+                break
+            action = deleter.entry(entry, current, dir_fd, result)
+            if action == _KEPT:
+                frame[2] = True
+            elif action == _DESCEND:
+                path = os.path.join(current, entry.name)
+                if dir_fd is not None:
+                    child_fd, children = _open_dir(entry.name, dir_fd, result)
+                else:
+                    child_fd, children = None, _list_dir(path, result)
+                if children is None:
+                    frame[2] = True
+                    continue
+                stack.append([path, children, False, child_fd])
+    finally:
+        # 取消时关闭尚未处理完的目录句柄
+        for frame in stack:
+            if frame[3] is not None:
+                os.close(frame[3])
+        if lock is not None:
+            with lock:
+                target.merge(result)
+    return target
+
+
+class _Node:
+    """并行删除中的一个目录；pending 为尚未完成的任务数（自身列出 + 每个子目录）"""
+
+    __slots__ = ('path', 'parent', 'pending', 'incomplete')
+
+    def __init__(self, path, parent):
+        self.path = path
+        self.parent = parent
+        self.pending = 1
+        self.incomplete = False
+
+
+class _DeleteJob:
+    """在设备线程池上并行清空一个根目录，完成时设置 future"""
+
+    def __init__(self, executor, folder, deleter, result, future, lock):
+        self.executor = executor
+        self.deleter = deleter
+        self.result = result
+        self.future = future
+        # 与同一 DeletePool 的其他任务共享，保护 result 和各目录的 pending
+        self.lock = lock
+        self.root = _Node(folder, None)
+
+    def start(self):
+        self.executor.submit(self.run, self.root)
+
+    def run(self, node):
+        # 每个任务在本地累计，结束时合并，避免多个线程同时修改共享的计数
+        local = CleanResult()
+        try:
+            self.clean_dir(node, local)
+        except Exception:
+            local.failed += 1
+            node.incomplete = True
+        finally:
+            with self.lock:
+                self.result.merge(local)
+            self.release(node)
+
+    def clean_dir(self, node, local):
+        deleter = self.deleter
+        if deleter.cancelled():
+            node.incomplete = True
+            return
+        if _USE_DIR_FD:
+            fd, entries = _open_dir(node.path, None, local)
+        else:
+            fd, entries = None, _list_dir(node.path, local)
+        if entries is None:
+            node.incomplete = True
+            return
+        try:
+            for entry in entries:
+                if deleter.cancelled():
+                    node.incomplete = True
+                    break
+                action = deleter.entry(entry, node.path, fd, local)
+                if action == _KEPT:
+                    node.incomplete = True
+                elif action == _DESCEND:
+                    child = _Node(os.path.join(node.path, entry.name), node)
+                    with self.lock:
+                        node.pending += 1
+                    self.executor.submit(self.run, child)
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def release(self, node):
+        # 目录的最后一个任务完成后删除该目录，并沿父目录向上传递
+        while True:
+            with self.lock:
+                node.pending -= 1
+                if node.pending:
+                    return
+            parent = node.parent
+            if parent is None:
+                self.future.set_result(self.result)
+                return
+            if node.incomplete:
+                parent.incomplete = True
+            elif not self.deleter.filtered:
+                try:
+                    os.rmdir(node.path)
+                    with self.lock:
+                        self.result.dirs += 1
+                except OSError:
+                    with self.lock:
+                        self.result.failed += 1
+                    parent.incomplete = True
+            node = parent
+
+
+class DeletePool:
+    """按设备（st_dev）分组的并行删除线程池
+
+    每个设备有自己的线程池，大小由 suggest_delete_workers 按存储类型决定，
+    同一设备上的所有根共享它，不同设备互不影响。并行删除以目录为任务：
+    任务删除目录中的文件并为子目录提交新任务，目录由其最后完成的子任务删除，
+    因此删除顺序始终在其内容之后。只有 1 个线程的设备按 clean_folder 串行删除。
+    workers 不为 None 时所有设备都使用该线程数。
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers
+        self.lock = threading.Lock()
+        # 所有根向各自的 result 合并计数时共用，同一个 result 可以传给多个根
+        self.result_lock = threading.Lock()
+        self.executors = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def executor(self, st_dev, path):
+        with self.lock:
+            entry = self.executors.get(st_dev)
+            if entry is None:
+                workers = self.workers or suggest_delete_workers(path)
+                entry = (ThreadPoolExecutor(max_workers=max(1, workers)), workers)
+                self.executors[st_dev] = entry
+            return entry
+
+    def submit(self, folder, rule=None, result=None, control=None):
+        """清空 folder 的内容，返回结果为 CleanResult 的 Future
+
+        result 在删除过程中持续更新，可以在多个根之间共享并随时读取作为进度。
+        """
+        result = result if result is not None else CleanResult()
+        folder = os.path.realpath(os.fspath(folder))
+        try:
+            st = os.stat(folder)
+        except OSError:
+            future = Future()
+            future.set_result(result)
+            return future
+        executor, workers = self.executor(st.st_dev, folder)
+        if workers <= 1:
+            return executor.submit(clean_folder, folder, rule, result, control, self.result_lock)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        deleter = _Deleter(rule, control, st.st_dev if os.name != 'nt' else None)
+        _DeleteJob(executor, folder, deleter, result, future, self.result_lock).start()
+        return future
+
+    def submit_listed(self, deleter, directory, names, sizes, mtimes, result):
+        """按清单删除 directory 中的文件（见 DeletionManifest），返回 Future
+
+        sizes 和 mtimes 为 None 时 names 为链接。
+        """
+        try:
+            st_dev = os.stat(directory).st_dev
+        except OSError:
+            future = Future()
+            future.set_result(result)
+            return future
+        executor, _ = self.executor(st_dev, directory)
+        return executor.submit(_clean_listed, deleter, directory, names, sizes, mtimes, result,
+                               self.result_lock)
+
+    def shutdown(self):
+        with self.lock:
+            executors = [executor for executor, _ in self.executors.values()]
+            self.executors = {}
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+
+def _clean_listed(deleter, directory, names, sizes, mtimes, result, lock):
+    local = CleanResult()
+    fd = None
+    if _USE_DIR_FD:
+        try:
+            fd = os.open(directory, _DIR_FLAGS)
+        except OSError:
+            # 目录已被删除或替换为链接，其中的文件都不再处理
+            return result
+    if sizes is None:
+        sizes = mtimes = (None,) * len(names)
+    try:
+        for name, size, mtime_ns in zip(names, sizes, mtimes):
+            if deleter.cancelled():
+                break
+            deleter.listed(name, directory, fd, size, mtime_ns, local)
+    finally:
+        if fd is not None:
+            os.close(fd)
+        with lock:
+            result.merge(local)
+    return result
+
+
+def _clean_manifest(category, manifest, rule, result, control, pool):
+    deleter = _Deleter(rule, control, None)
+    futures = []
+    for directory, names, sizes, mtimes in manifest.files(category.key):
+        if deleter.cancelled():
+            break
+        futures.append(pool.submit_listed(deleter, directory, names, sizes, mtimes, result))
+    if not deleter.filtered:
+        # 与逐目录删除一样，带过滤条件时不删除链接
+        for directory, names in manifest.links(category.key):
+            if deleter.cancelled():
+                break
+            futures.append(pool.submit_listed(deleter, directory, names, None, None, result))
+    wait(futures)
+    if deleter.filtered or deleter.cancelled():
+        return result
+    # 文件删除后再由深到浅删除变空的目录；扫描后新增了内容的目录删除失败，保留即可
+    roots = {normalize_path(root) for root in category.resolve_roots()}
+    for directory in manifest.directories(category.key):
+        if os.path.normcase(directory) in roots:
+            continue
+        try:
+            os.rmdir(directory)
+        except OSError:
+            continue
+        with pool.result_lock:
+            result.dirs += 1
+    return result
+
+
+def clean_category(category, min_age_days=0, result=None, control=None, pool=None,
+                   manifest=None):
+    """清理一个类别并返回 CleanResult；min_age_days 不为 0 时只删除超过该天数未修改的文件
+
+    各根目录交给 pool（DeletePool）并行删除，未传入时为本次清理创建一个。
+    manifest（DeletionManifest）包含该类别的完整清单时直接按清单删除，不再遍历目录，
+    扫描后被修改过的文件保留；清单用过后即从中移除该类别。
+    """
+    result = result if result is not None else CleanResult()
+    # 特殊动作（如清空 Windows 回收站）由平台后端执行，当前平台不支持时按普通目录清理
+    if category.action is not None and current_platform().run_action(category):
+        return result
+    rule = category.with_min_age(min_age_days) if min_age_days else category
+    if pool is None:
+        with DeletePool() as pool:
+            return clean_category(category, min_age_days, result, control, pool, manifest)
+    if manifest is not None and manifest.covers(category.key):
+        manifest.discard(category.key)
+        return _clean_manifest(category, manifest, rule, result, control, pool)
+    futures = []
+    for root in category.resolve_roots():
+        if control is not None and control.is_cancelled():
+            break
+        futures.append(pool.submit(root, rule, result, control))
+    wait(futures)
+    return result
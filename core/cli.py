@@ -0,0 +1,252 @@
+"""命令行扫描与清理，不依赖 Qt，可在计划任务或 SSH 会话中运行
+
+    python -m core.cli scan [--category KEY ...] [--all] [--json]
+    python -m core.cli clean [--category KEY ...] [--all] [--min-age DAYS] [--dry-run] [--json]
+    python -m core.cli list [--json]
+
+不指定 --category 时，scan 扫描所有启用的类别，clean 只清理标记了 one_click 的类别
+（与界面上的“一键清理”相同）。
+退出码：0 成功；1 有文件未能删除；2 参数或类别规则错误；
+3 扫描超出时间预算，结果只是下限；130 被中断。
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import wait
+
+from .cleaner import DeletePool, clean_category
+from .index import ScanIndex
+from .manifest import DeletionManifest
+from .planner import ScanPlan
+from .procwalk import ProcessWalkPool
+from .rules import CategoryRegistry
+from .settings import load_settings
+from .walker import ScanControl, ScanProgress, WalkPool, format_size
+
+
+EXIT_OK = 0
+EXIT_INCOMPLETE = 1
+EXIT_USAGE = 2
+EXIT_ESTIMATED = 3
+EXIT_INTERRUPTED = 130
+
+
+class UsageError(Exception):
+    pass
+
+
+def select_categories(registry, keys=None, everything=False, one_click=False, min_age_days=0):
+    """按命令行参数挑选类别，min_age_days 不为 0 时只匹配足够旧的文件"""
+    if keys:
+        categories = []
+        for key in keys:
+            category = registry.get(key)
+            if category is None:
+                raise UsageError(f"未知的类别：{key}")
+            categories.append(category)
+    elif everything or not one_click:
+        categories = registry.enabled()
+    else:
+        categories = [category for category in registry.enabled() if category.one_click]
+    if min_age_days:
+        categories = [category.with_min_age(min_age_days) for category in categories]
+    # 显式指定的类别即使被禁用也要扫描
+    for category in categories:
+        category.enabled = True
+    return CategoryRegistry(categories)
+
+
+def open_index():
+    try:
+        return ScanIndex()
+    except (OSError, sqlite3.Error) as e:
+        print(f"打开扫描索引时出错：{str(e)}", file=sys.stderr)
+        return None
+
+
+def scan(registry, backend='thread', use_index=True, time_budget=None, manifest=None):
+    """扫描 registry 中的所有类别，返回 ({类别: FolderStats}, 跳过计数)
+
+    传入 manifest（DeletionManifest）时顺带记录待删除清单，完整扫描的类别标记为可用。
+    """
+    # 多进程后端无法共享扫描索引和清单，始终完整遍历
+    index = open_index() if use_index and backend != 'process' else None
+    if backend == 'process':
+        manifest = None
+    plan = ScanPlan.from_registry(registry, index=index,
+                                  link_aware=load_settings().get('detect_hard_links'))
+    if index is not None:
+        index.retain(plan.roots)
+    control = ScanControl(time_budget=time_budget)
+    progress = ScanProgress()
+    stats = plan.empty_results()
+    if backend == 'process':
+        pool = ProcessWalkPool(os.cpu_count() or 4)
+    else:
+        pool = WalkPool(plan.suggest_workers())
+    try:
+        with pool:
+            futures = [pool.submit(plan.walk(root, progress, control, manifest=manifest))
+                       for root in plan.roots]
+            # 分段等待，使 Ctrl+C 能及时打断主线程；必须在线程池关闭（等待遍历结束）之前取消
+            not_done = set(futures)
+            try:
+                while not_done:
+                    _, not_done = wait(not_done, timeout=0.5)
+            except KeyboardInterrupt:
+                control.cancel()
+                raise
+            for future in futures:
+                plan.merge_results(stats, future.result())
+    finally:
+        if index is not None:
+            index.close()
+    for name, item in stats.items():
+        plan.settle(name, item)
+        if manifest is not None and not item.estimated:
+            manifest.mark_complete(name)
+    return stats, progress.skipped
+
+
+def category_report(registry, stats):
+    return {
+        category.key: dict(label=category.label, roots=category.resolve_roots(),
+                           **stats.get(category.key).to_dict())
+        for category in registry.categories if category.key in stats
+    }
+
+
+def print_table(registry, stats, title):
+    print(title)
+    for category in registry.categories:
+        item = stats.get(category.key)
+        if item is None:
+            continue
+        suffix = "（下限）" if item.estimated else ""
+        print(f"  {category.label}（{category.key}）：{format_size(item.size)}{suffix}，"
+              f"{item.files} 个文件")
+
+
+def command_list(args, registry):
+    rows = [{'key': category.key, 'label': category.label, 'enabled': category.enabled,
+             'one_click': category.one_click, 'roots': category.resolve_roots()}
+            for category in registry.categories]
+    if args.json:
+        print(json.dumps({'categories': rows}, ensure_ascii=False, indent=4))
+    else:
+        for row in rows:
+            flags = ('' if row['enabled'] else '，已禁用') + ('，一键清理' if row['one_click'] else '')
+            print(f"{row['key']}：{row['label']}{flags}")
+    return EXIT_OK
+
+
+def command_scan(args, registry):
+    selected = select_categories(registry, args.category, args.all, min_age_days=args.min_age)
+    stats, skipped = scan(selected, args.backend, not args.no_index, args.time_budget)
+    estimated = any(item.estimated for item in stats.values())
+    if args.json:
+        print(json.dumps({'categories': category_report(selected, stats),
+                          'total': sum(item.size for item in stats.values()),
+                          'skipped': skipped, 'estimated': estimated},
+                         ensure_ascii=False, indent=4))
+    else:
+        print_table(selected, stats, "扫描结果：")
+        print(f"合计：{format_size(sum(item.size for item in stats.values()))}")
+    return EXIT_ESTIMATED if estimated else EXIT_OK
+
+
+def command_clean(args, registry):
+    selected = select_categories(registry, args.category, args.all, one_click=True,
+                                 min_age_days=args.min_age)
+    # 指定 --manifest 时清理直接使用扫描得到的清单，不再逐个目录重新遍历
+    manifest = DeletionManifest() if args.manifest and not args.dry_run else None
+    before, skipped = scan(selected, args.backend, not args.no_index, args.time_budget, manifest)
+    total = sum(item.size for item in before.values())
+    if args.dry_run:
+        if args.json:
+            print(json.dumps({'dry_run': True, 'categories': category_report(selected, before),
+                              'total': total, 'skipped': skipped},
+                             ensure_ascii=False, indent=4))
+        else:
+            print_table(selected, before, "将要清理：")
+            print(f"合计：{format_size(total)}")
+        return EXIT_ESTIMATED if any(item.estimated for item in before.values()) else EXIT_OK
+
+    # 所有类别共用一个删除线程池，同一设备上的并发数不会因类别多而叠加
+    with DeletePool() as pool:
+        results = {category.key: clean_category(category, pool=pool, manifest=manifest)
+                   for category in selected.categories}
+    freed = sum(result.freed for result in results.values())
+    if args.json:
+        report = category_report(selected, before)
+        for name, item in report.items():
+            item['cleaned'] = results[name].to_dict()
+        print(json.dumps({'dry_run': False, 'categories': report, 'total': total,
+                          'freed': freed, 'failed': sum(result.failed for result in results.values()),
+                          'skipped': skipped},
+                         ensure_ascii=False, indent=4))
+    else:
+        print("清理结果：")
+        for category in selected.categories:
+            result = results[category.key]
+            failed = f"，{result.failed} 个未能删除" if result.failed else ""
+            if result.changed:
+                failed += f"，{result.changed} 个扫描后被修改而保留"
+            print(f"  {category.label}（{category.key}）：释放 {format_size(result.freed)}，"
+                  f"删除 {result.files} 个文件{failed}")
+        print(f"合计释放：{format_size(freed)}")
+    if any(item.estimated for item in before.values()):
+        return EXIT_ESTIMATED
+    return EXIT_INCOMPLETE if any(result.failed for result in results.values()) else EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m core.cli', description="扫描和清理垃圾文件")
+    parser.add_argument('--rules', help="类别规则文件，默认按当前系统选择")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help="列出所有类别")
+    list_parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    list_parser.set_defaults(handler=command_list)
+
+    for name, handler, text in (('scan', command_scan, "扫描类别大小"),
+                                ('clean', command_clean, "清理类别")):
+        sub = subparsers.add_parser(name, help=text)
+        sub.add_argument('-c', '--category', action='append', metavar='KEY',
+                         help="要处理的类别，可重复指定")
+        sub.add_argument('--all', action='store_true', help="处理所有启用的类别")
+        sub.add_argument('--min-age', type=int, default=0, metavar='DAYS',
+                         help="只处理超过 DAYS 天未修改的文件（按 UTC 日期整天计）")
+        sub.add_argument('--backend', choices=('thread', 'process'),
+                         default=load_settings().get('scan_backend', 'thread'))
+        sub.add_argument('--no-index', action='store_true', help="不使用扫描索引，完整遍历")
+        sub.add_argument('--time-budget', type=float, metavar='SECONDS',
+                         help="单个遍历根的时间预算，超出后结果只是下限")
+        sub.add_argument('--json', action='store_true', help="以 JSON 输出")
+        if name == 'clean':
+            sub.add_argument('-n', '--dry-run', action='store_true', help="只报告，不删除")
+            sub.add_argument('--manifest', action='store_true',
+                             default=load_settings().get('clean_manifest', False),
+                             help="扫描时记录待删除清单，清理时不再遍历（扫描不复用索引）")
+        sub.set_defaults(handler=handler)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not hasattr(args, 'dry_run'):
+        args.dry_run = False
+    try:
+        registry = CategoryRegistry.load(args.rules)
+        return args.handler(args, registry)
+    except (OSError, ValueError, KeyError, UsageError) as e:
+        print(f"错误：{str(e)}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+
+
+if __name__ == '__main__':
+    sys.exit(main())
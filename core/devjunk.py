@@ -0,0 +1,224 @@
+import argparse
+import os
+import threading
+import time
+
+from .walker import format_size, scan_folder
+
+
+# 项目标记文件 -> {产物目录名: 类型}；只有与标记文件位于同一目录的产物才算数
+PROJECT_ARTIFACTS = {
+    'package.json': {'node_modules': 'node'},
+    'Cargo.toml': {'target': 'rust'},
+    'pom.xml': {'target': 'maven'},
+    'build.gradle': {'.gradle': 'gradle', 'build': 'gradle'},
+    'build.gradle.kts': {'.gradle': 'gradle', 'build': 'gradle'},
+    'settings.gradle': {'.gradle': 'gradle'},
+    'settings.gradle.kts': {'.gradle': 'gradle'},
+    'pyproject.toml': {'.tox': 'python', 'build': 'python'},
+    'setup.py': {'.tox': 'python', 'build': 'python'},
+}
+
+# 在任何位置出现都属于产物的目录
+ANYWHERE_ARTIFACTS = {
+    '__pycache__': 'python',
+    '.pytest_cache': 'python',
+    '.mypy_cache': 'python',
+    '.ruff_cache': 'python',
+}
+
+# 含有 pyvenv.cfg 时视为虚拟环境
+VENV_NAMES = ('.venv', 'venv', 'env', '.env')
+
+# 产物目录中记录最近一次使用的文件，与目录本身的 mtime 一起决定最后使用时间
+LAST_USED_STAMPS = {
+    'node': ('.package-lock.json', '.yarn-integrity', '.modules.yaml'),
+    'rust': ('.rustc_info.json', 'CACHEDIR.TAG'),
+    'gradle': ('buildOutputCleanup',),
+    'venv': ('pyvenv.cfg',),
+}
+
+# 与源码目录容易重名的产物目录 (目录名, 类型) -> 构建工具在其中留下的条目名前缀；
+# 不含这些条目的同名目录不当作产物
+OUTPUT_MARKERS = {
+    ('target', 'rust'): ('CACHEDIR.TAG',),
+    ('target', 'maven'): ('maven-status', 'maven-archiver'),
+    ('build', 'gradle'): ('tmp', 'intermediates', 'kotlin'),
+    ('build', 'python'): ('bdist.', 'lib.', 'temp.'),
+}
+
+# 发现阶段不进入的目录：版本库元数据和常见的大型非项目目录
+SKIP_DIRS = {'.git', '.hg', '.svn', '.idea', '.vscode', 'AppData', 'Library'}
+
+# 同一组搜索根的发现结果在这段时间（秒）内复用，扫描、清理和详情显示共用一次发现
+DISCOVERY_TTL = 60
+
+
+class Artifact:
+    """一个可清理的开发产物目录"""
+
+    __slots__ = ('path', 'kind', 'project', 'last_used')
+
+    def __init__(self, path, kind, project, last_used):
+        self.path = path
+        self.kind = kind
+        self.project = project
+        self.last_used = last_used
+
+    def idle_days(self, now=None):
+        return ((now or time.time()) - self.last_used) / 86400
+
+    def __repr__(self):
+        return f"Artifact({self.kind}, {self.path!r})"
+
+
+def _verify(path, name, kind):
+    # 名为 target / build 的目录也可能是源码，只认工具留下的标记，见 OUTPUT_MARKERS
+    markers = OUTPUT_MARKERS.get((name, kind))
+    if markers is None:
+        return True
+    try:
+        names = os.listdir(path)
+    except OSError:
+        return False
+    return any(entry.startswith(markers) for entry in names)
+
+
+def last_used(path, kind):
+    """返回产物的最后使用时间：目录本身及少数标记文件的最大 mtime，不遍历其内容"""
+    times = []
+    stamps = [os.path.join(path, stamp) for stamp in LAST_USED_STAMPS.get(kind, ())]
+    for name in [path] + stamps:
+        try:
+            times.append(os.stat(name).st_mtime)
+        except OSError:
+            pass
+    return max(times) if times else 0
+
+
+def discover_artifacts(search_roots, max_depth=8):
+    """在搜索根下按标记文件查找项目产物，返回 [Artifact, ...]
+
+    每个目录只列出一次：从同级条目中识别标记文件，命中的产物目录立即记录且不再进入，
+    因此产物内部（如 node_modules 的几十万个文件）完全不会被列出。
+    不跟随符号链接，不进入隐藏目录和 SKIP_DIRS。
+    """
+    artifacts = []
+    stack = [(os.path.normpath(os.path.expanduser(root)), 0) for root in search_roots]
+    seen = set()
+    while stack:
+        current, depth = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        names = {entry.name for entry in entries}
+        targets = dict(ANYWHERE_ARTIFACTS)
+        for marker, outputs in PROJECT_ARTIFACTS.items():
+            if marker in names:
+                targets.update(outputs)
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            name = entry.name
+            kind = targets.get(name)
+            if (kind is None and name in VENV_NAMES
+                    and os.path.isfile(os.path.join(entry.path, 'pyvenv.cfg'))):
+                kind = 'venv'
+            if kind is not None and _verify(entry.path, name, kind):
+                key = os.path.normcase(entry.path)
+                if key not in seen:
+                    seen.add(key)
+                    artifacts.append(Artifact(entry.path, kind, current,
+                                              last_used(entry.path, kind)))
+                continue
+            if name.startswith('.') or name in SKIP_DIRS or depth >= max_depth:
+                continue
+            stack.append((entry.path, depth + 1))
+    return artifacts
+
+
+class _DiscoveryCache:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, search_roots, max_depth):
+        key = (tuple(search_roots), max_depth)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and now - entry[0] < DISCOVERY_TTL:
+                return entry[1]
+        artifacts = discover_artifacts(search_roots, max_depth)
+        with self.lock:
+            self.entries[key] = (now, artifacts)
+        return artifacts
+
+    def peek(self, search_roots, max_depth):
+        """返回上次发现的结果（不论是否过期），没有时返回 None，不会触发发现"""
+        with self.lock:
+            entry = self.entries.get((tuple(search_roots), max_depth))
+        return entry[1] if entry is not None else None
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+_cache = _DiscoveryCache()
+
+
+def category_artifacts(category, cached=False):
+    """按类别的 options（search_roots、max_depth、min_idle_days）返回其产物列表
+
+    cached 为真时只返回上次发现的结果，还没有发现过时返回 None；用于界面线程，
+    发现可能需要列出大量目录。
+    """
+    options = category.options
+    roots = [os.path.expanduser(root) for root in options.get('search_roots', ())]
+    roots = [root for root in roots if os.path.isdir(root)]
+    max_depth = options.get('max_depth', 8)
+    if cached:
+        artifacts = _cache.peek(roots, max_depth)
+        if artifacts is None:
+            return None
+    else:
+        artifacts = _cache.get(roots, max_depth)
+    min_idle_days = options.get('min_idle_days', 0)
+    if min_idle_days:
+        now = time.time()
+        artifacts = [artifact for artifact in artifacts if artifact.idle_days(now) >= min_idle_days]
+    return artifacts
+
+
+def dev_artifact_roots(category):
+    return [artifact.path for artifact in category_artifacts(category)]
+
+
+def forget_artifacts():
+    """清理后调用，使下次扫描重新发现"""
+    _cache.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="列出开发产物目录及其最后使用时间")
+    parser.add_argument('roots', nargs='+', help="搜索根目录")
+    parser.add_argument('--max-depth', type=int, default=8)
+    parser.add_argument('--size', action='store_true', help="同时统计每个产物的大小（会遍历其内容）")
+    args = parser.parse_args(argv)
+    artifacts = discover_artifacts(args.roots, args.max_depth)
+    artifacts.sort(key=lambda artifact: artifact.last_used)
+    for artifact in artifacts:
+        used = time.strftime('%Y-%m-%d', time.localtime(artifact.last_used))
+        size = f"{format_size(scan_folder(artifact.path).size):>10}  " if args.size else ''
+        print(f"{used}  {size}{artifact.kind:<7} {artifact.path}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
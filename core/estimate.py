@@ -0,0 +1,150 @@
+import math
+import random
+import time
+
+from .walker import ScanControl, TreeWalk, _WalkLocal, format_size
+
+
+class SizeEstimate:
+    """抽样得到的类别大小估计
+
+    size 为点估计，low/high 为近似 95% 置信区间；exact 为 True 表示没有发生抽样，
+    数值与完整遍历相同。high 为 None 表示时间预算耗尽、还有更深的目录没有探查，
+    此时只有下限可信。
+    """
+
+    __slots__ = ('size', 'low', 'high', 'files', 'exact')
+
+    def __init__(self, size=0, low=0, high=0, files=0, exact=True):
+        self.size = size
+        self.low = low
+        self.high = high
+        self.files = files
+        self.exact = exact
+
+    def __repr__(self):
+        high = format_size(self.high) if self.high is not None else '?'
+        return f"SizeEstimate({format_size(self.size)}, {format_size(self.low)} ~ {high})"
+
+
+class _Tally:
+    __slots__ = ('size', 'seen', 'files', 'sampled')
+
+    def __init__(self):
+        self.size = 0.0
+        self.seen = 0
+        self.files = 0.0
+        self.sampled = False
+
+
+# 自由度为 REPLICAS - 1 的 t 分布 97.5% 分位数
+T_QUANTILES = {1: 12.71, 2: 4.30, 3: 3.18, 4: 2.78, 5: 2.57, 6: 2.45, 7: 2.36}
+
+
+class _Probe:
+    """对一个声明路径逐层抽样：每层最多列出 per_level 个目录
+
+    某一层的候选子目录超过 per_level 个时随机抽取 per_level 个，
+    被抽中的目录权重乘以 候选数 / 抽样数（Horvitz-Thompson 估计）。
+    每个声明路径单独探查且只计入自己的类别，嵌套声明不会因为没被抽中而漏掉。
+    同一声明路径的各次抽样共用 walk 和 listings（{目录: (各类别的 (大小, 文件数), 子目录)}），
+    每个目录只列出一次。
+    """
+
+    def __init__(self, walk, listings, owners, tallies):
+        self.walk = walk
+        self.listings = listings
+        self.owners = owners
+        self.frontier = [(walk.root_item(), 1.0)]
+        self.tallies = tallies
+
+    @property
+    def truncated(self):
+        """还有没探查的目录，或某个目录因预算耗尽只列出了一部分"""
+        return bool(self.frontier) or self.walk.stopped
+
+    def listing(self, item):
+        listing = self.listings.get(item[0])
+        if listing is None:
+            local = _WalkLocal()
+            found = []
+            self.walk.visit(item, None, local, found.append)
+            listing = ({owner: (st.size, st.files) for owner, st in local.results.items()}, found)
+            # 列到一半就停止的结果只用这一次
+            if not self.walk.stopped:
+                self.listings[item[0]] = listing
+        return listing
+
+    def step(self, per_level, rng):
+        """探查一层，把加权结果累加到 tallies，并抽取下一层要探查的目录"""
+        children = []
+        for item, weight in self.frontier:
+            if self.walk.stopped:
+                break
+            results, found = self.listing(item)
+            for owner, (size, files) in results.items():
+                tally = self.tallies.get(owner)
+                if tally is None:
+                    tally = self.tallies[owner] = _Tally()
+                tally.size += weight * size
+                tally.seen += size
+                tally.files += weight * files
+                tally.sampled = tally.sampled or weight != 1.0
+            children.extend((child, weight) for child in found)
+        if len(children) > per_level:
+            scale = len(children) / per_level
+            self.frontier = [(child, weight * scale)
+                             for child, weight in rng.sample(children, per_level)]
+        else:
+            self.frontier = children
+
+
+def estimate_plan(plan, per_level=32, time_budget=0.2, replicas=4, seed=None, control=None):
+    """快速估计 ScanPlan 中每个类别的大小，返回 {类别: SizeEstimate}
+
+    做 replicas 次相互独立的抽样，点估计取平均值，置信区间由各次结果的离散程度
+    按 t 分布给出。所有探查按层轮流进行，预算耗尽时每个根都至少探查了较浅的几层。
+    时间预算在列目录的过程中也会检查，单个巨大的目录不会拖过预算；
+    传入 control（ScanControl）时取消扫描也会中止估计。
+    """
+    rng = random.Random(seed)
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    control = control if control is not None else ScanControl()
+    replica_tallies = [{} for _ in range(max(2, replicas))]
+    shared = {}
+    for path, owners in plan.claims.items():
+        walk = TreeWalk(path, {path: owners}, control=control, rules=plan.rules,
+                        link_aware=False, top_n=0)
+        # 所有探查共用同一个截止时间，而不是从各自开始列目录时算起
+        walk.deadline = deadline
+        shared[path] = (walk, {})
+    probes = all_probes = [_Probe(*shared[path], owners, tallies)
+                           for tallies in replica_tallies for path, owners in plan.claims.items()]
+    while probes:
+        if control.exhausted(deadline, 0):
+            break
+        for probe in probes:
+            if control.exhausted(deadline, 0):
+                break
+            probe.step(per_level, rng)
+        probes = [probe for probe in probes if probe.frontier and not probe.walk.stopped]
+
+    count = len(replica_tallies)
+    t_quantile = T_QUANTILES.get(count - 1, 1.96)
+    estimates = {}
+    for name in plan.categories:
+        tallies = [tallies.get(name, _Tally()) for tallies in replica_tallies]
+        sizes = [tally.size for tally in tallies]
+        mean = sum(sizes) / count
+        spread = math.sqrt(sum((size - mean) ** 2 for size in sizes) / (count - 1))
+        margin = t_quantile * spread / math.sqrt(count)
+        truncated = any(name in probe.owners and probe.truncated for probe in all_probes)
+        estimates[name] = SizeEstimate(
+            size=int(mean),
+            # 实际看到的字节数一定不超过真实大小
+            low=max(max(tally.seen for tally in tallies), int(mean - margin)),
+            high=None if truncated else int(mean + margin),
+            files=int(sum(tally.files for tally in tallies) / count),
+            exact=not truncated and not any(tally.sampled for tally in tallies),
+        )
+    return estimates
@@ -0,0 +1,116 @@
+import os
+import sqlite3
+import threading
+
+from .settings import app_data_dir
+
+
+def default_index_path():
+    return os.path.join(app_data_dir(), 'scan_index.sqlite3')
+
+
+class ScanIndex:
+    """持久化的目录聚合索引
+
+    每个目录记录 (mtime, 直接文件大小, 占用空间, 直接文件数, 子目录名, 最大的直接文件,
+    按修改日期和大小位数合并的直接文件统计)。重新扫描时，
+    目录 mtime 未变就直接复用记录，只对子目录做一次 stat，不再列目录内容。
+    注意：就地改写文件内容不会改变目录 mtime，这类变化要到目录本身变化时才会体现。
+    """
+
+    SCHEMA_VERSION = 4
+
+    def __init__(self, path=None):
+        self.path = path or default_index_path()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self.conn:
+            # 索引只是缓存，格式变化时直接重建
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS dirs")
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS dirs (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    allocated INTEGER NOT NULL,
+                    files INTEGER NOT NULL,
+                    children TEXT NOT NULL,
+                    largest TEXT NOT NULL,
+                    buckets TEXT NOT NULL,
+                    PRIMARY KEY (root, path)
+                )
+            """)
+
+    def load(self, root):
+        """返回 {目录: (mtime_ns, size, allocated, files, (子目录名, ...), ((大小, 文件名), ...),
+        ((bucket_key, 文件数, 大小, 占用空间), ...))}"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT path, mtime_ns, size, allocated, files, children, largest, buckets "
+                "FROM dirs WHERE root = ?",
+                (root,)
+            ).fetchall()
+        return {
+            path: (mtime_ns, size, allocated, files,
+                   tuple(children.split('/')) if children else (), self._decode_largest(largest),
+                   self._decode_rows(buckets))
+            for path, mtime_ns, size, allocated, files, children, largest, buckets in rows
+        }
+
+    @staticmethod
+    def _encode_rows(rows):
+        return '/'.join(':'.join(map(str, row)) for row in rows)
+
+    @staticmethod
+    def _decode_rows(text):
+        if not text:
+            return ()
+        return tuple(tuple(int(value) for value in part.split(':')) for part in text.split('/'))
+
+    @staticmethod
+    def _encode_largest(largest):
+        # 文件名不会包含 /，大小中不会包含 :
+        return '/'.join(f"{size}:{name}" for size, name in largest)
+
+    @staticmethod
+    def _decode_largest(text):
+        if not text:
+            return ()
+        largest = []
+        for part in text.split('/'):
+            size, name = part.split(':', 1)
+            largest.append((int(size), name))
+        return tuple(largest)
+
+    def save(self, root, entries):
+        """用本次遍历的结果整体替换 root 下的记录，顺带清掉已删除的目录"""
+        rows = [
+            (root, path, mtime_ns, size, allocated, files, '/'.join(children),
+             self._encode_largest(largest), self._encode_rows(buckets))
+            for path, (mtime_ns, size, allocated, files, children, largest, buckets)
+            in entries.items()
+        ]
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM dirs WHERE root = ?", (root,))
+            self.conn.executemany("INSERT INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def retain(self, roots):
+        """删除不再属于任何扫描根的记录"""
+        roots = list(roots)
+        with self.lock, self.conn:
+            if roots:
+                marks = ','.join('?' * len(roots))
+                self.conn.execute(f"DELETE FROM dirs WHERE root NOT IN ({marks})", roots)
+            else:
+                self.conn.execute("DELETE FROM dirs")
+
+    def clear(self):
+        self.retain([])
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
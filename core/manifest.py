@@ -0,0 +1,70 @@
+import os
+import threading
+from array import array
+
+
+class DeletionManifest:
+    """扫描时顺带记录的待删除清单，清理时直接按清单删除而不再遍历
+
+    每个目录保存一次路径，其中的文件按类别组合各保存一行：以 '\\0' 连接的文件名，
+    以及对应的大小和 mtime（纳秒）数组，百万个文件也只占几十 MB。
+    清单包含扫描时计入类别的普通文件，以及目录中的符号链接（Windows 下还有联接点），
+    后者只记录名称，清理时与逐目录删除一样只删除链接本身；套接字、管道和设备文件不记录，
+    它们所在的目录因此会保留。只有完整遍历过的类别（未取消、
+    未超出预算）才由 mark_complete 标记为可用，其余类别清理时仍按目录遍历。
+    多个遍历线程可以同时调用 add。
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # [(目录, 遍历该目录时的类别组合), ...]，目录按遍历顺序排列
+        self.dirs = []
+        # [(目录序号, 类别组合, 文件名, 大小, mtime_ns), ...]
+        self.rows = []
+        # [(目录序号, 链接名), ...]，链接归属于所在目录的类别组合
+        self.link_rows = []
+        self.complete = set()
+
+    def add(self, directory, owners, groups, links=()):
+        """记录一个目录；groups 为 {类别组合: ([文件名], [大小], [mtime_ns])}，links 为链接名"""
+        with self.lock:
+            index = len(self.dirs)
+            self.dirs.append((directory, owners))
+            for names, (file_names, sizes, mtimes) in groups.items():
+                self.rows.append((index, names, '\0'.join(file_names),
+                                  array('q', sizes), array('q', mtimes)))
+            if links:
+                self.link_rows.append((index, '\0'.join(links)))
+
+    def mark_complete(self, name):
+        self.complete.add(name)
+
+    def covers(self, name):
+        return name in self.complete
+
+    def discard(self, name):
+        """类别已按清单清理（或清单已不可信）后调用，之后该类别回到按目录遍历"""
+        self.complete.discard(name)
+
+    def files(self, name):
+        """依次返回类别的 (目录, [文件名], 大小数组, mtime 数组)"""
+        for index, names, file_names, sizes, mtimes in self.rows:
+            if name in names:
+                yield self.dirs[index][0], file_names.split('\0'), sizes, mtimes
+
+    def links(self, name):
+        """依次返回类别的 (目录, [链接名])"""
+        for index, link_names in self.link_rows:
+            directory, owners = self.dirs[index]
+            if name in owners:
+                yield directory, link_names.split('\0')
+
+    def directories(self, name):
+        """返回类别遍历过的目录，子目录排在其父目录之前，便于逐个删除空目录"""
+        paths = [directory for directory, owners in self.dirs if name in owners]
+        paths.sort(key=lambda path: path.count(os.sep), reverse=True)
+        return paths
+
+    def file_count(self, name=None):
+        return sum(len(sizes) for _, names, _, sizes, _ in self.rows
+                   if name is None or name in names)
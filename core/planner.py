@@ -0,0 +1,125 @@
+import os
+
+from .storage import suggest_workers
+from .walker import FolderStats, LinkTable, TreeWalk, normalize_path
+
+
+def _contains(parent, path):
+    """path 是否为 parent 本身或其子目录（两者均已规范化）"""
+    return path == parent or path.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+class ScanPlan:
+    """合并各类别的扫描根目录，保证每个物理目录只遍历一次
+
+    重复的根（如更新缓存与补丁缓存、系统临时目录与 AppData\\Local\\Temp）
+    合并为一个声明；嵌套的根并入其最上层祖先的遍历中，
+    遍历时字节会同时计入所有声明了该子树的类别。
+    """
+
+    def __init__(self, categories, index=None, rules=None, link_aware=None):
+        # categories: {类别: [路径, ...]}；index 为可选的 ScanIndex，用于增量扫描；
+        # rules: {类别: JunkCategory}，遍历时逐条目判断的规则；
+        # link_aware 控制是否识别硬链接，None 时沿用 TreeWalk 的默认值（只在 POSIX 上开启，
+        # Windows 上需要为每个文件额外 stat 一次），见设置项 detect_hard_links
+        self.categories = list(categories)
+        self.index = index
+        self.rules = rules or {}
+        self.link_aware = link_aware
+        # 所有遍历共享同一张硬链接表，跨根目录的硬链接也只计一次
+        self.links = LinkTable()
+        self.claims = {}
+        for name, paths in categories.items():
+            if isinstance(paths, (str, os.PathLike)):
+                paths = [paths]
+            for path in paths:
+                key = normalize_path(path)
+                owners = self.claims.get(key, ())
+                if name not in owners:
+                    self.claims[key] = owners + (name,)
+        self.roots = [key for key in self.claims if not self._has_claimed_ancestor(key)]
+
+    @classmethod
+    def from_registry(cls, registry, index=None, link_aware=None):
+        """按类别规则生成扫描计划，禁用的类别既不占遍历也不参与匹配"""
+        return cls(registry.scan_roots(), index=index, rules=registry.rules(),
+                   link_aware=link_aware)
+
+    def _has_claimed_ancestor(self, key):
+        parent = os.path.dirname(key)
+        while parent and parent != key:
+            if parent in self.claims:
+                return True
+            key, parent = parent, os.path.dirname(parent)
+        return False
+
+    def claims_under(self, root):
+        """返回属于 root 子树的声明，供单个遍历任务使用"""
+        prefix = root.rstrip(os.sep) + os.sep
+        return {key: owners for key, owners in self.claims.items()
+                if key == root or key.startswith(prefix)}
+
+    def related(self, names):
+        """返回与 names 中的类别有相同或嵌套目录的其他类别，清理 names 会改变它们的大小"""
+        names = set(names)
+        paths = [key for key, owners in self.claims.items() if names.intersection(owners)]
+        related = set()
+        for key, owners in self.claims.items():
+            if any(_contains(path, key) or _contains(key, path) for path in paths):
+                related.update(owners)
+        return related - names
+
+    def root_categories(self, root):
+        """返回遍历 root 时会得到结果的类别"""
+        names = set()
+        for owners in self.claims_under(root).values():
+            names.update(owners)
+        return names
+
+    def category_roots(self):
+        """返回 {类别: {遍历根, ...}}，类别的所有遍历根完成后其结果即为最终值"""
+        pending = {name: set() for name in self.categories}
+        for root in self.roots:
+            for name in self.root_categories(root):
+                pending[name].add(root)
+        return pending
+
+    def walk(self, root, progress=None, control=None, snapshot=None, manifest=None):
+        """为 root 创建遍历任务，参与线程数按其存储类型限制"""
+        return TreeWalk(root, self.claims_under(root), self.index, progress, control,
+                        max_workers=suggest_workers(root), rules=self.rules, links=self.links,
+                        link_aware=self.link_aware, snapshot=snapshot, manifest=manifest)
+
+    def scan_root(self, root, progress=None, control=None):
+        return self.walk(root, progress, control).run()
+
+    def suggest_workers(self):
+        return max([suggest_workers(root) for root in self.roots] or [1])
+
+    def empty_results(self):
+        return {name: FolderStats() for name in self.categories}
+
+    def merge_results(self, results, partial):
+        for name, stats in partial.items():
+            results.setdefault(name, FolderStats()).merge(stats)
+        return results
+
+    def settle(self, name, stats):
+        """类别的所有遍历完成后调用一次：计入全部链接都在类别内的硬链接文件"""
+        stats.reclaimable += self.links.reclaimable(name)
+        return stats
+
+    def run(self, executor=None):
+        """执行计划，返回 {类别: FolderStats}"""
+        results = self.empty_results()
+        if self.index is not None:
+            self.index.retain(self.roots)
+        if executor is None:
+            for root in self.roots:
+                self.merge_results(results, self.scan_root(root))
+        else:
+            for partial in executor.map(self.scan_root, self.roots):
+                self.merge_results(results, partial)
+        for name, stats in results.items():
+            self.settle(name, stats)
+        return results
@@ -0,0 +1,58 @@
+import os
+import sys
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PlatformBackend:
+    """类别规则的平台后端：决定加载哪份规则文件，以及如何执行特殊的清理动作
+
+    rules_file 为项目目录下的类别规则文件名；requires_admin 表示清理系统目录前
+    是否需要请求管理员权限；run_action 执行类别的 action，返回是否已处理。
+    """
+
+    name = None
+    rules_file = None
+    requires_admin = False
+
+    def rules_path(self):
+        return os.path.join(PROJECT_DIR, self.rules_file)
+
+    def run_action(self, category):
+        return False
+
+
+class WindowsBackend(PlatformBackend):
+    name = 'windows'
+    rules_file = 'junk_categories.json'
+    requires_admin = True
+
+    def run_action(self, category):
+        if category.action == 'empty_recycle_bin':
+            os.system('rd /s /q %systemdrive%\\$Recycle.bin')
+            return True
+        return False
+
+
+class LinuxBackend(PlatformBackend):
+    """Linux 下的类别全部是普通目录（XDG 回收站、~/.cache、/var/log 等），没有特殊动作；
+    系统目录只清理当前用户有权限的部分，不请求提权"""
+
+    name = 'linux'
+    rules_file = 'junk_categories.linux.json'
+
+
+BACKENDS = {
+    'windows': WindowsBackend,
+    'linux': LinuxBackend,
+}
+
+
+def current_platform():
+    """返回当前系统的后端；其他类 Unix 系统使用 Linux 的规则"""
+    return WindowsBackend() if sys.platform == 'win32' else LinuxBackend()
+
+
+def get_platform(name=None):
+    return BACKENDS[name]() if name else current_platform()
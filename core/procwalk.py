@@ -0,0 +1,168 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .snapshot import SnapshotWriter
+from .walker import FolderStats, ScanControl, TreeWalk, _DirNode, _WalkLocal
+
+
+# 子进程中与父进程共享的取消事件，由 _init_worker 设置
+_cancel_event = None
+
+
+def _init_worker(cancel_event):
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _scan_subtree(path, owners, claims, rules, deadline, entry_budget, top_n, spill_dir,
+                  link_aware):
+    """在子进程中串行遍历一个子树，返回 ({类别: 统计元组}, (子树大小, 子树文件数), 跳过计数,
+    快照分段)
+
+    子树未完整遍历时子树大小和文件数为 None；spill_dir 为 None 时不记录快照。
+    """
+    time_budget = None if deadline is None else max(0.0, deadline - time.time())
+    control = ScanControl(time_budget=time_budget, entry_budget=entry_budget)
+    if _cancel_event is not None:
+        # 进程间的 Event 与 threading.Event 接口相同
+        control.cancelled = _cancel_event
+    snapshot = SnapshotWriter(spill_dir=spill_dir) if spill_dir is not None else None
+    walk = TreeWalk(path, claims, control=control, root_owners=owners, rules=rules, top_n=top_n,
+                    link_aware=link_aware, snapshot=snapshot)
+    results = walk.run()
+    runs = snapshot.finish_runs() if snapshot is not None else []
+    return ({name: st.as_tuple() for name, st in results.items()},
+            (walk.root_size, walk.root_files), walk.skipped, runs)
+
+
+class ProcessWalkPool:
+    """多进程遍历后端，接口与 WalkPool 相同：submit(walk) 返回 Future
+
+    Python 线程遍历海量元数据时主要受 GIL 限制。这里父进程先逐层展开根目录，
+    直到得到足够多的子树，再把每个子树交给 ProcessPoolExecutor，
+    子进程只回传每个类别的统计元组（FolderStats.as_tuple）；需要快照时，
+    子进程把有序的快照分段写到父进程快照的临时目录，只回传分段路径。
+    硬链接只在各子树内部去重，并由子进程自行结算可释放空间。
+    子进程无法共享扫描索引；取消时尚未开始的子树被撤销，父进程的取消事件
+    由一个线程转发到进程间共享的事件，正在遍历的子树也会尽快结束。
+    """
+
+    # 展开到子树数量达到 workers * SPLIT_FACTOR 或深度达到 MAX_SPLIT_DEPTH 为止
+    SPLIT_FACTOR = 4
+    MAX_SPLIT_DEPTH = 3
+
+    # 检查父进程取消事件的间隔（秒）
+    CANCEL_POLL_INTERVAL = 0.1
+
+    def __init__(self, workers):
+        self.workers = max(1, workers)
+        self.cancel_event = multiprocessing.Event()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.cancel_event,))
+        self.controls = []
+        self.closed = threading.Event()
+        self.forwarder = threading.Thread(target=self._forward_cancel, daemon=True)
+        self.forwarder.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        # 等待子进程结束期间仍要转发取消，转发线程在之后才停止
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.closed.set()
+        self.forwarder.join()
+
+    def _forward_cancel(self):
+        while not self.closed.wait(self.CANCEL_POLL_INTERVAL):
+            if any(control.is_cancelled() for control in list(self.controls)):
+                self.cancel_event.set()
+                return
+
+    def split(self, walk):
+        """在父进程中按层处理目录，直接文件计入父进程结果，返回待分发的子树"""
+        local = walk.local_for('parent')
+        frontier = [walk.root_item()]
+        for _ in range(self.MAX_SPLIT_DEPTH):
+            if len(frontier) >= self.workers * self.SPLIT_FACTOR or walk.should_stop():
+                break
+            children = []
+            for item in frontier:
+                walk.process(item, local, children.append)
+            frontier = children
+        return frontier
+
+    def submit(self, walk):
+        if walk.control is not None:
+            self.controls.append(walk.control)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        subtrees = self.split(walk)
+        if not subtrees:
+            future.set_result(walk.finish())
+            return future
+
+        walk.should_stop()
+        deadline = None
+        if walk.deadline is not None:
+            deadline = time.time() + (walk.deadline - time.monotonic())
+        entry_budget = None
+        if walk.control is not None and walk.control.entry_budget is not None:
+            remaining = max(0, walk.control.entry_budget - walk.entries_seen)
+            entry_budget = remaining // len(subtrees)
+
+        lock = threading.Lock()
+        remaining = [len(subtrees)]
+
+        def collect(index, sub_future):
+            local = _WalkLocal()
+            dirs = files = size = 0
+            root_size = root_files = None
+            try:
+                partial, (root_size, root_files), skipped, runs = sub_future.result()
+                if walk.snapshot is not None:
+                    walk.snapshot.adopt_runs(runs)
+                for kind, count in skipped.items():
+                    local.skipped[kind] += count
+                for name, values in partial.items():
+                    stats = local.results[name] = FolderStats.from_tuple(values)
+                    if stats.estimated:
+                        walk.stopped = True
+                    dirs, files, size = (max(dirs, stats.dirs), max(files, stats.files),
+                                         max(size, stats.size))
+            except Exception:
+                # 子树被取消或子进程出错：结果只是下限
+                walk.stopped = True
+            if walk.progress is not None:
+                walk.progress.add(found=dirs, done=dirs + 1, files=files, size=size)
+            if walk.track_dirs and root_size is not None:
+                # 子树在子进程中完整遍历：把它作为一个已完成的目录接回父进程的目录树
+                path, owners, _, parent = subtrees[index]
+                walk.complete(_DirNode(path, owners, parent), root_size, root_files, local)
+            with lock:
+                walk.locals[('subtree', index)] = local
+                remaining[0] -= 1
+                last = not remaining[0]
+            if last:
+                try:
+                    future.set_result(walk.finish())
+                except Exception as e:
+                    future.set_exception(e)
+
+        spill_dir = walk.snapshot.spill_dir if walk.snapshot is not None else None
+        for index, (path, owners, _, _) in enumerate(subtrees):
+            try:
+                sub_future = self.executor.submit(_scan_subtree, path, owners, walk.claims,
+                                                  walk.rules, deadline, entry_budget, walk.top_n,
+                                                  spill_dir, walk.link_aware)
+            except RuntimeError:
+                sub_future = Future()
+                sub_future.cancel()
+                sub_future.set_running_or_notify_cancel()
+            sub_future.add_done_callback(lambda f, i=index: collect(i, f))
+        return future
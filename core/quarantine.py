@@ -0,0 +1,293 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from .cleaner import CleanResult, clean_folder
+from .settings import app_data_dir
+
+
+# 卷根目录下的隔离目录名
+QUARANTINE_NAME = '.plugin-box-quarantine'
+# 隔离的内容默认保留这么久（秒）再真正删除，期间可以撤销
+PURGE_DELAY = 300
+
+
+def registry_path():
+    """记录用过的隔离目录，启动时据此找到上次未删除的批次"""
+    return os.path.join(app_data_dir(), 'quarantine.json')
+
+
+def _load_dirs():
+    try:
+        with open(registry_path(), encoding='utf-8') as f:
+            return [path for path in json.load(f) if isinstance(path, str)]
+    except (OSError, ValueError, TypeError):
+        return []
+
+
+def _remember_dir(path):
+    dirs = _load_dirs()
+    if path in dirs:
+        return
+    dirs.append(path)
+    try:
+        os.makedirs(app_data_dir(), exist_ok=True)
+        with open(registry_path(), 'w', encoding='utf-8') as f:
+            json.dump(dirs, f, ensure_ascii=False, indent=4)
+    except OSError as e:
+        print(f"保存隔离目录列表时出错：{str(e)}")
+
+
+def _mount_root(path, st_dev):
+    """向上查找与 path 位于同一设备的最上层目录"""
+    if os.name == 'nt':
+        return os.path.splitdrive(path)[0] + os.sep
+    current = path
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return current
+        try:
+            if os.stat(parent).st_dev != st_dev:
+                return current
+        except OSError:
+            return current
+        current = parent
+
+
+def _contains(parent, path):
+    parent = os.path.normcase(parent)
+    path = os.path.normcase(path)
+    return path == parent or path.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+def quarantine_dir(root):
+    """返回与 root 位于同一卷、可以写入的隔离目录，找不到时返回 None
+
+    重命名只有在同一卷内才是不复制数据的元数据操作，因此依次尝试：数据目录下的
+    quarantine、卷根目录下的隐藏目录。位于 root 之内的候选（root 本身是卷根，或数据目录
+    在 root 下）不使用，否则隔离的内容仍在类别范围内，会被扫描计入、被清理再次处理；
+    此时返回 None，由调用方直接删除。
+    """
+    try:
+        st_dev = os.stat(root).st_dev
+    except OSError:
+        return None
+    candidates = (os.path.join(app_data_dir(), 'quarantine'),
+                  os.path.join(_mount_root(root, st_dev), QUARANTINE_NAME))
+    for candidate in candidates:
+        if _contains(root, candidate):
+            continue
+        try:
+            os.makedirs(candidate, exist_ok=True)
+            if os.stat(candidate).st_dev == st_dev:
+                return candidate
+        except OSError:
+            continue
+    return None
+
+
+class QuarantineBatch:
+    """一个类别的一个根目录被移入隔离区的内容
+
+    批次目录中 items 下按序号保存移入的条目，journal.jsonl 记录每个序号的原路径；
+    每行在对应的重命名之前写入，中途退出也能恢复已经移入的部分。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        name = os.path.basename(path)
+        created, _, self.category = name.partition('-')
+        try:
+            self.created = int(created) / 1e9
+        except ValueError:
+            self.created = 0
+
+    @classmethod
+    def create(cls, qdir, category):
+        path = os.path.join(qdir, f"{time.time_ns()}-{category}")
+        os.makedirs(os.path.join(path, 'items'))
+        return cls(path)
+
+    def __repr__(self):
+        return f"QuarantineBatch({self.path!r})"
+
+    def item_path(self, number):
+        return os.path.join(self.path, 'items', str(number))
+
+    def journal(self):
+        """返回 [(序号, 原路径), ...]"""
+        entries = []
+        try:
+            with open(os.path.join(self.path, 'journal.jsonl'), encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        entries.append((int(record['item']), record['path']))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return entries
+
+    def move_in(self, root, skip=()):
+        """把 root 下的条目逐个重命名到批次中，返回 (移入数, 失败数)"""
+        moved = failed = 0
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            return 0, 1
+        with open(os.path.join(self.path, 'journal.jsonl'), 'a', encoding='utf-8') as journal:
+            for number, entry in enumerate(entries):
+                if any(_contains(entry.path, path) for path in skip):
+                    # 隔离目录本身或其所在目录不能移入自己
+                    continue
+                journal.write(json.dumps({'item': number, 'path': entry.path},
+                                         ensure_ascii=False) + '\n')
+                journal.flush()
+                try:
+                    os.rename(entry.path, self.item_path(number))
+                except OSError:
+                    # 正在使用的文件、挂载点等无法移动，留在原处
+                    failed += 1
+                    continue
+                moved += 1
+        return moved, failed
+
+    def restore(self):
+        """把条目移回原处并删除批次，返回 (恢复数, 冲突数)
+
+        原位置已经有同名条目时，目录逐层合并，文件保留原位置上的新版本，
+        冲突的条目留在批次中。
+        """
+        restored = conflicts = 0
+        for number, original in self.journal():
+            item = self.item_path(number)
+            if not os.path.lexists(item):
+                continue
+            ok, clash = _move_back(item, original)
+            restored += ok
+            conflicts += clash
+        if not conflicts:
+            self.discard()
+        return restored, conflicts
+
+    def purge(self, control=None):
+        """真正删除批次的内容，返回 CleanResult
+
+        有条目未能删除时保留批次和日志，以便稍后重试或撤销。
+        """
+        result = clean_folder(os.path.join(self.path, 'items'), control=control)
+        if not result.failed and (control is None or not control.is_cancelled()):
+            self.discard()
+        return result
+
+    def discard(self):
+        try:
+            os.unlink(os.path.join(self.path, 'journal.jsonl'))
+        except OSError:
+            pass
+        for path in (os.path.join(self.path, 'items'), self.path):
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+
+def _move_back(item, original):
+    """返回 (恢复的条目数, 冲突数)"""
+    if not os.path.lexists(original):
+        try:
+            os.makedirs(os.path.dirname(original), exist_ok=True)
+            os.rename(item, original)
+            return 1, 0
+        except OSError:
+            return 0, 1
+    if not (os.path.isdir(item) and not os.path.islink(item)
+            and os.path.isdir(original) and not os.path.islink(original)):
+        return 0, 1
+    restored = conflicts = 0
+    try:
+        names = os.listdir(item)
+    except OSError:
+        return 0, 1
+    for name in names:
+        ok, clash = _move_back(os.path.join(item, name), os.path.join(original, name))
+        restored += ok
+        conflicts += clash
+    if not conflicts:
+        try:
+            os.rmdir(item)
+        except OSError:
+            pass
+    return restored, conflicts
+
+
+def can_quarantine(rule):
+    """带过滤条件（包含/排除模式、年龄、排除目录）的类别不能整体移动，仍逐个文件删除"""
+    return not (rule.filters_files or rule.filters_dirs or rule.action)
+
+
+def quarantine_category(category, control=None):
+    """把类别各根目录的内容移入隔离区，返回 ([QuarantineBatch, ...], CleanResult)
+
+    CleanResult 中 files 为移入的条目数（每个顶层文件或目录算一个），failed 为未能移入的条目数；
+    没有同一卷上可写的隔离目录时，该根目录的内容直接删除。
+    """
+    batches = []
+    result = CleanResult()
+    for root in category.resolve_roots():
+        if control is not None and control.is_cancelled():
+            break
+        if not os.path.isdir(root):
+            continue
+        qdir = quarantine_dir(root)
+        if qdir is None:
+            clean_folder(root, category, result, control)
+            continue
+        _remember_dir(qdir)
+        try:
+            batch = QuarantineBatch.create(qdir, category.key)
+        except OSError:
+            clean_folder(root, category, result, control)
+            continue
+        moved, failed = batch.move_in(root, skip=(qdir, app_data_dir()))
+        result.files += moved
+        result.failed += failed
+        if moved:
+            batches.append(batch)
+        else:
+            batch.discard()
+    return batches, result
+
+
+def pending_batches():
+    """返回所有尚未删除的批次，按创建时间排序"""
+    batches = []
+    for qdir in _load_dirs():
+        try:
+            names = os.listdir(qdir)
+        except OSError:
+            continue
+        batches.extend(QuarantineBatch(os.path.join(qdir, name)) for name in names
+                       if os.path.isdir(os.path.join(qdir, name, 'items')))
+    batches.sort(key=lambda batch: batch.created)
+    return batches
+
+
+def lower_thread_priority():
+    """降低当前线程的 CPU 和 I/O 优先级，用于后台删除"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        elif hasattr(os, 'setpriority'):
+            # Linux 下 nice 值按线程生效，I/O 调度优先级默认也随之降低
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (OSError, AttributeError):
+        pass
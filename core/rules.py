@@ -0,0 +1,186 @@
+import fnmatch
+import json
+import os
+import re
+import tempfile
+import time
+
+from .browsers import browser_cache_roots
+from .devjunk import dev_artifact_roots
+from .platforms import get_platform
+
+
+# 按名称引用的根目录解析器：以类别为参数，返回需要扫描的目录列表，用于无法写成固定路径的位置
+ROOT_RESOLVERS = {
+    'browser_cache': browser_cache_roots,
+    'dev_artifacts': dev_artifact_roots,
+}
+
+# 展开后仍残留 %VAR% 说明当前系统没有该环境变量（例如在非 Windows 系统上）
+_UNRESOLVED_VAR = re.compile(r'%[^%/\\]+%')
+
+
+class GlobSet:
+    """把一组 glob 编译成一个正则
+
+    不含 / 的模式匹配条目名称；含 / 的模式匹配路径结尾（相当于前面加了 */）。
+    Windows 下不区分大小写。
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns or ())
+        flags = re.IGNORECASE if os.name == 'nt' else 0
+        names = [fnmatch.translate(p) for p in self.patterns if '/' not in p.replace('\\', '/')]
+        paths = [fnmatch.translate('*/' + p.replace('\\', '/').lstrip('/'))
+                 for p in self.patterns if '/' in p.replace('\\', '/')]
+        self.name_re = re.compile('|'.join(names), flags) if names else None
+        self.path_re = re.compile('|'.join(paths), flags) if paths else None
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def matches(self, name, path):
+        if self.name_re is not None and self.name_re.match(name):
+            return True
+        if self.path_re is not None:
+            if os.sep != '/':
+                path = path.replace(os.sep, '/')
+            return self.path_re.match(path) is not None
+        return False
+
+
+class JunkCategory:
+    """一个垃圾类别的规则
+
+    roots 支持 ~、环境变量以及 {tempdir}/{home} 占位符；
+    include/exclude 过滤文件，exclude_dirs 命中的目录整棵子树都不计入该类别，
+    min_age_days / min_size 只统计足够旧（按整天计）、足够大的文件；
+    resolver 为 ROOT_RESOLVERS 中的名称，其返回的目录追加在 roots 之后，
+    options 为传给解析器的附加参数。
+    """
+
+    def __init__(self, key, label, roots, include=(), exclude=(), exclude_dirs=(),
+                 min_age_days=0, min_size=0, enabled=True, one_click=False, action=None,
+                 resolver=None, options=None):
+        self.key = key
+        self.label = label
+        self.roots = list(roots)
+        self.include = GlobSet(include)
+        self.exclude = GlobSet(exclude)
+        self.exclude_dirs = GlobSet(exclude_dirs)
+        self.min_age_days = min_age_days
+        self.min_size = min_size
+        self.enabled = enabled
+        self.one_click = one_click
+        self.action = action
+        self.resolver = resolver
+        self.options = dict(options or {})
+        # 与扫描结果的修改时间分布一样按整天（UTC 日期）计：修改日期距今天至少 min_age_days 天，
+        # 即修改时间早于该日期次日的零点
+        if min_age_days:
+            self.mtime_cutoff = (int(time.time() // 86400) - min_age_days + 1) * 86400
+        else:
+            self.mtime_cutoff = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            key=data['key'],
+            label=data.get('label', data['key']),
+            roots=data.get('roots', []),
+            include=data.get('include', ()),
+            exclude=data.get('exclude', ()),
+            exclude_dirs=data.get('exclude_dirs', ()),
+            min_age_days=data.get('min_age_days', 0),
+            min_size=data.get('min_size', 0),
+            enabled=data.get('enabled', True),
+            one_click=data.get('one_click', False),
+            action=data.get('action'),
+            resolver=data.get('resolver'),
+            options=data.get('options'),
+        )
+
+    def with_min_age(self, days):
+        """返回只匹配超过 days 天未修改文件的同名类别"""
+        return JunkCategory(
+            key=self.key,
+            label=self.label,
+            roots=self.roots,
+            include=self.include.patterns,
+            exclude=self.exclude.patterns,
+            exclude_dirs=self.exclude_dirs.patterns,
+            min_age_days=max(self.min_age_days, days),
+            min_size=self.min_size,
+            enabled=self.enabled,
+            one_click=self.one_click,
+            action=self.action,
+            resolver=self.resolver,
+            options=self.options,
+        )
+
+    @property
+    def filters_files(self):
+        return bool(self.include or self.exclude or self.mtime_cutoff is not None or self.min_size)
+
+    @property
+    def filters_dirs(self):
+        return bool(self.exclude_dirs)
+
+    def resolve_roots(self):
+        """展开根目录；无法解析的路径（缺少环境变量、相对路径）直接跳过"""
+        placeholders = {'tempdir': tempfile.gettempdir(), 'home': os.path.expanduser('~')}
+        roots = []
+        for root in self.roots:
+            path = os.path.expandvars(os.path.expanduser(root.format(**placeholders)))
+            if _UNRESOLVED_VAR.search(path) or not os.path.isabs(path):
+                continue
+            roots.append(os.path.normpath(path))
+        if self.resolver is not None:
+            resolve = ROOT_RESOLVERS.get(self.resolver)
+            if resolve is not None:
+                roots.extend(resolve(self))
+        return roots
+
+    def match_file(self, name, path, size, mtime):
+        if self.min_size and size < self.min_size:
+            return False
+        if self.mtime_cutoff is not None and mtime >= self.mtime_cutoff:
+            return False
+        if self.include and not self.include.matches(name, path):
+            return False
+        return not (self.exclude and self.exclude.matches(name, path))
+
+    def prunes_dir(self, name, path):
+        return bool(self.exclude_dirs) and self.exclude_dirs.matches(name, path)
+
+
+class CategoryRegistry:
+    """从数据文件加载的垃圾类别列表"""
+
+    def __init__(self, categories):
+        self.categories = list(categories)
+
+    @classmethod
+    def load(cls, path=None, platform=None):
+        """加载类别规则；不指定 path 时使用 platform（默认为当前系统）对应的规则文件"""
+        with open(path or get_platform(platform).rules_path(), encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(JunkCategory.from_dict(item) for item in data.get('categories', []))
+
+    def enabled(self):
+        return [category for category in self.categories if category.enabled]
+
+    def get(self, key):
+        for category in self.categories:
+            if category.key == key:
+                return category
+        return None
+
+    def scan_roots(self):
+        """返回 {类别: [根目录, ...]}，禁用的类别不参与扫描"""
+        return {category.key: category.resolve_roots() for category in self.enabled()}
+
+    def rules(self):
+        """返回需要逐条目判断的类别 {类别: JunkCategory}"""
+        return {category.key: category for category in self.enabled()
+                if category.filters_files or category.filters_dirs}
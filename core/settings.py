@@ -0,0 +1,44 @@
+import json
+import os
+
+
+DEFAULT_SETTINGS = {
+    # 扫描方式：'thread' 为多线程遍历，'process' 为多进程遍历
+    'scan_backend': 'thread',
+    # 扫描完成后是否监视文件夹变化并实时更新大小
+    'live_update': True,
+    # 是否把每次扫描的目录大小保存为快照（位于数据目录的 snapshots 下）
+    'save_snapshots': False,
+    # 扫描时是否记录待删除清单，清理时直接按清单删除而不再重新遍历；
+    # 记录清单时每个目录都要列出内容，扫描不能复用索引，因此默认关闭
+    'clean_manifest': False,
+    # 清理时是否先把类别内容移入同一卷上的隔离区，稍后在后台删除，期间可以撤销
+    'quarantine_clean': False,
+    # 扫描时是否识别硬链接（按 inode 去重）；Windows 上需要为每个文件额外 stat 一次，默认关闭
+    'detect_hard_links': os.name != 'nt',
+}
+
+
+def app_data_dir():
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'Plug-in box')
+
+
+def settings_path():
+    return os.path.join(app_data_dir(), 'settings.json')
+
+
+def load_settings():
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        with open(settings_path(), encoding='utf-8') as f:
+            settings.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def save_settings(settings):
+    os.makedirs(app_data_dir(), exist_ok=True)
+    with open(settings_path(), 'w', encoding='utf-8') as f:
+        json.dump(settings, f, ensure_ascii=False, indent=4)
@@ -0,0 +1,228 @@
+import argparse
+import gzip
+import heapq
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+
+from .settings import app_data_dir
+from .walker import TopN, format_size
+
+
+SNAPSHOT_FORMAT = 'plug-in-box-snapshot'
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_dir():
+    return os.path.join(app_data_dir(), 'snapshots')
+
+
+def default_snapshot_path():
+    return os.path.join(snapshot_dir(), time.strftime('scan-%Y%m%d-%H%M%S.jsonl.gz'))
+
+
+def portable_path(path):
+    """把用户目录替换为 ~ 并统一使用 /，使不同机器、不同用户的快照可以对比"""
+    path = os.fspath(path)
+    home = os.path.normcase(os.path.expanduser('~'))
+    if os.path.normcase(path[:len(home)]) == home and path[len(home):len(home) + 1] in ('', os.sep):
+        path = '~' + path[len(home):]
+    return path.replace(os.sep, '/')
+
+
+def _open(path, mode):
+    # 以 .gz 结尾的快照用 gzip 压缩，其余为纯文本 JSON-lines
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _record_key(line):
+    return json.loads(line)['path']
+
+
+class SnapshotWriter:
+    """把遍历中完成的目录写成按路径排序的快照
+
+    快照为 JSON-lines：第一行是头部（格式、版本、时间、主机名和各类别统计），
+    之后每行一个目录 {"path", "categories", "size", "files"}，按 path 升序，
+    size / files 为整棵子树的合计。目录记录先在内存中攒够 CHUNK_SIZE 条，
+    排序后写入临时文件，close() 时再多路归并，内存占用与目录总数无关。
+    多进程遍历时，子进程用同一个 spill_dir 写自己的有序分段，由父进程 adopt_runs() 接收。
+    """
+
+    CHUNK_SIZE = 100000
+
+    def __init__(self, path=None, spill_dir=None):
+        self.path = path
+        self.owns_spill_dir = spill_dir is None
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix='snapshot-')
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.runs = []
+        self.dirs = 0
+
+    def add_dir(self, path, owners, size, files):
+        line = json.dumps({'path': portable_path(path), 'categories': list(owners),
+                           'size': size, 'files': files}, ensure_ascii=False)
+        with self.lock:
+            self.buffer.append((portable_path(path), line))
+            self.dirs += 1
+            if len(self.buffer) >= self.CHUNK_SIZE:
+                self._spill()
+
+    def adopt_runs(self, runs):
+        with self.lock:
+            self.runs.extend(runs)
+
+    def _spill(self):
+        if not self.buffer:
+            return
+        self.buffer.sort()
+        fd, run = tempfile.mkstemp(suffix='.run', dir=self.spill_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for _, line in self.buffer:
+                f.write(line + '\n')
+        self.runs.append(run)
+        self.buffer = []
+
+    def finish_runs(self):
+        """只写出有序分段并返回其路径，供子进程把结果交回父进程"""
+        with self.lock:
+            self._spill()
+            return list(self.runs)
+
+    def close(self, categories, meta=None):
+        """归并所有分段，写出最终快照并返回其路径；categories 为 {类别: FolderStats}"""
+        header = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'host': platform.node(),
+            'categories': {name: stats.to_dict() for name, stats in categories.items()},
+        }
+        header.update(meta or {})
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self.lock:
+            self._spill()
+            files = [open(run, encoding='utf-8') for run in self.runs]
+            try:
+                with _open(self.path, 'w') as out:
+                    out.write(json.dumps(header, ensure_ascii=False) + '\n')
+                    for line in heapq.merge(*files, key=_record_key):
+                        out.write(line)
+            finally:
+                for f in files:
+                    f.close()
+        self.discard()
+        return self.path
+
+    def discard(self):
+        """删除临时分段，不写出快照"""
+        for run in self.runs:
+            try:
+                os.remove(run)
+            except OSError:
+                pass
+        self.runs = []
+        self.buffer = []
+        if self.owns_spill_dir:
+            try:
+                os.rmdir(self.spill_dir)
+            except OSError:
+                pass
+
+
+def read_snapshot(path):
+    """返回 (头部, 目录记录迭代器)；迭代器逐行读取，调用方负责读完或丢弃"""
+    f = _open(path, 'r')
+    try:
+        header = json.loads(f.readline() or '{}')
+    except ValueError:
+        f.close()
+        raise ValueError(f"{path} 不是有效的快照文件")
+    if header.get('format') != SNAPSHOT_FORMAT or header.get('version') != SNAPSHOT_VERSION:
+        f.close()
+        raise ValueError(f"不支持的快照格式：{header.get('format')} {header.get('version')}")
+
+    def records():
+        with f:
+            for line in f:
+                yield json.loads(line)
+
+    return header, records()
+
+
+def diff_snapshots(old_path, new_path, limit=20):
+    """流式比较两个快照，返回各类别的变化量和增长/减少最多的目录
+
+    两个快照都按路径排序，逐行归并即可，内存占用只与 limit 有关。
+    结果为 {'categories': {类别: 大小变化}, 'grew': [(变化, 路径, 旧大小, 新大小), ...],
+    'shrank': [...]}，列表按变化量绝对值降序。
+    """
+    old_header, old_records = read_snapshot(old_path)
+    new_header, new_records = read_snapshot(new_path)
+    old_categories = old_header.get('categories', {})
+    new_categories = new_header.get('categories', {})
+    categories = {}
+    for name in sorted(set(old_categories) | set(new_categories)):
+        categories[name] = (new_categories.get(name, {}).get('size', 0)
+                            - old_categories.get(name, {}).get('size', 0))
+
+    grew = TopN(limit)
+    shrank = TopN(limit)
+    old = next(old_records, None)
+    new = next(new_records, None)
+    while old is not None or new is not None:
+        if new is None or (old is not None and old['path'] < new['path']):
+            path, old_size, new_size = old['path'], old['size'], 0
+            old = next(old_records, None)
+        elif old is None or new['path'] < old['path']:
+            path, old_size, new_size = new['path'], 0, new['size']
+            new = next(new_records, None)
+        else:
+            path, old_size, new_size = old['path'], old['size'], new['size']
+            old = next(old_records, None)
+            new = next(new_records, None)
+        delta = new_size - old_size
+        if delta > 0:
+            grew.add(delta, (path, old_size, new_size))
+        elif delta < 0:
+            shrank.add(-delta, (path, old_size, new_size))
+    return {
+        'categories': categories,
+        'grew': [(delta, *item) for delta, item in grew.items()],
+        'shrank': [(-delta, *item) for delta, item in shrank.items()],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="比较两个扫描快照")
+    parser.add_argument('old')
+    parser.add_argument('new')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    args = parser.parse_args(argv)
+    result = diff_snapshots(args.old, args.new, args.limit)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=4))
+        return 0
+    for name, delta in result['categories'].items():
+        if delta:
+            sign = '+' if delta > 0 else '-'
+            print(f"{name}: {sign}{format_size(abs(delta))}")
+    for title, rows in (("增长最多的目录：", result['grew']), ("减少最多的目录：", result['shrank'])):
+        if rows:
+            print(title)
+            for delta, path, old_size, new_size in rows:
+                sign = '+' if delta > 0 else '-'
+                print(f"    {sign}{format_size(abs(delta))}  {path}"
+                      f"（{format_size(old_size)} -> {format_size(new_size)}）")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+import os
+import sys
+
+
+# 网络文件系统类型（Linux /proc/mounts 中的名称）
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ncpfs', 'fuse.sshfs', '9p', 'afs'}
+
+
+def _mount_table():
+    """返回 [(挂载点, 文件系统类型), ...]，按挂载点长度降序"""
+    mounts = []
+    try:
+        with open('/proc/mounts', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3:
+                    mount_point = fields[1].replace('\\040', ' ')
+                    mounts.append((mount_point, fields[2]))
+    except OSError:
+        pass
+    mounts.sort(key=lambda item: len(item[0]), reverse=True)
+    return mounts
+
+
+def filesystem_type(path):
+    """返回 path 所在挂载点的文件系统类型，无法判断时返回 None"""
+    path = os.path.realpath(path)
+    for mount_point, fs_type in _mount_table():
+        if path == mount_point or path.startswith(mount_point.rstrip('/') + '/'):
+            return fs_type
+    return None
+
+
+def _is_rotational(path):
+    """Linux 下通过 /sys/dev/block 判断设备是否为机械硬盘"""
+    try:
+        st_dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    block = f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"
+    # 分区自身没有 queue 目录，需要到所属磁盘上查找
+    for candidate in (os.path.join(block, 'queue', 'rotational'),
+                      os.path.join(block, '..', 'queue', 'rotational')):
+        try:
+            with open(candidate) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+
+def storage_kind(path):
+    """粗略判断存储类型：'network'、'hdd'、'ssd' 或 'unknown'"""
+    path = os.fspath(path)
+    if sys.platform == 'win32':
+        if path.startswith('\\\\') or path.startswith('//'):
+            return 'network'
+        return 'unknown'
+    fs_type = filesystem_type(path)
+    if fs_type in NETWORK_FS_TYPES:
+        return 'network'
+    rotational = _is_rotational(path)
+    if rotational is None:
+        return 'unknown'
+    return 'hdd' if rotational else 'ssd'
+
+
+def suggest_workers(path=None):
+    """根据 CPU 数和存储类型给出遍历线程数
+
+    机械硬盘和网络共享并发过高只会增加寻道和往返，限制为 2；
+    SSD 可以承受更深的队列。
+    """
+    cpus = os.cpu_count() or 4
+    kind = storage_kind(path) if path is not None else 'unknown'
+    if kind in ('hdd', 'network'):
+        return 2
+    if kind == 'ssd':
+        return min(32, cpus * 2)
+    return min(16, cpus)
+
+
+def suggest_delete_workers(path=None):
+    """根据存储类型给出同一设备上的并发删除线程数
+
+    删除只涉及元数据，等待的是设备而不是 CPU，SSD 上可以比遍历开更多线程；
+    机械硬盘并发删除只会来回寻道，只用 1 个线程；网络共享受往返延迟限制，用 2 个。
+    """
+    cpus = os.cpu_count() or 4
+    kind = storage_kind(path) if path is not None else 'unknown'
+    if kind == 'hdd':
+        return 1
+    if kind == 'network':
+        return 2
+    if kind == 'ssd':
+        return min(64, cpus * 4)
+    return min(16, cpus * 2)
+
+
+def cluster_size(path):
+    """返回 path 所在卷的分配单元大小，无法获取时返回 4096"""
+    if sys.platform != 'win32':
+        try:
+            return os.statvfs(path).f_frsize or 4096
+        except (OSError, AttributeError):
+            return 4096
+    try:
+        import ctypes
+        from ctypes import wintypes
+        drive = os.path.splitdrive(os.path.abspath(path))[0] + '\\'
+        sectors = wintypes.DWORD()
+        bytes_per_sector = wintypes.DWORD()
+        free_clusters = wintypes.DWORD()
+        total_clusters = wintypes.DWORD()
+        if ctypes.windll.kernel32.GetDiskFreeSpaceW(
+                drive, ctypes.byref(sectors), ctypes.byref(bytes_per_sector),
+                ctypes.byref(free_clusters), ctypes.byref(total_clusters)):
+            return sectors.value * bytes_per_sector.value or 4096
+    except (OSError, AttributeError, ValueError):
+        pass
+    return 4096
+
+
+def compressed_file_size(path):
+    """Windows 下返回稀疏/压缩文件实际占用的字节数，失败时返回 None"""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        high = wintypes.DWORD()
+        low = ctypes.windll.kernel32.GetCompressedFileSizeW(path, ctypes.byref(high))
+        if low == 0xFFFFFFFF and ctypes.GetLastError():
+            return None
+        return (high.value << 32) + low
+    except (OSError, AttributeError, ValueError):
+        return None
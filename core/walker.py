@@ -0,0 +1,975 @@
+import heapq
+import os
+from bisect import bisect_left, bisect_right
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from .storage import cluster_size, compressed_file_size
+
+
+FILE_ATTRIBUTE_SPARSE_FILE = 0x200
+FILE_ATTRIBUTE_COMPRESSED = 0x800
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# 遍历中跳过的条目类型：符号链接/联接点、其他设备上的挂载点、重复访问的目录
+SKIP_KINDS = ('links', 'mounts', 'cycles')
+
+# 每个类别保留的最大文件 / 最大目录条数
+TOP_N = 10
+
+# 文件年龄（按修改时间，单位天）直方图的分界点，大致按对数间隔
+AGE_EDGES_DAYS = (1, 3, 7, 14, 30, 60, 90, 180, 365, 730)
+# 文件大小直方图按 size.bit_length() 分桶：第 b 桶为 [2^(b-1), 2^b) 字节
+SIZE_BUCKETS = 48
+
+
+def age_bucket(age_days):
+    return bisect_right(AGE_EDGES_DAYS, age_days)
+
+
+def size_bucket(size):
+    return min(size.bit_length(), SIZE_BUCKETS - 1)
+
+
+def bucket_key(mtime, size):
+    """遍历时按 (修改日期, 大小位数) 合并文件的键：纪元天数左移 6 位再加 size.bit_length()"""
+    return int(mtime // 86400) << 6 | size.bit_length()
+
+
+def size_bucket_of_key(key):
+    return min(key & 63, SIZE_BUCKETS - 1)
+
+
+class TopN:
+    """只保留最大的 n 项的小顶堆，内存占用与遍历规模无关"""
+
+    __slots__ = ('n', 'heap')
+
+    def __init__(self, n, items=()):
+        self.n = n
+        self.heap = []
+        for size, item in items:
+            self.add(size, item)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, size, item):
+        heap = self.heap
+        if len(heap) < self.n:
+            heapq.heappush(heap, (size, item))
+        elif size > heap[0][0]:
+            heapq.heapreplace(heap, (size, item))
+
+    def merge(self, other):
+        for size, item in other.heap:
+            self.add(size, item)
+        return self
+
+    def items(self):
+        """按大小降序返回 [(size, item), ...]"""
+        return sorted(self.heap, reverse=True)
+
+
+class FolderStats:
+    """一次遍历得到的目录统计
+
+    size 为逻辑大小，allocated 为实际占用的磁盘空间（稀疏、压缩文件会小于 size），
+    多链接文件按 (st_dev, st_ino) 只计一次；reclaimable 为删除该类别后真正能释放的空间，
+    不包括在类别之外仍有其他硬链接的文件。
+    estimated 为 True 表示遍历因预算耗尽或被取消而提前结束，数值只是下限。
+    top_files / top_dirs 为遍历中顺带记录的最大文件和最大目录 [(size, path), ...]，
+    按大小降序；目录大小为其整棵子树中全部文件的逻辑大小。
+    age_histogram 按 AGE_EDGES_DAYS 分桶，每桶为 [文件数, 大小, 占用空间]；
+    size_histogram 按 size_bucket() 分桶，每桶为 [文件数, 大小]。没有文件时为 None。
+    """
+
+    __slots__ = ('size', 'allocated', 'reclaimable', 'files', 'dirs', 'estimated',
+                 'top_files', 'top_dirs', 'age_histogram', 'size_histogram')
+
+    def __init__(self, size=0, files=0, dirs=0, estimated=False, allocated=0, reclaimable=0,
+                 top_files=(), top_dirs=(), age_histogram=None, size_histogram=None):
+        self.size = size
+        self.allocated = allocated
+        self.reclaimable = reclaimable
+        self.files = files
+        self.dirs = dirs
+        self.estimated = estimated
+        self.top_files = list(top_files)
+        self.top_dirs = list(top_dirs)
+        self.age_histogram = [list(row) for row in age_histogram] if age_histogram else None
+        self.size_histogram = [list(row) for row in size_histogram] if size_histogram else None
+
+    def merge(self, other, limit=TOP_N):
+        self.size += other.size
+        self.allocated += other.allocated
+        self.reclaimable += other.reclaimable
+        self.files += other.files
+        self.dirs += other.dirs
+        self.estimated = self.estimated or other.estimated
+        if other.top_files:
+            self.top_files = heapq.nlargest(limit, self.top_files + other.top_files)
+        if other.top_dirs:
+            self.top_dirs = heapq.nlargest(limit, self.top_dirs + other.top_dirs)
+        if other.age_histogram:
+            self.age_histogram = _add_rows(self.age_histogram, other.age_histogram)
+        if other.size_histogram:
+            self.size_histogram = _add_rows(self.size_histogram, other.size_histogram)
+        return self
+
+    def older_than(self, days):
+        """返回修改时间早于 days 天的 (文件数, 大小, 占用空间)，days 须为 AGE_EDGES_DAYS 之一"""
+        if days not in AGE_EDGES_DAYS:
+            raise ValueError(f"days must be one of {AGE_EDGES_DAYS}")
+        files = size = allocated = 0
+        for row in (self.age_histogram or ())[bisect_left(AGE_EDGES_DAYS, days) + 1:]:
+            files += row[0]
+            size += row[1]
+            allocated += row[2]
+        return files, size, allocated
+
+    def to_dict(self):
+        return {'size': self.size, 'allocated': self.allocated, 'reclaimable': self.reclaimable,
+                'files': self.files, 'dirs': self.dirs, 'estimated': self.estimated,
+                'top_files': [list(item) for item in self.top_files],
+                'top_dirs': [list(item) for item in self.top_dirs],
+                'age_histogram': self.age_histogram, 'size_histogram': self.size_histogram}
+
+    def as_tuple(self):
+        return (self.size, self.files, self.dirs, self.estimated, self.allocated, self.reclaimable,
+                tuple(self.top_files), tuple(self.top_dirs), self.age_histogram,
+                self.size_histogram)
+
+    @classmethod
+    def from_tuple(cls, values):
+        return cls(*values)
+
+    def __repr__(self):
+        return (f"FolderStats(size={self.size}, files={self.files}, dirs={self.dirs}"
+                f"{', estimated=True' if self.estimated else ''})")
+
+
+def _add_rows(rows, other):
+    if rows is None:
+        return [list(row) for row in other]
+    for row, values in zip(rows, other):
+        for i, value in enumerate(values):
+            row[i] += value
+    return rows
+
+
+def _tally(table, key, values):
+    """把 values 逐项累加到 table[key]"""
+    row = table.get(key)
+    if row is None:
+        table[key] = list(values)
+    else:
+        for i, value in enumerate(values):
+            row[i] += value
+
+
+class LinkTable:
+    """多链接文件（st_nlink > 1）的登记表，按 (st_dev, st_ino) 去重
+
+    记录每个类别看到了某个 inode 的几个链接：只有全部链接都在类别内，
+    删除该类别才会真正释放这份空间。
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.inodes = {}
+
+    def add(self, key, nlink, allocated, owners):
+        """登记一个链接，返回首次看到该 inode 的类别"""
+        with self.lock:
+            record = self.inodes.get(key)
+            if record is None:
+                record = self.inodes[key] = [nlink, allocated, {}]
+            counts = record[2]
+            first = set()
+            for owner in owners:
+                if owner not in counts:
+                    first.add(owner)
+                    counts[owner] = 0
+                counts[owner] += 1
+            return first
+
+    def reclaimable(self, owner):
+        with self.lock:
+            return sum(allocated for nlink, allocated, counts in self.inodes.values()
+                       if counts.get(owner, 0) >= nlink)
+
+
+class ScanControl:
+    """扫描的协作式取消与单次遍历预算
+
+    time_budget 为每个遍历根允许的秒数，entry_budget 为允许访问的条目数，
+    None 表示不限。遍历在每个目录及每隔 CHECK_INTERVAL 个条目检查一次。
+    """
+
+    CHECK_INTERVAL = 1024
+
+    def __init__(self, time_budget=None, entry_budget=None):
+        self.time_budget = time_budget
+        self.entry_budget = entry_budget
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def deadline(self):
+        if self.time_budget is None:
+            return None
+        return time.monotonic() + self.time_budget
+
+    def exhausted(self, deadline, entries):
+        if self.cancelled.is_set():
+            return True
+        if self.entry_budget is not None and entries >= self.entry_budget:
+            return True
+        return deadline is not None and time.monotonic() >= deadline
+
+
+class ScanProgress:
+    """多个遍历线程共享的进度计数
+
+    按目录汇总后再累加，锁的开销与文件数无关。百分比取
+    已完成目录 / max(已发现目录, 索引中记录的上次目录数)，
+    随着发现新目录可能回落，展示时应取单调最大值。
+    skipped 累计各遍历跳过的链接、挂载点和循环目录数。
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.dirs_expected = 0
+        self.dirs_found = 0
+        self.dirs_done = 0
+        self.files = 0
+        self.size = 0
+        self.skipped = dict.fromkeys(SKIP_KINDS, 0)
+
+    def add(self, found=0, done=0, files=0, size=0, expected=0):
+        with self.lock:
+            self.dirs_expected += expected
+            self.dirs_found += found
+            self.dirs_done += done
+            self.files += files
+            self.size += size
+
+    def add_skipped(self, skipped):
+        with self.lock:
+            for kind, count in skipped.items():
+                self.skipped[kind] += count
+
+    def percent(self):
+        with self.lock:
+            total = max(self.dirs_found, self.dirs_expected)
+            if not total:
+                return 0
+            return int(self.dirs_done * 100 / total)
+
+    def snapshot(self):
+        with self.lock:
+            return self.dirs_done, self.files, self.size
+
+
+def format_size(size):
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.2f} {unit}"
+        size /= 1024
+    return f"{size:.2f} TB"
+
+
+def normalize_path(path):
+    """展开变量并解析符号链接/联接点，得到可用于比较的规范路径"""
+    path = os.path.expandvars(os.path.expanduser(os.fspath(path)))
+    return os.path.normcase(os.path.realpath(path))
+
+
+# mtime 距扫描开始不足该时长的目录不写入索引，避免同一时间粒度内的修改被漏掉
+INDEX_MTIME_SLACK_NS = 2 * 10**9
+
+
+class _DirNode:
+    """遍历中尚未完成的目录：pending 为自身加上未完成的子目录数，
+    归零时子树大小和文件数确定，计入最大目录、写入快照并累加到父目录"""
+
+    __slots__ = ('path', 'owners', 'parent', 'pending', 'size', 'files')
+
+    def __init__(self, path, owners, parent):
+        self.path = path
+        self.owners = owners
+        self.parent = parent
+        self.pending = 1
+        self.size = 0
+        self.files = 0
+
+
+class _WalkLocal:
+    """单个线程在一次遍历中的私有累加结果，避免线程间争用同一个 FolderStats"""
+
+    __slots__ = ('results', 'fresh', 'stats_cache', 'top_files', 'top_dirs', 'skipped', 'buckets')
+
+    def __init__(self):
+        self.results = {}
+        self.fresh = {}
+        self.stats_cache = {}
+        self.skipped = dict.fromkeys(SKIP_KINDS, 0)
+        # 最大文件按类别组合记录（快速路径每个文件只入堆一次），最大目录按类别记录
+        self.top_files = {}
+        self.top_dirs = {}
+        # 直方图的原始数据 {类别: {bucket_key(): [文件数, 大小, 占用空间]}}，
+        # 结束时再换算成相对今天的年龄分桶和大小分桶
+        self.buckets = {}
+
+    def buckets_for(self, owner):
+        table = self.buckets.get(owner)
+        if table is None:
+            table = self.buckets[owner] = {}
+        return table
+
+    def top_for(self, tops, key, n):
+        top = tops.get(key)
+        if top is None:
+            top = tops[key] = TopN(n)
+        return top
+
+    def stats_for(self, owners):
+        stats = self.stats_cache.get(owners)
+        if stats is None:
+            stats = []
+            for owner in owners:
+                if owner not in self.results:
+                    self.results[owner] = FolderStats()
+                stats.append(self.results[owner])
+            self.stats_cache[owners] = stats
+        return stats
+
+
+class TreeWalk:
+    """对单个根目录的一次遍历，把字节数记到每个声明了该子树的类别上
+
+    claims 为 {规范化路径: (类别, ...)}，可以包含 root 本身及其任意子目录。
+    进入某个子目录时，若该目录在 claims 中，则它下面的条目同时计入这些类别。
+    传入 index（ScanIndex）时，mtime 未变的目录直接复用索引中的聚合结果。
+    传入 progress（ScanProgress）时，每处理完一个目录就累加一次进度。
+    传入 control（ScanControl）时，取消或预算耗尽会提前结束，结果标记为 estimated。
+
+    run() 在当前线程中串行完成遍历；也可以交给 WalkPool，由多个线程按目录分工完成，
+    max_workers 限制同时参与这次遍历的线程数。root_owners 用于遍历某个子树时
+    指定从上层继承的类别。rules 为 {类别: JunkCategory}，
+    只有带过滤条件的类别才需要逐条目判断，其余类别走无规则的快速路径。
+    links 为多个遍历共享的 LinkTable；link_aware 控制是否识别硬链接，
+    默认在 POSIX 上开启（stat 信息已包含链接数），在 Windows 上关闭。
+    top_n 为每个类别记录的最大文件 / 最大目录条数，0 表示不记录。
+    snapshot（SnapshotWriter）用于记录每个完整遍历过的目录的子树大小和文件数。
+    manifest（DeletionManifest）用于记录计入各类别的每个文件，供清理时直接使用；
+    此时目录必须逐个列出，索引只写入、不复用。
+
+    默认不跟随符号链接和联接点（follow_links），也不进入其他设备上挂载的文件系统
+    （cross_devices，只在 POSIX 上按 st_dev 判断；Windows 的卷挂载点本身是联接点）。
+    目录按 (st_dev, st_ino) 去重以防 bind mount 等造成的循环，这需要为每个目录
+    保存一个键。跳过的条目数合并后保存在 skipped 中；复用索引记录的目录不再列出内容，
+    其中指向文件的链接不会被计数。
+    """
+
+    def __init__(self, root, claims, index=None, progress=None, control=None, max_workers=None,
+                 root_owners=None, rules=None, links=None, link_aware=None, top_n=TOP_N,
+                 follow_links=False, cross_devices=False, snapshot=None, manifest=None):
+        self.root = os.fspath(root)
+        self.top_n = top_n
+        self.snapshot = snapshot
+        self.manifest = manifest
+        # 需要子树汇总时才为每个目录建立节点
+        self.track_dirs = bool(top_n) or snapshot is not None
+        self.follow_links = follow_links
+        self.skipped = dict.fromkeys(SKIP_KINDS, 0)
+        try:
+            root_stat = os.stat(self.root)
+        except OSError:
+            root_stat = None
+        self.root_dev = None
+        if not cross_devices and os.name != 'nt' and root_stat is not None:
+            self.root_dev = root_stat.st_dev
+        # Windows 下 DirEntry.stat() 不提供 st_ino，只有跟随链接时才需要额外 stat 去重
+        self.visited = None
+        if os.name != 'nt' or follow_links:
+            self.visited = set()
+            if root_stat is not None:
+                self.visited.add((root_stat.st_dev, root_stat.st_ino))
+        self.visit_lock = threading.Lock()
+        self.check_dirs = self.root_dev is not None or self.visited is not None or os.name == 'nt'
+        # 根目录整棵子树的大小和文件数，遍历完整结束后才有值
+        self.root_size = None
+        self.root_files = None
+        # 多个遍历共享 links 时由调用方负责结算（ScanPlan.settle）
+        self.owns_links = links is None
+        self.links = links if links is not None else LinkTable()
+        # Windows 下 DirEntry.stat() 不提供 st_nlink/st_ino，需要额外 stat 才能识别硬链接
+        self.link_aware = (os.name != 'nt') if link_aware is None else link_aware
+        self.cluster = cluster_size(self.root) if os.name == 'nt' else None
+        self.claims = claims
+        self.root_owners = root_owners
+        self.rules = rules or {}
+        self.profiles = {}
+        self.nested = len(claims) > 1
+        self.index = index
+        self.progress = progress
+        self.control = control
+        self.max_workers = max_workers
+        self.cached = index.load(self.root) if index is not None else {}
+        self.fresh_before = time.time_ns() - INDEX_MTIME_SLACK_NS
+        self.started = time.time()
+        self.deadline = None
+        self.lock = threading.Lock()
+        self.locals = {}
+        self.entries_seen = 0
+        self.stopped = False
+        if progress is not None:
+            progress.add(found=1, expected=len(self.cached))
+
+    def root_item(self):
+        owners = self.root_owners
+        if owners is None:
+            owners = self.claims.get(os.path.normcase(self.root), ())
+        return (self.root, owners, None, None)
+
+    def local_for(self, worker):
+        local = self.locals.get(worker)
+        if local is None:
+            with self.lock:
+                local = self.locals.setdefault(worker, _WalkLocal())
+        return local
+
+    def accepts(self, worker):
+        """线程数已达上限时，不让新线程加入这次遍历"""
+        return (self.max_workers is None or worker in self.locals
+                or len(self.locals) < self.max_workers)
+
+    def should_stop(self, entries=0):
+        if entries:
+            with self.lock:
+                self.entries_seen += entries
+        if not self.stopped and self.control is not None:
+            # 时间预算从真正开始遍历时算起，而不是从排队时算起
+            if self.deadline is None:
+                self.deadline = self.control.deadline()
+            if self.control.exhausted(self.deadline, self.entries_seen):
+                self.stopped = True
+        return self.stopped
+
+    def profile(self, owners):
+        """返回 (逐文件规则, 是否需要剪枝目录)；没有任何规则的类别组合走快速路径"""
+        profile = self.profiles.get(owners)
+        if profile is None:
+            rules = [self.rules.get(owner) for owner in owners]
+            file_rules = tuple(rule if rule is not None and rule.filters_files else None
+                               for rule in rules)
+            profile = (file_rules if any(file_rules) else None,
+                       any(rule is not None and rule.filters_dirs for rule in rules))
+            self.profiles[owners] = profile
+        return profile
+
+    def descend(self, path, name, owners, prune):
+        """返回 (计入该子目录的类别, 进入该子目录后的类别)"""
+        kept = owners
+        if prune:
+            kept = tuple(owner for owner in owners
+                         if owner not in self.rules or not self.rules[owner].prunes_dir(name, path))
+        child = kept
+        if self.nested:
+            extra = self.claims.get(os.path.normcase(path))
+            if extra:
+                child = kept + tuple(c for c in extra if c not in kept)
+        return kept, child
+
+    def allocation(self, path, st):
+        """文件实际占用的磁盘空间"""
+        if self.cluster is None:
+            return st.st_blocks * 512
+        if st.st_file_attributes & (FILE_ATTRIBUTE_SPARSE_FILE | FILE_ATTRIBUTE_COMPRESSED):
+            size = compressed_file_size(path)
+            if size is not None:
+                return size
+        return -(-st.st_size // self.cluster) * self.cluster
+
+    def skip_dir(self, path, st):
+        """返回跳过该目录的原因（SKIP_KINDS 之一），需要进入时返回 None"""
+        if os.name == 'nt' and not self.follow_links and st.st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+            return 'links'
+        if self.root_dev is not None and st.st_dev != self.root_dev:
+            return 'mounts'
+        if self.visited is not None:
+            if not st.st_ino:
+                st = os.stat(path)
+            key = (st.st_dev, st.st_ino)
+            with self.visit_lock:
+                if key in self.visited:
+                    return 'cycles'
+                self.visited.add(key)
+        return None
+
+    def process(self, item, local, push):
+        """处理一个目录：累加其直接文件，把子目录交给 push
+
+        条目为 (路径, 类别, mtime_ns, 父目录节点)。子目录在 process 返回后才会被
+        其他线程取走，因此登记子目录数时无需加锁。
+        """
+        node = _DirNode(item[0], item[1], item[3]) if self.track_dirs else None
+        size, files = self.visit(item, node, local, push)
+        self.complete(node, size, files, local)
+
+    def complete(self, node, size, files, local):
+        """目录自身处理完毕：子树全部完成的目录计入各类别的最大目录，并向上累加"""
+        if node is None:
+            return
+        finished = []
+        with self.lock:
+            node.size += size
+            node.files += files
+            node.pending -= 1
+            while not node.pending:
+                finished.append(node)
+                parent = node.parent
+                if parent is None:
+                    break
+                parent.size += node.size
+                parent.files += node.files
+                parent.pending -= 1
+                node = parent
+        for node in finished:
+            if self.snapshot is not None and (node.parent is not None or self.root_owners is None):
+                # 子树遍历（root_owners 不为空）的根由上层遍历负责记录
+                self.snapshot.add_dir(node.path, node.owners, node.size, node.files)
+            if node.parent is None:
+                self.root_size = node.size
+                self.root_files = node.files
+                continue
+            if not self.top_n:
+                continue
+            owners = node.owners
+            if self.nested:
+                # 类别自身的根目录不算作它的"最大目录"
+                claimed = self.claims.get(os.path.normcase(node.path), ())
+                owners = tuple(owner for owner in owners if owner not in claimed)
+            for owner in owners:
+                local.top_for(local.top_dirs, owner, self.top_n).add(node.size, node.path)
+
+    def visit(self, item, node, local, push):
+        """列出一个目录，返回其直接文件的 (逻辑大小, 文件数)"""
+        current, owners, mtime_ns, _ = item
+        top_n = self.top_n
+        stats = local.stats_for(owners)
+        file_rules, prune = self.profile(owners)
+        progress = self.progress
+        # 带逐文件规则的目录，其聚合结果依赖规则和当前时间，不使用索引
+        use_index = self.index is not None and file_rules is None
+        if use_index:
+            if mtime_ns is None:
+                try:
+                    mtime_ns = os.lstat(current).st_mtime_ns
+                except OSError:
+                    if progress is not None:
+                        progress.add(done=1)
+                    return 0, 0
+            record = self.cached.get(current) if self.manifest is None else None
+            if record is not None and record[0] == mtime_ns:
+                # 目录未变化：复用直接文件的聚合结果，只继续检查子目录
+                local.fresh[current] = record
+                _, size, allocated, files, children, largest, dir_buckets = record
+                if top_n and largest:
+                    top = local.top_for(local.top_files, owners, top_n)
+                    for file_size, name in largest:
+                        top.add(file_size, os.path.join(current, name))
+                for owner in owners:
+                    table = local.buckets_for(owner)
+                    for key, *values in dir_buckets:
+                        _tally(table, key, values)
+                for st in stats:
+                    st.size += size
+                    st.allocated += allocated
+                    st.reclaimable += allocated
+                    st.files += files
+                found = 0
+                for name in children:
+                    path = os.path.join(current, name)
+                    # 子目录可能在两次扫描之间变成了挂载点或链接，仍需逐个检查
+                    try:
+                        st_dir = os.stat(path, follow_symlinks=self.follow_links)
+                    except OSError:
+                        continue
+                    skip = self.check_dirs and self.skip_dir(path, st_dir)
+                    if skip:
+                        local.skipped[skip] += 1
+                        continue
+                    kept, child = self.descend(path, name, owners, prune)
+                    for st in (stats if kept is owners else local.stats_for(kept)):
+                        st.dirs += 1
+                    if child:
+                        found += 1
+                        if node is not None:
+                            node.pending += 1
+                        push((path, child, st_dir.st_mtime_ns, node))
+                if progress is not None:
+                    progress.add(found=found, done=1, files=files, size=size)
+                self.should_stop(files + len(children))
+                return size, files
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            if progress is not None:
+                progress.add(done=1)
+            return 0, 0
+        check_interval = self.control.CHECK_INTERVAL if self.control is not None else 0
+        follow = self.follow_links
+        seen = 0
+        stopped = False
+        dir_dirs = dir_size = dir_allocated = dir_files = dir_linked = 0
+        children = []
+        # 快速路径下先按目录收集最大的直接文件（只存名称），结束时再计入类别并写入索引
+        dir_top = TopN(top_n) if top_n and file_rules is None else None
+        # 同理按目录收集直方图原始数据，见 _WalkLocal.buckets
+        dir_buckets = {}
+        # 需要清单时按类别组合收集文件，并收集链接，见 DeletionManifest.add
+        listed = {} if self.manifest is not None else None
+        links = []
+        with entries:
+            for entry in entries:
+                seen += 1
+                if check_interval and not seen % check_interval and self.should_stop(check_interval):
+                    stopped = True
+                    break
+                try:
+                    if entry.is_dir(follow_symlinks=follow):
+                        child_mtime = None
+                        if self.check_dirs or self.index is not None:
+                            st_dir = entry.stat(follow_symlinks=follow)
+                            child_mtime = st_dir.st_mtime_ns
+                            if self.index is not None:
+                                children.append(entry.name)
+                            skip = self.check_dirs and self.skip_dir(entry.path, st_dir)
+                            if skip:
+                                local.skipped[skip] += 1
+                                if skip == 'links' and listed is not None:
+                                    links.append(entry.name)
+                                continue
+                        kept, child = self.descend(entry.path, entry.name, owners, prune)
+                        for st in (stats if kept is owners else local.stats_for(kept)):
+                            st.dirs += 1
+                        if child:
+                            dir_dirs += 1
+                            if node is not None:
+                                node.pending += 1
+                            push((entry.path, child, child_mtime, node))
+                    elif entry.is_file(follow_symlinks=follow):
+                        st_entry = entry.stat(follow_symlinks=follow)
+                        size = st_entry.st_size
+                        allocated = self.allocation(entry.path, st_entry)
+                        key = bucket_key(st_entry.st_mtime, size)
+                        dir_size += size
+                        dir_files += 1
+                        if file_rules is None:
+                            targets, target_owners = stats, owners
+                        else:
+                            targets, target_owners = [], []
+                            for owner, st, rule in zip(owners, stats, file_rules):
+                                if rule is None or rule.match_file(entry.name, entry.path,
+                                                                   size, st_entry.st_mtime):
+                                    targets.append(st)
+                                    target_owners.append(owner)
+                        if listed is not None and target_owners:
+                            group = listed.get(tuple(target_owners))
+                            if group is None:
+                                group = listed[tuple(target_owners)] = ([], [], [])
+                            group[0].append(entry.name)
+                            group[1].append(size)
+                            group[2].append(st_entry.st_mtime_ns)
+                        if self.link_aware and os.name == 'nt':
+                            st_entry = os.lstat(entry.path)
+                        if self.link_aware and st_entry.st_nlink > 1:
+                            # 硬链接：逻辑大小和占用空间只在第一次看到该 inode 时计入
+                            dir_linked += 1
+                            first = self.links.add((st_entry.st_dev, st_entry.st_ino),
+                                                   st_entry.st_nlink, allocated, target_owners)
+                            for owner, st in zip(target_owners, targets):
+                                st.files += 1
+                                if owner in first:
+                                    st.size += size
+                                    st.allocated += allocated
+                                    _tally(local.buckets_for(owner), key, (1, size, allocated))
+                            # 同一 inode 的多个链接也只进入一次最大文件列表
+                            top_owners = tuple(owner for owner in target_owners if owner in first)
+                            if top_n and top_owners:
+                                local.top_for(local.top_files, top_owners,
+                                              top_n).add(size, entry.path)
+                        else:
+                            if dir_top is not None:
+                                dir_top.add(size, entry.name)
+                            elif top_n and target_owners:
+                                local.top_for(local.top_files, tuple(target_owners),
+                                              top_n).add(size, entry.path)
+                            dir_allocated += allocated
+                            for st in targets:
+                                st.files += 1
+                                st.size += size
+                                st.allocated += allocated
+                                st.reclaimable += allocated
+                            if file_rules is None:
+                                row = dir_buckets.get(key)
+                                if row is None:
+                                    dir_buckets[key] = [1, size, allocated]
+                                else:
+                                    row[0] += 1
+                                    row[1] += size
+                                    row[2] += allocated
+                            else:
+                                for owner in target_owners:
+                                    _tally(local.buckets_for(owner), key, (1, size, allocated))
+                    elif entry.is_symlink():
+                        # 指向文件或失效的符号链接：本身几乎不占空间，只计数
+                        local.skipped['links'] += 1
+                        if listed is not None:
+                            links.append(entry.name)
+                except OSError:
+                    pass
+        if listed is not None and owners:
+            self.manifest.add(current, owners, listed, links)
+        largest = ()
+        if dir_top:
+            largest = tuple(dir_top.items())
+            top = local.top_for(local.top_files, owners, top_n)
+            for file_size, name in largest:
+                top.add(file_size, os.path.join(current, name))
+        if dir_buckets:
+            for owner in owners:
+                table = local.buckets_for(owner)
+                for key, values in dir_buckets.items():
+                    _tally(table, key, values)
+        if progress is not None:
+            progress.add(found=dir_dirs, done=1, files=dir_files, size=dir_size)
+        if stopped or self.should_stop(seen % check_interval if check_interval else seen):
+            return dir_size, dir_files
+        # 含硬链接的目录每次都要重新登记链接，不写入索引
+        if use_index and not dir_linked and mtime_ns < self.fresh_before:
+            local.fresh[current] = (mtime_ns, dir_size, dir_allocated, dir_files, tuple(children),
+                                    largest,
+                                    tuple((key, *values) for key, values in dir_buckets.items()))
+        return dir_size, dir_files
+
+    def finish(self, skipped=0):
+        """合并各线程的结果并写回索引，返回 {类别: FolderStats}"""
+        results = {}
+        fresh = {}
+        top_files = {}
+        top_dirs = {}
+        buckets = {}
+        limit = self.top_n
+        for local in self.locals.values():
+            for name, stats in local.results.items():
+                results.setdefault(name, FolderStats()).merge(stats, limit)
+            fresh.update(local.fresh)
+            for kind, count in local.skipped.items():
+                self.skipped[kind] += count
+            for owners, top in local.top_files.items():
+                for owner in owners:
+                    self.merge_top(top_files, owner, top)
+            for owner, top in local.top_dirs.items():
+                self.merge_top(top_dirs, owner, top)
+            for owner, table in local.buckets.items():
+                merged = buckets.setdefault(owner, {})
+                for key, values in table.items():
+                    _tally(merged, key, values)
+        today = int(self.started // 86400)
+        for name, table in buckets.items():
+            ages = [[0, 0, 0] for _ in range(len(AGE_EDGES_DAYS) + 1)]
+            sizes = [[0, 0] for _ in range(SIZE_BUCKETS)]
+            for key, (files, size, allocated) in table.items():
+                row = ages[age_bucket(max(0, today - (key >> 6)))]
+                row[0] += files
+                row[1] += size
+                row[2] += allocated
+                row = sizes[size_bucket_of_key(key)]
+                row[0] += files
+                row[1] += size
+            results.setdefault(name, FolderStats()).merge(
+                FolderStats(age_histogram=ages, size_histogram=sizes))
+        for name, top in top_files.items():
+            stats = results.setdefault(name, FolderStats())
+            stats.top_files = heapq.nlargest(limit, stats.top_files + top.items())
+        for name, top in top_dirs.items():
+            stats = results.setdefault(name, FolderStats())
+            stats.top_dirs = heapq.nlargest(limit, stats.top_dirs + top.items())
+        if self.owns_links:
+            for name, stats in results.items():
+                stats.reclaimable += self.links.reclaimable(name)
+        if self.stopped:
+            # 提前结束：结果是下限；未访问的目录计为完成，保留其索引记录供下次校验
+            for owners in self.claims.values():
+                for owner in owners:
+                    results.setdefault(owner, FolderStats())
+            for stats in results.values():
+                stats.estimated = True
+            if self.progress is not None and skipped:
+                self.progress.add(done=skipped)
+            cached = dict(self.cached)
+            cached.update(fresh)
+            fresh = cached
+        if self.progress is not None:
+            self.progress.add_skipped(self.skipped)
+        if self.index is not None:
+            self.index.save(self.root, fresh)
+        return results
+
+    def merge_top(self, tops, key, top):
+        merged = tops.get(key)
+        if merged is None:
+            merged = tops[key] = TopN(self.top_n)
+        merged.merge(top)
+
+    def run(self):
+        local = self.local_for(None)
+        stack = [self.root_item()]
+        while stack:
+            if self.should_stop():
+                break
+            self.process(stack.pop(), local, stack.append)
+        return self.finish(skipped=len(stack))
+
+
+class WalkPool:
+    """工作窃取式的目录遍历线程池
+
+    每个线程有自己的双端队列：子目录压入自己队列的尾部并从尾部取（深度优先，
+    局部性好）；空闲线程从其他线程队列的头部窃取（更靠近根、子树通常更大）。
+    因此单个巨大的根目录也能被所有线程分担，而小目录只占用一个任务。
+    CPython 中 deque 的 append/pop/popleft 是原子的，队列本身无需加锁。
+    """
+
+    def __init__(self, workers):
+        self.workers = max(1, workers)
+        self.queues = [deque() for _ in range(self.workers)]
+        self.cond = threading.Condition()
+        self.idle = 0
+        self.closed = False
+        self.pending = {}
+        self.threads = [threading.Thread(target=self._worker, args=(i,), daemon=True)
+                        for i in range(self.workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, walk):
+        """提交一次遍历，返回 concurrent.futures.Future，结果为 walk.finish() 的返回值"""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self.cond:
+            self.pending[walk] = [1, future]
+            min(self.queues, key=len).append((walk, walk.root_item()))
+            self.cond.notify()
+        return future
+
+    def shutdown(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        for thread in self.threads:
+            thread.join()
+
+    def _steal(self, worker):
+        count = self.workers
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim == worker:
+                continue
+            queue = self.queues[victim]
+            try:
+                task = queue.popleft()
+            except IndexError:
+                continue
+            if task[0].accepts(worker):
+                return task
+            queue.appendleft(task)
+        return None
+
+    def _task_done(self, walk, added):
+        with self.cond:
+            state = self.pending[walk]
+            state[0] += added - 1
+            if state[0]:
+                return None
+            del self.pending[walk]
+        return state[1]
+
+    def _worker(self, worker):
+        own = self.queues[worker]
+        while True:
+            try:
+                task = own.pop()
+            except IndexError:
+                task = self._steal(worker)
+            if task is None:
+                with self.cond:
+                    if self.closed:
+                        return
+                    self.idle += 1
+                    self.cond.wait(0.05)
+                    self.idle -= 1
+                continue
+            walk, item = task
+            children = []
+            try:
+                if walk.should_stop():
+                    if walk.progress is not None:
+                        walk.progress.add(done=1)
+                else:
+                    walk.process(item, walk.local_for(worker), children.append)
+            except Exception:
+                walk.stopped = True
+            own.extend((walk, child) for child in children)
+            if len(children) > 1 and self.idle:
+                with self.cond:
+                    self.cond.notify(len(children) - 1)
+            future = self._task_done(walk, len(children))
+            if future is not None:
+                try:
+                    future.set_result(walk.finish())
+                except Exception as e:
+                    future.set_exception(e)
+
+
+def scan_tree(root, claims, index=None, progress=None, control=None, pool=None, rules=None):
+    """遍历 root 一次，返回 {类别: FolderStats}；参数含义见 TreeWalk
+
+    传入 pool（WalkPool）时由线程池协作遍历，否则在当前线程中完成。
+    """
+    walk = TreeWalk(root, claims, index, progress, control, rules=rules)
+    if pool is None:
+        return walk.run()
+    return pool.submit(walk).result()
+
+
+def scan_folder(folder):
+    """使用 os.scandir 迭代遍历目录
+
+    直接复用 DirEntry 自带的类型和 stat 信息（Windows 上无需额外系统调用），
+    用显式栈代替递归，避免深层目录导致的递归过深。
+    """
+    folder = os.fspath(folder)
+    return scan_tree(folder, {os.path.normcase(folder): ('',)}).get('', FolderStats())
+
+
+def get_folder_size(folder):
+    return scan_folder(folder).size
@@ -0,0 +1,337 @@
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+
+from .walker import FolderStats, TreeWalk, _WalkLocal
+
+
+class WatchBackend:
+    """文件系统变化通知后端的接口
+
+    add_watch(path) 开始监视单个目录（非递归），失败时返回 False；
+    read_events(timeout) 最多等待 timeout 秒，返回 [(类型, 目录), ...]：
+    'changed' 表示该目录的直接条目有增删改，'overflow' 表示事件丢失，
+    目录为 None 时表示无法确定受影响的范围。
+    """
+
+    def add_watch(self, path):
+        raise NotImplementedError
+
+    def remove_watch(self, path):
+        raise NotImplementedError
+
+    def read_events(self, timeout):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class InotifyBackend(WatchBackend):
+    """Linux inotify 后端，通过 ctypes 调用 libc，不依赖第三方库"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_DONT_FOLLOW = 0x02000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+                  | IN_ONLYDIR | IN_DONT_FOLLOW)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self.lock = threading.Lock()
+        self.paths = {}
+        self.wds = {}
+
+    def add_watch(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            # 常见原因是 ENOSPC（超过 fs.inotify.max_user_watches）或目录已被删除
+            return False
+        with self.lock:
+            self.paths[wd] = path
+            self.wds[path] = wd
+        return True
+
+    def remove_watch(self, path):
+        with self.lock:
+            wd = self.wds.pop(path, None)
+            if wd is None:
+                return
+            self.paths.pop(wd, None)
+        # 目录已删除时内核已自动移除监视，返回的错误可以忽略
+        self.libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout):
+        try:
+            readable, _, _ = select.select([self.fd], [], [], timeout)
+        except (OSError, ValueError):
+            return []
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        except OSError as e:
+            if e.errno == errno.EINTR:
+                return []
+            raise
+        events = []
+        offset = 0
+        header = self.EVENT_HEADER
+        while offset + header.size <= len(data):
+            wd, mask, _, length = header.unpack_from(data, offset)
+            offset += header.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                events.append(('overflow', None))
+                continue
+            with self.lock:
+                if mask & self.IN_IGNORED:
+                    path = self.paths.pop(wd, None)
+                    if path is not None and self.wds.get(path) == wd:
+                        del self.wds[path]
+                    continue
+                path = self.paths.get(wd)
+            if path is not None:
+                events.append(('changed', path))
+        return events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def default_backend():
+    """返回当前平台可用的监视后端，不支持时返回 None"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return InotifyBackend()
+    except (OSError, AttributeError):
+        return None
+
+
+class _WatchedDir:
+    """一个被监视目录的直接条目统计"""
+
+    __slots__ = ('walk', 'owners', 'stats', 'children', 'key')
+
+    def __init__(self, walk, owners, stats, children, key):
+        self.walk = walk
+        self.owners = owners
+        self.stats = stats
+        self.children = children
+        # (st_dev, st_ino)，重新列目录前从遍历的去重集合中移除，避免把已知子目录当成循环
+        self.key = key
+
+
+class FolderWatcher:
+    """扫描完成后监视 ScanPlan 中的各个根目录，增量维护各类别的大小
+
+    每个目录只记录其直接条目按类别聚合的结果，不记录单个文件。
+    收到目录变化事件后只重新列出该目录本身，与旧记录相减得到增量；
+    新出现的子目录整棵加入监视，消失的子目录连同其子树一起扣除。
+    事件溢出时重新遍历受影响的子树（无法确定范围时为所有根目录）。
+    报告的是相对 subscribe() 时的增量，由调用方叠加到扫描结果上，
+    扫描得到的硬链接去重、估算标记等因此保持不变；增量本身不做硬链接去重。
+    """
+
+    def __init__(self, plan, backend=None):
+        self.plan = plan
+        self.backend = backend if backend is not None else default_backend()
+        self.dirs = {}
+        self.totals = plan.empty_results()
+        # subscribe() 结束时的 totals，增量相对它计算
+        self.baseline = {}
+        self.unwatched = 0
+        self.stopped = threading.Event()
+
+    @property
+    def available(self):
+        return self.backend is not None
+
+    def stop(self):
+        self.stopped.set()
+
+    def close(self):
+        self.stop()
+        if self.backend is not None:
+            self.backend.close()
+
+    def subscribe(self, index=None, control=None):
+        """为所有根目录添加监视并记录各目录的直接条目，此后 poll() 报告相对此时的增量
+
+        传入 index（ScanIndex）时，mtime 与索引记录一致的目录直接使用刚扫描写入的记录，
+        只 stat 不列内容，启动监视时不必重新遍历。control（ScanControl）的预算耗尽或被取消后
+        不再添加监视，未监视部分的变化不会计入。
+        """
+        deadline = control.deadline() if control is not None else None
+        for root in self.plan.roots:
+            walk = TreeWalk(root, self.plan.claims, index=index, rules=self.plan.rules,
+                            link_aware=False, top_n=0)
+            path, owners, _, _ = walk.root_item()
+            self.add_tree(walk, path, owners, control, deadline)
+            # 之后的变化必须真正列出目录：就地改写文件不会改变目录 mtime
+            walk.index = None
+            walk.cached = {}
+        self.baseline = self.snapshot()
+
+    def snapshot(self, names=None):
+        names = self.totals if names is None else names
+        return {name: FolderStats().merge(self.totals[name]) for name in names
+                if name in self.totals}
+
+    def changes(self, names):
+        """返回 {类别: FolderStats}，各项为相对 subscribe() 时的增量，可能为负"""
+        changes = {}
+        for name in names:
+            total = self.totals.get(name)
+            if total is None:
+                continue
+            base = self.baseline.get(name) or FolderStats()
+            changes[name] = FolderStats(size=total.size - base.size,
+                                        files=total.files - base.files,
+                                        dirs=total.dirs - base.dirs,
+                                        allocated=total.allocated - base.allocated,
+                                        reclaimable=total.reclaimable - base.reclaimable)
+        return changes
+
+    def poll(self, timeout=0.5):
+        """处理一批事件，返回大小发生变化的类别的增量，见 changes()"""
+        events = self.backend.read_events(timeout)
+        changed = set()
+        overflow = set()
+        for kind, path in events:
+            if kind == 'overflow':
+                overflow.add(path)
+            else:
+                changed.add(path)
+        touched = set()
+        if overflow:
+            targets = self.plan.roots if None in overflow else overflow
+            for path in targets:
+                touched.update(self.rescan_tree(path))
+            changed = {path for path in changed if path in self.dirs}
+        for path in changed:
+            touched.update(self.refresh_dir(path))
+        return self.changes(touched)
+
+    def run(self, callback, timeout=0.5):
+        """在当前线程中持续处理事件，直到 stop()"""
+        while not self.stopped.is_set():
+            updates = self.poll(timeout)
+            if updates:
+                callback(updates)
+
+    def list_dir(self, walk, path, owners):
+        local = _WalkLocal()
+        children = []
+        walk.visit((path, owners, None, None), None, local, children.append)
+        return local.results, {child[0]: child[1] for child in children}
+
+    def apply(self, stats, sign):
+        for name, st in stats.items():
+            total = self.totals.setdefault(name, FolderStats())
+            total.size += sign * st.size
+            total.allocated += sign * st.allocated
+            total.reclaimable += sign * st.reclaimable
+            total.files += sign * st.files
+            total.dirs += sign * st.dirs
+
+    def add_tree(self, walk, path, owners, control=None, deadline=None):
+        """遍历并监视一棵子树，返回受影响的类别"""
+        touched = set()
+        stack = [(path, owners)]
+        while stack and not self.stopped.is_set():
+            if control is not None and control.exhausted(deadline, 0):
+                self.unwatched += len(stack)
+                break
+            current, current_owners = stack.pop()
+            if not self.backend.add_watch(current):
+                self.unwatched += 1
+            stats, children = self.list_dir(walk, current, current_owners)
+            try:
+                st = os.stat(current, follow_symlinks=False)
+                key = (st.st_dev, st.st_ino)
+            except OSError:
+                key = None
+            self.dirs[current] = _WatchedDir(walk, current_owners, stats, set(children), key)
+            self.apply(stats, 1)
+            touched.update(stats)
+            stack.extend(children.items())
+        return touched
+
+    def remove_tree(self, path):
+        touched = set()
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            watched = self.dirs.pop(current, None)
+            if watched is None:
+                continue
+            self.backend.remove_watch(current)
+            self.forget(watched)
+            self.apply(watched.stats, -1)
+            touched.update(watched.stats)
+            stack.extend(watched.children)
+        return touched
+
+    def forget(self, watched):
+        walk = watched.walk
+        if walk.visited is not None and watched.key is not None:
+            with walk.visit_lock:
+                walk.visited.discard(watched.key)
+
+    def refresh_dir(self, path):
+        """重新列出单个目录，应用直接条目的增量并同步子目录"""
+        watched = self.dirs.get(path)
+        if watched is None:
+            return set()
+        for child in watched.children:
+            if child in self.dirs:
+                self.forget(self.dirs[child])
+        stats, children = self.list_dir(watched.walk, path, watched.owners)
+        self.apply(watched.stats, -1)
+        self.apply(stats, 1)
+        touched = set(watched.stats) | set(stats)
+        for child in watched.children - set(children):
+            touched.update(self.remove_tree(child))
+        for child, owners in children.items():
+            # 只加入新出现的子目录；subscribe 时因预算未加入的已有子目录不能当作新增
+            if child not in watched.children and child not in self.dirs:
+                touched.update(self.add_tree(watched.walk, child, owners))
+        watched.stats = stats
+        watched.children = set(children)
+        return touched
+
+    def rescan_tree(self, path):
+        """事件丢失后重新遍历 path 整棵子树"""
+        watched = self.dirs.get(path)
+        if watched is None:
+            return set()
+        walk, owners = watched.walk, watched.owners
+        touched = self.remove_tree(path)
+        touched.update(self.add_tree(walk, path, owners))
+        return touched